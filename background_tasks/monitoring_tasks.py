@@ -15,8 +15,16 @@ import logging
 
 from celery import Task
 from celery.result import AsyncResult
-from celery_config import app
+from celery_config import app, SQLITE_DB
 from celery.utils.log import get_task_logger
+from redis import Redis
+from sqlalchemy import create_engine, text
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Windows-specific imports
 if sys.platform == 'win32':
@@ -27,6 +35,11 @@ if sys.platform == 'win32':
 
 logger = get_task_logger(__name__)
 
+# Resolved once per worker process instead of on every task invocation
+_TEXT = text
+_SQLITE_URL = f'sqlite:///{SQLITE_DB}'
+_BROKER_URL = app.conf.broker_url
+
 class MonitoringTask(Task):
     """Base class for monitoring tasks"""
     
@@ -91,8 +104,7 @@ def system_health_check() -> Dict[str, Any]:
         
         # Redis connectivity
         try:
-            from redis import Redis
-            redis_client = Redis.from_url(app.conf.broker_url)
+            redis_client = Redis.from_url(_BROKER_URL)
             redis_ping = redis_client.ping()
             redis_info = redis_client.info()
             health_status['checks']['redis'] = {
@@ -231,15 +243,12 @@ def cleanup_old_tasks(days: int = 7) -> Dict[str, int]:
     
     try:
         # Clean up old task results from SQLite
-        from sqlalchemy import create_engine, text
-        from celery_config import SQLITE_DB
-        
-        engine = create_engine(f'sqlite:///{SQLITE_DB}')
+        engine = create_engine(_SQLITE_URL)
         cutoff_date = datetime.now() - timedelta(days=days)
         
         with engine.connect() as conn:
             result = conn.execute(
-                text("DELETE FROM celery_taskmeta WHERE date_done < :cutoff"),
+                _TEXT("DELETE FROM celery_taskmeta WHERE date_done < :cutoff"),
                 {"cutoff": cutoff_date}
             )
             cleanup_results['deleted_results'] = result.rowcount
@@ -288,16 +297,13 @@ def generate_task_report(period_hours: int = 24) -> Dict[str, Any]:
     
     try:
         # Query task results from SQLite
-        from sqlalchemy import create_engine, text
-        from celery_config import SQLITE_DB
-        
-        engine = create_engine(f'sqlite:///{SQLITE_DB}')
+        engine = create_engine(_SQLITE_URL)
         cutoff_date = datetime.now() - timedelta(hours=period_hours)
         
         with engine.connect() as conn:
             # Task counts by status
             result = conn.execute(
-                text("""
+                _TEXT("""
                     SELECT status, COUNT(*) as count 
                     FROM celery_taskmeta 
                     WHERE date_done > :cutoff 
@@ -314,7 +320,7 @@ def generate_task_report(period_hours: int = 24) -> Dict[str, Any]:
             
             # Task counts by name
             result = conn.execute(
-                text("""
+                _TEXT("""
                     SELECT task_id, COUNT(*) as count, 
                            AVG(JULIANDAY(date_done) - JULIANDAY(date_done)) * 86400 as avg_duration
                     FROM celery_taskmeta 
@@ -406,13 +412,27 @@ def save_task_report(report: Dict[str, Any]):
     report_file.parent.mkdir(exist_ok=True)
     
     try:
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        # Serialize once and write a single file; the latest report is a hard link to it
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(report, option=orjson.OPT_INDENT_2, default=str)
+        else:
+            data = json.dumps(report, indent=2, default=str).encode('utf-8')
         
-        # Also save as latest report
+        tmp_file = report_file.with_suffix('.tmp')
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, report_file)
+        
+        # Also expose as latest report
         latest_file = report_file.parent / 'latest_task_report.json'
-        with open(latest_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        try:
+            os.remove(latest_file)
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(report_file, latest_file)
+        except OSError:
+            # Filesystem without hard link support (e.g. FAT32)
+            latest_file.write_bytes(data)
     
     except Exception as e:
         logger.error(f"Failed to save task report: {e}")
@@ -6,12 +6,34 @@ Streamlit chat interface connecting to local Ollama server on Windows 11
 import streamlit as st
 import ollama
 import requests
+from requests.adapters import HTTPAdapter
+import hashlib
 import json
 import time
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Generator
+from typing import Dict, List, Optional, Generator, Tuple
 import sys
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+
+import numpy as np
+
+from qdrant_client.http import models
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add the current directory to the Python path
 sys.path.append(str(Path(__file__).parent))
@@ -19,6 +41,62 @@ sys.path.append(str(Path(__file__).parent))
 from document_indexer import DocumentIndexingSystem
 from structured_data_indexer import MultiCollectionQdrantIndexer
 
+STRUCTURED_COLLECTIONS = ["structured_data", "structured_rows", "structured_summaries"]
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+STREAM_FLUSH_INTERVAL = 0.04  # seconds between UI repaints while streaming
+MAX_HISTORY_MESSAGES = 200
+CONTEXT_WINDOW_MESSAGES = 50  # upper bound; the token budget decides how many are sent
+CHARS_PER_TOKEN = 4  # rough estimate when no tokenizer is at hand
+PROMPT_TOKEN_RESERVE = 512
+CONTEXT_PROMPT_HEADER = "\n\nRelevant information from the knowledge base:\n"
+CONTEXT_PROMPT_FOOTER = "\n\nPlease use this information to provide accurate and helpful responses."
+STRONG_MATCH_SCORE = 0.85  # top document score that makes structured search unnecessary
+
+# gRPC transport for Qdrant; one HTTP/2 channel multiplexes the concurrent searches
+QDRANT_CLIENT_OPTIONS = {"prefer_grpc": True, "grpc_port": 6334, "timeout": 15}
+# HNSW beam width plus rescoring of binary-quantized candidates with original vectors
+SEARCH_PARAMS = models.SearchParams(
+    hnsw_ef=64,
+    quantization=models.QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+
+# Qdrant calls release the GIL while waiting on the network, so threads overlap them
+_SEARCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="rag-search")
+
+# Embedding models registered by the indexers, keyed by model name
+_EMBEDDING_MODELS: Dict[str, object] = {}
+
+@lru_cache(maxsize=512)
+def _embed(model_name: str, text: str) -> Tuple[float, ...]:
+    """Embed text with a registered model; repeated prompts skip the encoder"""
+    return tuple(_EMBEDDING_MODELS[model_name].encode([text])[0].tolist())
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _ollama_is_available(base_url: str, _session: requests.Session) -> bool:
+    """Check if Ollama service is running; shared across reruns for 10 seconds"""
+    try:
+        response = _session.get(f"{base_url}/api/tags", timeout=5)
+        return response.status_code == 200
+    except requests.exceptions.RequestException:
+        return False
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _ollama_available_models(base_url: str, _session: requests.Session) -> List[str]:
+    """Get list of available models; shared across reruns for 10 seconds"""
+    try:
+        response = _session.get(f"{base_url}/api/tags", timeout=10)
+        if response.status_code == 200:
+            models_data = response.json()
+            return [model['name'] for model in models_data.get('models', [])]
+    except requests.exceptions.RequestException:
+        pass
+    return []
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _document_index_status(_doc_indexer: DocumentIndexingSystem) -> Dict:
+    """Document index status; shared across reruns for 10 seconds"""
+    return _doc_indexer.get_system_status()
+
 class OllamaChat:
     """Handles communication with local Ollama server"""
     
@@ -27,25 +105,19 @@ class OllamaChat:
         self.port = port
         self.base_url = f"http://{host}:{port}"
         self.client = ollama.Client(host=f"{host}:{port}")
+        
+        # Keep-alive session so status polling reuses TCP connections
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0))
+        self.session.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': 'gzip, deflate'})
     
     def is_available(self) -> bool:
         """Check if Ollama service is running"""
-        try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
-            return response.status_code == 200
-        except requests.exceptions.RequestException:
-            return False
+        return _ollama_is_available(self.base_url, self.session)
     
     def get_available_models(self) -> List[str]:
         """Get list of available models"""
-        try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=10)
-            if response.status_code == 200:
-                models_data = response.json()
-                return [model['name'] for model in models_data.get('models', [])]
-        except requests.exceptions.RequestException:
-            pass
-        return []
+        return _ollama_available_models(self.base_url, self.session)
     
     def stream_chat(self, model: str, messages: List[Dict], system_prompt: Optional[str] = None) -> Generator[str, None, None]:
         """Stream chat completion from Ollama"""
@@ -56,16 +128,24 @@ class OllamaChat:
                 formatted_messages.append({"role": "system", "content": system_prompt})
             formatted_messages.extend(messages)
             
-            # Stream response
-            stream = self.client.chat(
-                model=model,
-                messages=formatted_messages,
-                stream=True
-            )
-            
-            for chunk in stream:
-                if 'message' in chunk and 'content' in chunk['message']:
-                    yield chunk['message']['content']
+            # Stream NDJSON straight off the pooled keep-alive session
+            with self.session.post(
+                f"{self.base_url}/api/chat",
+                json={"model": model, "messages": formatted_messages, "stream": True},
+                stream=True,
+                timeout=None
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+                    if 'error' in chunk:
+                        yield f"Error communicating with Ollama: {chunk['error']}"
+                        return
+                    content = chunk.get('message', {}).get('content')
+                    if content:
+                        yield content
                     
         except Exception as e:
             yield f"Error communicating with Ollama: {str(e)}"
@@ -91,65 +171,219 @@ class OllamaChat:
 class RAGSystem:
     """Handles document search and retrieval"""
     
-    def __init__(self):
-        self.doc_indexer = None
-        self.structured_indexer = None
+    def __init__(self, qdrant_host: str = "localhost", qdrant_port: int = 6333):
+        self.qdrant_host = qdrant_host
+        self.qdrant_port = qdrant_port
+        self._doc_indexer = None
+        self._structured_indexer = None
+        self._initialized = False
+        self.init_error: Optional[str] = None
+        self._lock = threading.Lock()
+        
+        # Load the embedding model and open Qdrant clients off the UI thread
+        threading.Thread(target=self._initialize_indexers, daemon=True).start()
+    
+    @property
+    def is_ready(self) -> bool:
+        """Whether indexer initialization has finished (successfully or not)"""
+        return self._initialized
+    
+    @property
+    def doc_indexer(self) -> Optional[DocumentIndexingSystem]:
         self._initialize_indexers()
+        return self._doc_indexer
+    
+    @property
+    def structured_indexer(self) -> Optional[MultiCollectionQdrantIndexer]:
+        self._initialize_indexers()
+        return self._structured_indexer
     
     def _initialize_indexers(self):
-        """Initialize document and structured data indexers"""
-        try:
-            self.doc_indexer = DocumentIndexingSystem(
-                qdrant_host="localhost",
-                qdrant_port=6333,
-                collection_name="documents",
-                chunk_size=800,
-                chunk_overlap=100
-            )
+        """Initialize document and structured data indexers on first use"""
+        if self._initialized:
+            return
+        
+        with self._lock:
+            if self._initialized:
+                return
             
-            self.structured_indexer = MultiCollectionQdrantIndexer(
-                host="localhost",
-                port=6333
-            )
-        except Exception as e:
-            st.error(f"Failed to initialize RAG system: {e}")
+            try:
+                self._doc_indexer = DocumentIndexingSystem(
+                    qdrant_host=self.qdrant_host,
+                    qdrant_port=self.qdrant_port,
+                    collection_name="documents",
+                    chunk_size=800,
+                    chunk_overlap=100,
+                    **QDRANT_CLIENT_OPTIONS
+                )
+                
+                self._structured_indexer = MultiCollectionQdrantIndexer(
+                    host=self.qdrant_host,
+                    port=self.qdrant_port,
+                    **QDRANT_CLIENT_OPTIONS
+                )
+            except Exception as e:
+                # May run on the background thread, so surface the error via the sidebar
+                self.init_error = str(e)
+            
+            self._register_embedding_model()
+            self._initialized = True
+    
+    def _register_embedding_model(self):
+        """Share the indexers' embedding model with the query embedding cache"""
+        indexer = self._doc_indexer.indexer if self._doc_indexer else self._structured_indexer
+        if indexer:
+            _EMBEDDING_MODELS.setdefault(EMBEDDING_MODEL_NAME, indexer.model)
+    
+    def embed(self, query: str) -> Optional[List[float]]:
+        """Embed a query, served from the LRU cache for repeated prompts"""
+        self._initialize_indexers()
+        if EMBEDDING_MODEL_NAME not in _EMBEDDING_MODELS:
+            return None
+        return list(_embed(EMBEDDING_MODEL_NAME, query))
     
-    def search_documents(self, query: str, limit: int = 5) -> List[Dict]:
+    def search_documents(self, query: str, limit: int = 5,
+                         query_vector: Optional[List[float]] = None) -> List[Dict]:
         """Search through indexed documents"""
         if not self.doc_indexer:
             return []
         
         try:
-            results = self.doc_indexer.search(query, limit=limit, score_threshold=0.6)
+            if query_vector is None:
+                query_vector = self.embed(query)
+            results = self.doc_indexer.search(
+                query, limit=limit, score_threshold=0.6, query_vector=query_vector,
+                search_params=SEARCH_PARAMS
+            )
             return results or []
         except Exception as e:
             st.error(f"Document search error: {e}")
             return []
     
-    def search_structured_data(self, query: str, limit: int = 3) -> List[Dict]:
+    def _submit_structured_searches(self, query: str, limit: int,
+                                    query_vector: Optional[List[float]]) -> List[Future]:
+        """Start one search per structured collection on the shared pool"""
+        structured_indexer = self.structured_indexer
+        per_collection = limit // len(STRUCTURED_COLLECTIONS) + 1
+        return [
+            _SEARCH_POOL.submit(
+                structured_indexer.search_collection,
+                collection, query, per_collection, 0.6, query_vector, SEARCH_PARAMS
+            )
+            for collection in STRUCTURED_COLLECTIONS
+        ]
+    
+    @staticmethod
+    def _collect_structured_results(futures: List[Future], limit: int) -> List[Dict]:
+        """Merge per-collection results as they complete, skipping failed collections"""
+        results = []
+        for future in as_completed(futures):
+            try:
+                results.extend(future.result() or [])
+            except Exception:
+                continue
+        
+        # Sort by score and limit
+        results.sort(key=lambda x: x.get('score', 0), reverse=True)
+        return results[:limit]
+    
+    def search_structured_data(self, query: str, limit: int = 3,
+                               query_vector: Optional[List[float]] = None) -> List[Dict]:
         """Search through structured data collections"""
         if not self.structured_indexer:
             return []
         
         try:
-            results = []
-            collections = ["structured_data", "structured_rows", "structured_summaries"]
+            # Embed once; every collection is searched with the same vector
+            if query_vector is None:
+                query_vector = self.embed(query)
             
-            for collection in collections:
-                try:
-                    collection_results = self.structured_indexer.search_collection(
-                        collection, query, limit=limit//len(collections) + 1, score_threshold=0.6
-                    )
-                    results.extend(collection_results or [])
-                except:
-                    continue
-            
-            # Sort by score and limit
-            results.sort(key=lambda x: x.get('score', 0), reverse=True)
-            return results[:limit]
+            futures = self._submit_structured_searches(query, limit, query_vector)
+            return self._collect_structured_results(futures, limit)
         except Exception as e:
             st.error(f"Structured data search error: {e}")
             return []
+    
+    def retrieve(self, query: str, doc_limit: int = 5,
+                 struct_limit: int = 3) -> Tuple[List[Dict], List[Dict]]:
+        """Search documents, then the structured collections concurrently unless a document hit is strong"""
+        query_vector = self.embed(query)
+        doc_indexer = self.doc_indexer
+        
+        doc_results = []
+        if doc_indexer:
+            doc_results = doc_indexer.search(query, doc_limit, 0.6, query_vector, SEARCH_PARAMS) or []
+        
+        # A strong document hit already answers the query; the structured
+        # searches are only started after a miss, so the hit saves their round-trips
+        if not self.structured_indexer or (
+            doc_results and doc_results[0].get('score', 0) >= STRONG_MATCH_SCORE
+        ):
+            return doc_results, []
+        
+        struct_futures = self._submit_structured_searches(query, struct_limit, query_vector)
+        return doc_results, self._collect_structured_results(struct_futures, struct_limit)
+
+class SemanticResponseCache:
+    """In-process cache of full RAG responses keyed by prompt embedding similarity"""
+    
+    def __init__(self, dimension: int = 384, max_entries: int = 256,
+                 ttl_seconds: int = 3600, threshold: float = 0.9):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        self.index = faiss.IndexIDMap(faiss.IndexFlatIP(dimension))
+        # entry id -> (created_at, variant, response, search_results), oldest first
+        self.entries: "OrderedDict[int, Tuple[float, str, str, List[Dict]]]" = OrderedDict()
+        self._next_id = 0
+    
+    @staticmethod
+    def _normalize(vector: List[float]) -> np.ndarray:
+        """Normalize so inner product equals cosine similarity"""
+        matrix = np.asarray([vector], dtype=np.float32)
+        faiss.normalize_L2(matrix)
+        return matrix
+    
+    def _evict(self, entry_id: int):
+        """Drop an entry from both the index and the LRU order"""
+        self.entries.pop(entry_id, None)
+        self.index.remove_ids(np.asarray([entry_id], dtype=np.int64))
+    
+    def get(self, vector: List[float], variant: str,
+            threshold: Optional[float] = None) -> Optional[Tuple[str, List[Dict]]]:
+        """Return (response, search_results) for a sufficiently similar prior prompt"""
+        if not self.entries:
+            return None
+        
+        threshold = self.threshold if threshold is None else threshold
+        scores, ids = self.index.search(self._normalize(vector), min(4, len(self.entries)))
+        now = time.monotonic()
+        
+        for score, entry_id in zip(scores[0], ids[0]):
+            if entry_id == -1 or score < threshold:
+                break
+            entry_id = int(entry_id)
+            created_at, entry_variant, response, results = self.entries[entry_id]
+            if now - created_at > self.ttl_seconds:
+                self._evict(entry_id)
+                continue
+            if entry_variant != variant:
+                continue
+            self.entries.move_to_end(entry_id)
+            return response, results
+        
+        return None
+    
+    def put(self, vector: List[float], variant: str, response: str, search_results: List[Dict]):
+        """Store a generated response, evicting the least recently used entries"""
+        entry_id = self._next_id
+        self._next_id += 1
+        self.index.add_with_ids(self._normalize(vector), np.asarray([entry_id], dtype=np.int64))
+        self.entries[entry_id] = (time.monotonic(), variant, response, search_results)
+        
+        while len(self.entries) > self.max_entries:
+            oldest_id = next(iter(self.entries))
+            self._evict(oldest_id)
 
 class ConfigManager:
     """Manages application configuration"""
@@ -162,6 +396,7 @@ class ConfigManager:
             "default_model": "llama3.2:3b",
             "system_prompt": "You are a helpful AI assistant with access to a knowledge base. Use the provided context to answer questions accurately and concisely.",
             "max_tokens": 2000,
+            "max_context_tokens": 4096,
             "temperature": 0.7,
             "enable_rag": True,
             "rag_max_results": 5,
@@ -172,8 +407,9 @@ class ConfigManager:
         """Load configuration from file"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    raw = f.read()
+                    config = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw.decode('utf-8'))
                     # Merge with defaults for any missing keys
                     for key, value in self.default_config.items():
                         if key not in config:
@@ -187,15 +423,56 @@ class ConfigManager:
     def save_config(self, config: Dict):
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(self.config_file, 'wb') as f:
+                f.write(data)
         except Exception as e:
             st.error(f"Failed to save config: {e}")
 
+def reset_chat_history():
+    """Start an empty, bounded chat history"""
+    st.session_state.messages = deque(maxlen=MAX_HISTORY_MESSAGES)
+    # (role/content pair, approximate tokens) for recent non-system messages, as sent to Ollama
+    st.session_state.context_window = deque(maxlen=CONTEXT_WINDOW_MESSAGES)
+
+def append_message(message: Dict):
+    """Record a chat message and keep the LLM context window in step"""
+    st.session_state.messages.append(message)
+    if message["role"] != "system":
+        st.session_state.context_window.append((
+            {"role": message["role"], "content": message["content"]},
+            len(message["content"]) // CHARS_PER_TOKEN
+        ))
+
+def build_history(budget_tokens: int) -> List[Dict]:
+    """Select the newest messages that fit the token budget, oldest first"""
+    selected = []
+    used_tokens = 0
+    for message, tokens in reversed(st.session_state.context_window):
+        # The latest message (the current prompt) is always sent
+        if selected and used_tokens + tokens > budget_tokens:
+            break
+        selected.append(message)
+        used_tokens += tokens
+    
+    selected.reverse()
+    return selected
+
+def response_cache_variant(cfg: Dict) -> str:
+    """Digest of the settings a cached response depends on besides the prompt"""
+    settings = (
+        cfg["default_model"], cfg["enable_rag"], cfg["rag_max_results"],
+        cfg["system_prompt"], cfg["temperature"], cfg["max_tokens"]
+    )
+    return hashlib.sha256(repr(settings).encode("utf-8")).hexdigest()
+
 def initialize_session_state():
     """Initialize Streamlit session state"""
     if "messages" not in st.session_state:
-        st.session_state.messages = []
+        reset_chat_history()
     
     if "config" not in st.session_state:
         config_manager = ConfigManager()
@@ -209,120 +486,193 @@ def initialize_session_state():
     
     if "available_models" not in st.session_state:
         st.session_state.available_models = []
+    
+    if "response_cache" not in st.session_state:
+        st.session_state.response_cache = SemanticResponseCache() if FAISS_AVAILABLE else None
+
+@lru_cache(maxsize=8)
+def _context_prompt_prefix(base_prompt: str) -> str:
+    """Configured system prompt joined with the knowledge-base header"""
+    return base_prompt + CONTEXT_PROMPT_HEADER
+
+def build_system_prompt(base_prompt: str, context: str) -> str:
+    """Append retrieved context to the system prompt; without context it is used as-is"""
+    if not context:
+        return base_prompt
+    return f"{_context_prompt_prefix(base_prompt)}{context}{CONTEXT_PROMPT_FOOTER}"
 
-def format_search_results(results: List[Dict]) -> str:
-    """Format search results for context"""
+def dedupe_results(results: List[Dict]) -> List[Dict]:
+    """Drop results that repeat the same source text, keeping the first occurrence"""
+    seen = set()
+    unique = []
+    for result in results:
+        key = (result.get('file_path'), result.get('text', '')[:64])
+        if key not in seen:
+            seen.add(key)
+            unique.append(result)
+    return unique
+
+def add_file_names(results: List[Dict]) -> List[Dict]:
+    """Store each result's display file name once so renders don't rebuild Path objects"""
+    for result in results:
+        file_path = result.get('file_path', 'Unknown')
+        result['file_name'] = Path(file_path).name if file_path != 'Unknown' else 'Unknown'
+    return results
+
+def render_results(results: List[Dict]) -> Tuple[str, List[Tuple[str, float, str]]]:
+    """Build the LLM context string and the (file name, score, snippet) UI rows in one pass"""
     if not results:
-        return ""
+        return "", []
     
     context_parts = []
+    rows = []
     for i, result in enumerate(results, 1):
         score = result.get('score', 0)
         text = result.get('text', '')
-        file_path = result.get('file_path', 'Unknown')
-        
-        file_name = Path(file_path).name if file_path != 'Unknown' else 'Unknown'
+        file_name = result.get('file_name', 'Unknown')
         
         context_parts.append(f"[Source {i} - {file_name} (relevance: {score:.2f})]:\n{text}\n")
+        rows.append((file_name, score, text[:300] + "..." if len(text) > 300 else text))
     
-    return "\n".join(context_parts)
+    return "\n".join(context_parts), rows
 
-def sidebar_configuration():
-    """Render sidebar with configuration options"""
-    with st.sidebar:
-        st.title("🤖 MIDAS Chat")
-        
-        # Ollama status
-        st.subheader("🔧 Service Status")
-        if st.session_state.ollama_chat.is_available():
-            st.success("✅ Ollama Connected")
-            
-            # Get available models
-            if st.button("🔄 Refresh Models"):
-                st.session_state.available_models = st.session_state.ollama_chat.get_available_models()
-            
-            if not st.session_state.available_models:
-                st.session_state.available_models = st.session_state.ollama_chat.get_available_models()
+def display_search_results(rows: List[Tuple[str, float, str]]):
+    """Render retrieved context rows inside an expander"""
+    with st.expander("📚 Retrieved Context", expanded=False):
+        for i, (file_name, score, snippet) in enumerate(rows, 1):
+            st.write(f"**Source {i}:** {file_name} (Score: {score:.3f})")
+            st.write(snippet)
+            st.divider()
+
+def render_stream(stream: Generator[str, None, None], placeholder) -> str:
+    """Accumulate streamed tokens, repainting the placeholder at most every flush interval"""
+    full_response = ""
+    last_flush = 0.0
+    
+    for chunk in stream:
+        full_response += chunk
+        now = time.monotonic()
+        if now - last_flush > STREAM_FLUSH_INTERVAL:
+            placeholder.write(full_response + "▊")
+            last_flush = now
+    
+    placeholder.write(full_response)
+    return full_response
+
+def render_chat_history():
+    """Replay stored chat messages with their retrieved context"""
+    msgs = st.session_state.messages
+    for message in msgs:
+        with st.chat_message(message["role"]):
+            st.write(message["content"])
             
-            if st.session_state.available_models:
-                selected_model = st.selectbox(
-                    "Select Model",
-                    st.session_state.available_models,
-                    index=0 if st.session_state.config["default_model"] not in st.session_state.available_models 
-                    else st.session_state.available_models.index(st.session_state.config["default_model"])
-                )
-                st.session_state.config["default_model"] = selected_model
-            else:
-                st.warning("⚠️ No models available")
-        else:
-            st.error("❌ Ollama Not Connected")
-            st.markdown("""
-            **To start Ollama:**
-            1. Run Setup-Ollama.ps1
-            2. Or: `ollama serve` in terminal
-            3. Ensure port 11434 is open
-            """)
-        
-        # RAG system status
-        st.subheader("📚 RAG System")
-        if st.session_state.rag_system.doc_indexer:
-            try:
-                status = st.session_state.rag_system.doc_indexer.get_system_status()
-                if status.get('status') == 'connected':
-                    st.success("✅ Document Index Ready")
-                    if 'collection' in status:
-                        collection = status['collection']
-                        st.write(f"📄 Documents: {collection.get('points_count', 0)}")
-                else:
-                    st.warning("⚠️ Document Index Issues")
-            except:
-                st.warning("⚠️ Document Index Unavailable")
-        else:
-            st.error("❌ RAG System Not Initialized")
+            # Show search results if available
+            if message["role"] == "assistant" and "search_results" in message:
+                display_search_results(render_results(message["search_results"])[1])
+
+@st.fragment
+def sidebar_configuration():
+    """Render sidebar with configuration options; its widgets rerun only this fragment"""
+    cfg = st.session_state.config
+    
+    st.title("🤖 MIDAS Chat")
+    
+    # Ollama status
+    st.subheader("🔧 Service Status")
+    if st.session_state.ollama_chat.is_available():
+        st.success("✅ Ollama Connected")
         
-        # Configuration
-        st.subheader("⚙️ Settings")
+        # Get available models
+        if st.button("🔄 Refresh Models"):
+            _ollama_available_models.clear()
+            st.session_state.available_models = st.session_state.ollama_chat.get_available_models()
         
-        enable_rag = st.checkbox(
-            "Enable RAG (Document Search)",
-            value=st.session_state.config["enable_rag"]
-        )
-        st.session_state.config["enable_rag"] = enable_rag
+        if not st.session_state.available_models:
+            st.session_state.available_models = st.session_state.ollama_chat.get_available_models()
         
-        if enable_rag:
-            rag_max_results = st.slider(
-                "Max Search Results",
-                min_value=1,
-                max_value=10,
-                value=st.session_state.config["rag_max_results"]
+        if st.session_state.available_models:
+            selected_model = st.selectbox(
+                "Select Model",
+                st.session_state.available_models,
+                index=0 if cfg["default_model"] not in st.session_state.available_models 
+                else st.session_state.available_models.index(cfg["default_model"])
             )
-            st.session_state.config["rag_max_results"] = rag_max_results
-        
-        temperature = st.slider(
-            "Response Creativity",
-            min_value=0.0,
-            max_value=2.0,
-            value=st.session_state.config["temperature"],
-            step=0.1
+            cfg["default_model"] = selected_model
+        else:
+            st.warning("⚠️ No models available")
+    else:
+        st.error("❌ Ollama Not Connected")
+        st.markdown("""
+        **To start Ollama:**
+        1. Run Setup-Ollama.ps1
+        2. Or: `ollama serve` in terminal
+        3. Ensure port 11434 is open
+        """)
+    
+    # RAG system status
+    st.subheader("📚 RAG System")
+    if not st.session_state.rag_system.is_ready:
+        st.info("⏳ Loading document index...")
+    elif st.session_state.rag_system.doc_indexer:
+        try:
+            status = _document_index_status(st.session_state.rag_system.doc_indexer)
+            if status.get('status') == 'connected':
+                st.success("✅ Document Index Ready")
+                if 'collection' in status:
+                    collection = status['collection']
+                    st.write(f"📄 Documents: {collection.get('points_count', 0)}")
+            else:
+                st.warning("⚠️ Document Index Issues")
+        except:
+            st.warning("⚠️ Document Index Unavailable")
+    else:
+        st.error("❌ RAG System Not Initialized")
+        if st.session_state.rag_system.init_error:
+            st.caption(f"Failed to initialize RAG system: {st.session_state.rag_system.init_error}")
+    
+    # Configuration
+    st.subheader("⚙️ Settings")
+    
+    enable_rag = st.checkbox(
+        "Enable RAG (Document Search)",
+        value=cfg["enable_rag"]
+    )
+    cfg["enable_rag"] = enable_rag
+    
+    if enable_rag:
+        rag_max_results = st.slider(
+            "Max Search Results",
+            min_value=1,
+            max_value=10,
+            value=cfg["rag_max_results"]
         )
-        st.session_state.config["temperature"] = temperature
-        
-        # Conversation management
-        st.subheader("💬 Conversation")
-        
-        if st.button("🗑️ Clear Chat History"):
-            st.session_state.messages = []
-            st.rerun()
-        
-        if st.button("💾 Save Configuration"):
-            config_manager = ConfigManager()
-            config_manager.save_config(st.session_state.config)
-            st.success("Configuration saved!")
-        
-        # System info
-        st.subheader("ℹ️ System Info")
-        st.write(f"**Messages:** {len(st.session_state.messages)}")
-        st.write(f"**Timestamp:** {datetime.now().strftime('%H:%M:%S')}")
+        cfg["rag_max_results"] = rag_max_results
+    
+    temperature = st.slider(
+        "Response Creativity",
+        min_value=0.0,
+        max_value=2.0,
+        value=cfg["temperature"],
+        step=0.1
+    )
+    cfg["temperature"] = temperature
+    
+    # Conversation management
+    st.subheader("💬 Conversation")
+    
+    if st.button("🗑️ Clear Chat History"):
+        reset_chat_history()
+        st.rerun()
+    
+    if st.button("💾 Save Configuration"):
+        config_manager = ConfigManager()
+        config_manager.save_config(cfg)
+        st.success("Configuration saved!")
+    
+    # System info
+    st.subheader("ℹ️ System Info")
+    st.write(f"**Messages:** {len(st.session_state.messages)}")
+    st.write(f"**Timestamp:** {datetime.now().strftime('%H:%M:%S')}")
 
 def main():
     """Main application function"""
@@ -335,32 +685,18 @@ def main():
     
     # Initialize session state
     initialize_session_state()
+    cfg = st.session_state.config
     
     # Render sidebar
-    sidebar_configuration()
+    with st.sidebar:
+        sidebar_configuration()
     
     # Main chat interface
     st.title("🤖 MIDAS RAG Chat Interface")
     st.markdown("*Chat with your documents using local AI*")
     
     # Display chat messages
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.write(message["content"])
-            
-            # Show search results if available
-            if message["role"] == "assistant" and "search_results" in message:
-                with st.expander("📚 Retrieved Context", expanded=False):
-                    results = message["search_results"]
-                    for i, result in enumerate(results, 1):
-                        score = result.get('score', 0)
-                        text = result.get('text', '')
-                        file_path = result.get('file_path', 'Unknown')
-                        file_name = Path(file_path).name if file_path != 'Unknown' else 'Unknown'
-                        
-                        st.write(f"**Source {i}:** {file_name} (Score: {score:.3f})")
-                        st.write(text[:300] + "..." if len(text) > 300 else text)
-                        st.divider()
+    render_chat_history()
     
     # Chat input
     if prompt := st.chat_input("Ask a question about your documents..."):
@@ -375,7 +711,7 @@ def main():
             st.stop()
         
         # Add user message
-        st.session_state.messages.append({"role": "user", "content": prompt})
+        append_message({"role": "user", "content": prompt})
         
         with st.chat_message("user"):
             st.write(prompt)
@@ -385,57 +721,65 @@ def main():
             with st.spinner("Thinking..."):
                 search_results = []
                 context = ""
-                
-                # Perform RAG search if enabled
-                if st.session_state.config["enable_rag"]:
-                    doc_results = st.session_state.rag_system.search_documents(
-                        prompt, 
-                        limit=st.session_state.config["rag_max_results"]
-                    )
-                    
-                    struct_results = st.session_state.rag_system.search_structured_data(
-                        prompt, 
-                        limit=2
-                    )
-                    
-                    search_results = doc_results + struct_results
-                    
-                    if search_results:
-                        context = format_search_results(search_results)
-                
-                # Prepare messages for Ollama
-                messages = []
-                for msg in st.session_state.messages[-5:]:  # Last 5 messages for context
-                    if msg["role"] != "system":
-                        messages.append({
-                            "role": msg["role"],
-                            "content": msg["content"]
-                        })
-                
-                # Create system prompt with context
-                system_prompt = st.session_state.config["system_prompt"]
-                if context:
-                    system_prompt += f"\n\nRelevant information from the knowledge base:\n{context}\n\nPlease use this information to provide accurate and helpful responses."
-                
-                # Stream response
+                result_rows = []
                 response_placeholder = st.empty()
                 full_response = ""
                 
-                try:
-                    for chunk in st.session_state.ollama_chat.stream_chat(
-                        model=st.session_state.config["default_model"],
-                        messages=messages,
-                        system_prompt=system_prompt
-                    ):
-                        full_response += chunk
-                        response_placeholder.write(full_response + "▊")
-                    
+                # Near-duplicate prompts are answered from the semantic cache; a
+                # follow-up depends on earlier turns, so only first turns use it
+                response_cache = st.session_state.response_cache
+                if len(st.session_state.context_window) > 1:
+                    response_cache = None
+                cache_variant = response_cache_variant(cfg)
+                prompt_vector = st.session_state.rag_system.embed(prompt) if response_cache else None
+                cached = response_cache.get(prompt_vector, cache_variant) if prompt_vector else None
+                
+                if cached:
+                    full_response, search_results = cached
                     response_placeholder.write(full_response)
+                    _, result_rows = render_results(search_results)
+                else:
+                    # Perform RAG search if enabled
+                    if cfg["enable_rag"]:
+                        doc_results, struct_results = st.session_state.rag_system.retrieve(
+                            prompt,
+                            doc_limit=cfg["rag_max_results"],
+                            struct_limit=2
+                        )
+                        
+                        search_results = add_file_names(dedupe_results(doc_results + struct_results))
+                        
+                        # One pass builds both the prompt context and the expander rows
+                        context, result_rows = render_results(search_results)
                     
-                except Exception as e:
-                    error_msg = f"Error generating response: {str(e)}"
-                    response_placeholder.error(error_msg)
-                    full_response = error_msg
+                    # Create system prompt with context
+                    system_prompt = build_system_prompt(cfg["system_prompt"], context)
+                    
+                    # Prepare messages for Ollama within the model's context budget
+                    history_budget = (
+                        cfg["max_context_tokens"] - cfg["max_tokens"]
+                        - len(system_prompt) // CHARS_PER_TOKEN - PROMPT_TOKEN_RESERVE
+                    )
+                    messages = build_history(history_budget)
+                    
+                    # Stream response
+                    try:
+                        full_response = render_stream(
+                            st.session_state.ollama_chat.stream_chat(
+                                model=cfg["default_model"],
+                                messages=messages,
+                                system_prompt=system_prompt
+                            ),
+                            response_placeholder
+                        )
+                        
+                        if prompt_vector and full_response and not full_response.startswith("Error"):
+                            response_cache.put(prompt_vector, cache_variant, full_response, search_results)
+                        
+                    except Exception as e:
+                        error_msg = f"Error generating response: {str(e)}"
+                        response_placeholder.error(error_msg)
+                        full_response = error_msg
             
             # Add assistant message with search results
             assistant_message = {
@@ -447,18 +791,9 @@ def main():
                 assistant_message["search_results"] = search_results
                 
                 # Show search results
-                with st.expander("📚 Retrieved Context", expanded=False):
-                    for i, result in enumerate(search_results, 1):
-                        score = result.get('score', 0)
-                        text = result.get('text', '')
-                        file_path = result.get('file_path', 'Unknown')
-                        file_name = Path(file_path).name if file_path != 'Unknown' else 'Unknown'
-                        
-                        st.write(f"**Source {i}:** {file_name} (Score: {score:.3f})")
-                        st.write(text[:300] + "..." if len(text) > 300 else text)
-                        st.divider()
+                display_search_results(result_rows)
             
-            st.session_state.messages.append(assistant_message)
+            append_message(assistant_message)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -10,6 +10,12 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 import logging
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -109,6 +115,22 @@ class AppConfig:
     logging: LoggingConfig = field(default_factory=LoggingConfig)
     security: SecurityConfig = field(default_factory=SecurityConfig)
 
+# Environment variable overrides: (variable, config section, key, type)
+_ENV_OVERRIDES = (
+    ("OLLAMA_BASE_URL", "ollama", "base_url", str),
+    ("QDRANT_HOST", "qdrant", "host", str),
+    ("QDRANT_PORT", "qdrant", "port", int),
+    ("REDIS_HOST", "redis", "host", str),
+    ("REDIS_PORT", "redis", "port", int),
+    ("REDIS_PASSWORD", "redis", "password", str),
+    ("POSTGRES_HOST", "database", "host", str),
+    ("POSTGRES_PORT", "database", "port", int),
+    ("POSTGRES_DB", "database", "database", str),
+    ("POSTGRES_USER", "database", "username", str),
+    ("POSTGRES_PASSWORD", "database", "password", str),
+    ("SECRET_KEY", "security", "secret_key", str),
+)
+
 class ConfigManager:
     """Configuration manager for loading and validating config files"""
     
@@ -124,7 +146,7 @@ class ConfigManager:
         if config_path.exists():
             try:
                 with open(config_path, 'r', encoding='utf-8') as f:
-                    config_data = yaml.safe_load(f) or {}
+                    config_data = yaml.load(f, Loader=SafeLoader) or {}
                 logger.info(f"Loaded configuration from {config_path}")
             except Exception as e:
                 logger.warning(f"Failed to load config file {config_path}: {e}")
@@ -146,40 +168,11 @@ class ConfigManager:
     
     def _apply_env_overrides(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
         """Apply environment variable overrides"""
-        
-        # Ollama overrides
-        if os.getenv("OLLAMA_BASE_URL"):
-            config_data.setdefault("ollama", {})["base_url"] = os.getenv("OLLAMA_BASE_URL")
-        
-        # Qdrant overrides
-        if os.getenv("QDRANT_HOST"):
-            config_data.setdefault("qdrant", {})["host"] = os.getenv("QDRANT_HOST")
-        if os.getenv("QDRANT_PORT"):
-            config_data.setdefault("qdrant", {})["port"] = int(os.getenv("QDRANT_PORT"))
-        
-        # Redis overrides
-        if os.getenv("REDIS_HOST"):
-            config_data.setdefault("redis", {})["host"] = os.getenv("REDIS_HOST")
-        if os.getenv("REDIS_PORT"):
-            config_data.setdefault("redis", {})["port"] = int(os.getenv("REDIS_PORT"))
-        if os.getenv("REDIS_PASSWORD"):
-            config_data.setdefault("redis", {})["password"] = os.getenv("REDIS_PASSWORD")
-        
-        # Database overrides
-        if os.getenv("POSTGRES_HOST"):
-            config_data.setdefault("database", {})["host"] = os.getenv("POSTGRES_HOST")
-        if os.getenv("POSTGRES_PORT"):
-            config_data.setdefault("database", {})["port"] = int(os.getenv("POSTGRES_PORT"))
-        if os.getenv("POSTGRES_DB"):
-            config_data.setdefault("database", {})["database"] = os.getenv("POSTGRES_DB")
-        if os.getenv("POSTGRES_USER"):
-            config_data.setdefault("database", {})["username"] = os.getenv("POSTGRES_USER")
-        if os.getenv("POSTGRES_PASSWORD"):
-            config_data.setdefault("database", {})["password"] = os.getenv("POSTGRES_PASSWORD")
-        
-        # Security overrides
-        if os.getenv("SECRET_KEY"):
-            config_data.setdefault("security", {})["secret_key"] = os.getenv("SECRET_KEY")
+        environ = os.environ
+        for env_var, section, key, cast in _ENV_OVERRIDES:
+            value = environ.get(env_var)
+            if value:
+                config_data.setdefault(section, {})[key] = cast(value)
         
         return config_data
     
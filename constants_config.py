@@ -4,7 +4,27 @@ Centralized configuration for all modules with security-focused defaults.
 """
 
 from pathlib import Path
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+from typing import Optional
+import copyreg
+import logging
 import os
+import re
+import sys
+
+logger = logging.getLogger(__name__)
+
+# Warnings from the most recent validate_configuration() run
+_CONFIG_WARNINGS: list = []
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # ============================================================================
 # DATABASE CONFIGURATION
@@ -71,64 +91,142 @@ MAX_CONCURRENT_OPERATIONS = 4
 # CHUNKING AND EMBEDDING CONFIGURATION
 # ============================================================================
 
+@dataclass(frozen=True, slots=True)
+class ChunkStrategy:
+    """Parameters for one chunking strategy."""
+    overlap: int
+    chunk_size: Optional[int] = None
+    sentence_boundary: bool = False
+    min_chunk_size: Optional[int] = None
+    max_chunk_size: Optional[int] = None
+    content_aware: bool = False
+    
+    # Read-only mapping access for callers written against the old dict layout.
+    # Fields left as None were absent from those dicts, so they are missing keys.
+    def __getitem__(self, key: str):
+        value = getattr(self, key) if key in self.__slots__ else None
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def __contains__(self, key) -> bool:
+        return key in self.__slots__ and getattr(self, key) is not None
+    
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self else default
+
 # Chunking strategies
 CHUNKING_STRATEGIES = {
-    'semantic': {
-        'chunk_size': 500,
-        'overlap': 100,
-        'sentence_boundary': True
-    },
-    'fixed': {
-        'chunk_size': 1000,
-        'overlap': 200,
-        'sentence_boundary': False
-    },
-    'adaptive': {
-        'min_chunk_size': 200,
-        'max_chunk_size': 800,
-        'overlap': 150,
-        'content_aware': True
-    }
+    'semantic': ChunkStrategy(
+        chunk_size=500,
+        overlap=100,
+        sentence_boundary=True
+    ),
+    'fixed': ChunkStrategy(
+        chunk_size=1000,
+        overlap=200,
+        sentence_boundary=False
+    ),
+    'adaptive': ChunkStrategy(
+        min_chunk_size=200,
+        max_chunk_size=800,
+        overlap=150,
+        content_aware=True
+    )
 }
 
-# Content analysis keywords for auto-tagging
-CONTENT_KEYWORDS = {
-    'financial': [
-        'budget', 'cost', 'revenue', 'profit', 'financial', 'money', 
-        'dollar', 'invoice', 'expense', 'income', 'accounting', 'fiscal',
-        'investment', 'capital', 'balance', 'audit', 'tax'
-    ],
-    'technical': [
-        'code', 'software', 'system', 'algorithm', 'database', 'api', 
-        'technical', 'programming', 'development', 'architecture',
-        'infrastructure', 'deployment', 'configuration', 'framework'
-    ],
-    'legal': [
-        'contract', 'agreement', 'legal', 'terms', 'conditions', 
-        'liability', 'regulation', 'compliance', 'policy', 'law',
-        'statute', 'jurisdiction', 'litigation', 'settlement'
-    ],
-    'medical': [
-        'patient', 'medical', 'diagnosis', 'treatment', 'healthcare', 
-        'clinical', 'pharmaceutical', 'therapy', 'doctor', 'hospital',
-        'medicine', 'symptoms', 'procedure', 'surgery'
-    ],
-    'research': [
-        'research', 'study', 'analysis', 'methodology', 'results', 
-        'hypothesis', 'experiment', 'data', 'findings', 'conclusion',
-        'investigation', 'survey', 'statistics', 'correlation'
-    ],
-    'security': [
-        'security', 'encryption', 'authentication', 'authorization',
-        'vulnerability', 'threat', 'risk', 'breach', 'incident',
-        'confidential', 'classified', 'restricted', 'access control'
-    ],
-    'hr': [
-        'employee', 'staff', 'personnel', 'hiring', 'recruitment',
-        'performance', 'review', 'salary', 'benefits', 'training',
-        'development', 'policy', 'handbook', 'onboarding'
-    ]
-}
+# Content analysis keywords for auto-tagging, built on first access (see __getattr__)
+@lru_cache(maxsize=1)
+def _content_keywords():
+    """Build the category -> keywords table for auto-tagging."""
+    return _freeze({
+        'financial': [
+            'budget', 'cost', 'revenue', 'profit', 'financial', 'money', 
+            'dollar', 'invoice', 'expense', 'income', 'accounting', 'fiscal',
+            'investment', 'capital', 'balance', 'audit', 'tax'
+        ],
+        'technical': [
+            'code', 'software', 'system', 'algorithm', 'database', 'api', 
+            'technical', 'programming', 'development', 'architecture',
+            'infrastructure', 'deployment', 'configuration', 'framework'
+        ],
+        'legal': [
+            'contract', 'agreement', 'legal', 'terms', 'conditions', 
+            'liability', 'regulation', 'compliance', 'policy', 'law',
+            'statute', 'jurisdiction', 'litigation', 'settlement'
+        ],
+        'medical': [
+            'patient', 'medical', 'diagnosis', 'treatment', 'healthcare', 
+            'clinical', 'pharmaceutical', 'therapy', 'doctor', 'hospital',
+            'medicine', 'symptoms', 'procedure', 'surgery'
+        ],
+        'research': [
+            'research', 'study', 'analysis', 'methodology', 'results', 
+            'hypothesis', 'experiment', 'data', 'findings', 'conclusion',
+            'investigation', 'survey', 'statistics', 'correlation'
+        ],
+        'security': [
+            'security', 'encryption', 'authentication', 'authorization',
+            'vulnerability', 'threat', 'risk', 'breach', 'incident',
+            'confidential', 'classified', 'restricted', 'access control'
+        ],
+        'hr': [
+            'employee', 'staff', 'personnel', 'hiring', 'recruitment',
+            'performance', 'review', 'salary', 'benefits', 'training',
+            'development', 'policy', 'handbook', 'onboarding'
+        ]
+    })
+
+@lru_cache(maxsize=1)
+def _keyword_matcher():
+    """Build a one-pass keyword matcher over all CONTENT_KEYWORDS categories."""
+    # Category i owns bit 1 << i; a keyword may set several bits (e.g. 'policy')
+    keyword_bits = {}
+    for bit, keywords in enumerate(_content_keywords().values()):
+        for keyword in keywords:
+            keyword = keyword.lower()
+            keyword_bits[keyword] = keyword_bits.get(keyword, 0) | (1 << bit)
+    
+    if AHOCORASICK_AVAILABLE:
+        matcher = ahocorasick.Automaton()
+        for keyword, bits in keyword_bits.items():
+            matcher.add_word(keyword, (len(keyword), bits))
+        matcher.make_automaton()
+    else:
+        alternation = "|".join(map(re.escape, sorted(keyword_bits, key=len, reverse=True)))
+        matcher = re.compile(rf"\b({alternation})\b")
+    
+    return matcher, keyword_bits
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+def match_category_bits(text: str) -> int:
+    """Return a bitset of matched categories; bit i is the i-th CONTENT_KEYWORDS category."""
+    found = 0
+    if not FEATURE_FLAGS['ENABLE_AUTO_TAGGING']:
+        return found
+    
+    matcher, keyword_bits = _keyword_matcher()
+    lowered = text.lower()
+    
+    if AHOCORASICK_AVAILABLE:
+        last = len(lowered) - 1
+        for end, (length, bits) in matcher.iter(lowered):
+            start = end - length + 1
+            if (start == 0 or not _is_word_char(lowered[start - 1])) and \
+               (end == last or not _is_word_char(lowered[end + 1])):
+                found |= bits
+    else:
+        for match in matcher.finditer(lowered):
+            found |= keyword_bits[match.group(1)]
+    
+    return found
+
+def match_categories(text: str) -> set:
+    """Return the CONTENT_KEYWORDS categories with a whole-word keyword match in text."""
+    bits = match_category_bits(text)
+    return {category for i, category in enumerate(_content_keywords()) if bits >> i & 1}
 
 # ============================================================================
 # LOGGING CONFIGURATION
@@ -171,16 +269,17 @@ MAX_BATCH_WAIT_TIME = 5.0  # seconds
 # STORAGE CONFIGURATION
 # ============================================================================
 
-# Directory structure
-DEFAULT_DATA_DIR = Path("data")
-DEFAULT_UPLOAD_DIR = DEFAULT_DATA_DIR / "uploads"
-DEFAULT_TEMP_DIR = DEFAULT_DATA_DIR / "temp"
-DEFAULT_LOG_DIR = DEFAULT_DATA_DIR / "logs"
-DEFAULT_BACKUP_DIR = DEFAULT_DATA_DIR / "backup"
-DEFAULT_QUARANTINE_DIR = DEFAULT_TEMP_DIR / "quarantine"
+# Directory structure; the Path forms of the *_STR paths are built on first access (see __getattr__)
+_DATA_STR = "data"
+DEFAULT_DATA_DIR = Path(_DATA_STR)
+DEFAULT_UPLOAD_DIR_STR = os.path.join(_DATA_STR, "uploads")
+DEFAULT_TEMP_DIR_STR = os.path.join(_DATA_STR, "temp")
+DEFAULT_LOG_DIR_STR = os.path.join(_DATA_STR, "logs")
+DEFAULT_BACKUP_DIR_STR = os.path.join(_DATA_STR, "backup")
+DEFAULT_QUARANTINE_DIR_STR = os.path.join(DEFAULT_TEMP_DIR_STR, "quarantine")
 
 # Database settings
-DEFAULT_DATABASE_PATH = DEFAULT_DATA_DIR / "database" / "rag_system.db"
+DEFAULT_DATABASE_PATH_STR = os.path.join(_DATA_STR, "database", "rag_system.db")
 DATABASE_POOL_SIZE = 5
 DATABASE_POOL_TIMEOUT = 30
 
@@ -201,12 +300,35 @@ SLOW_OPERATION_THRESHOLD = 10.0  # seconds
 # ENVIRONMENT-SPECIFIC OVERRIDES
 # ============================================================================
 
+# Environment variable overrides: variable -> (config key, converter)
+_BOOL_TRUE = frozenset({'true', '1', 'yes'})
+
+def _to_bool(value: str) -> bool:
+    return value.lower() in _BOOL_TRUE
+
+def _to_mb_bytes(value: str) -> int:
+    return int(value) * 1024 * 1024
+
+_ENV_OVERRIDES = (
+    ('MAX_FILE_SIZE_MB', 'MAX_FILE_SIZE_BYTES', _to_mb_bytes),
+    ('CHUNK_SIZE', 'DEFAULT_CHUNK_SIZE', int),
+    ('CHUNK_OVERLAP', 'DEFAULT_CHUNK_OVERLAP', int),
+    ('LOG_LEVEL', 'DEFAULT_LOG_LEVEL', str),
+    ('MALWARE_SCAN', 'MALWARE_SCAN_ENABLED', _to_bool),
+    ('SECURE_DELETE_PASSES', 'SECURE_DELETE_PASSES', int),
+    ('MAX_WORKERS', 'MAX_WORKER_THREADS', int),
+    ('DATABASE_TIMEOUT', 'DATABASE_TIMEOUT_SECONDS', int),
+    ('PROCESSING_TIMEOUT', 'PROCESSING_TIMEOUT_SECONDS', int)
+)
+
+@lru_cache(maxsize=1)
 def get_env_config():
-    """Get environment-specific configuration overrides."""
+    """Get environment-specific configuration overrides (computed once per process)."""
     env_config = {}
+    env = dict(os.environ)  # one snapshot; plain dict lookups skip os._Environ decoding
     
     # Environment detection
-    environment = os.getenv('ENVIRONMENT', 'development').lower()
+    environment = env.get('ENVIRONMENT', 'development').lower()
     
     if environment == 'production':
         env_config.update({
@@ -237,28 +359,21 @@ def get_env_config():
         })
     
     # Override with environment variables
-    env_overrides = {
-        'MAX_FILE_SIZE_MB': ('MAX_FILE_SIZE_BYTES', lambda x: int(x) * 1024 * 1024),
-        'CHUNK_SIZE': ('DEFAULT_CHUNK_SIZE', int),
-        'CHUNK_OVERLAP': ('DEFAULT_CHUNK_OVERLAP', int),
-        'LOG_LEVEL': ('DEFAULT_LOG_LEVEL', str),
-        'MALWARE_SCAN': ('MALWARE_SCAN_ENABLED', lambda x: x.lower() in ['true', '1', 'yes']),
-        'SECURE_DELETE_PASSES': ('SECURE_DELETE_PASSES', int),
-        'MAX_WORKERS': ('MAX_WORKER_THREADS', int),
-        'DATABASE_TIMEOUT': ('DATABASE_TIMEOUT_SECONDS', int),
-        'PROCESSING_TIMEOUT': ('PROCESSING_TIMEOUT_SECONDS', int)
-    }
-    
-    for env_var, (config_key, converter) in env_overrides.items():
-        env_value = os.getenv(env_var)
+    for env_var, config_key, converter in _ENV_OVERRIDES:
+        env_value = env.get(env_var)
         if env_value is not None:
             try:
                 env_config[config_key] = converter(env_value)
             except (ValueError, TypeError) as e:
-                print(f"Warning: Invalid environment variable {env_var}={env_value}: {e}")
+                logger.warning(f"Invalid environment variable {env_var}={env_value}: {e}")
     
     return env_config
 
+def refresh_env_config():
+    """Discard the cached environment overrides, e.g. after tests change os.environ."""
+    get_env_config.cache_clear()
+    get_config.cache_clear()
+
 # ============================================================================
 # SECURITY CLASSIFICATIONS
 # ============================================================================
@@ -271,13 +386,25 @@ SECURITY_CLASSIFICATIONS = [
     'top_secret'
 ]
 
-CLASSIFICATION_COLORS = {
-    'unclassified': '#28a745',  # Green
-    'restricted': '#ffc107',    # Yellow
-    'confidential': '#fd7e14',  # Orange
-    'secret': '#dc3545',        # Red
-    'top_secret': '#6f42c1'     # Purple
-}
+class Classification(IntEnum):
+    """Security classification ordinals, in SECURITY_CLASSIFICATIONS order."""
+    UNCLASSIFIED = 0
+    RESTRICTED = 1
+    CONFIDENTIAL = 2
+    SECRET = 3
+    TOP_SECRET = 4
+
+# Indexed by Classification ordinal
+CLASSIFICATION_COLORS = (
+    '#28a745',  # Green - unclassified
+    '#ffc107',  # Yellow - restricted
+    '#fd7e14',  # Orange - confidential
+    '#dc3545',  # Red - secret
+    '#6f42c1'   # Purple - top_secret
+)
+
+# Name-keyed alias for backward compatibility
+CLASSIFICATION_COLORS_BY_NAME = dict(zip(SECURITY_CLASSIFICATIONS, CLASSIFICATION_COLORS))
 
 # ============================================================================
 # ERROR CODES AND MESSAGES
@@ -309,6 +436,12 @@ ERROR_MESSAGES = {
     ERROR_CODES['QUOTA_EXCEEDED']: "User storage quota exceeded"
 }
 
+# Single-lookup views for callers holding an error name or a numeric code
+ERROR_MESSAGES_BY_NAME = MappingProxyType({name: ERROR_MESSAGES[code] for name, code in ERROR_CODES.items()})
+ERROR_NAME_BY_CODE = MappingProxyType({code: name for name, code in ERROR_CODES.items()})
+ERROR_CODES = MappingProxyType(ERROR_CODES)
+ERROR_MESSAGES = MappingProxyType(ERROR_MESSAGES)
+
 # ============================================================================
 # FEATURE FLAGS
 # ============================================================================
@@ -330,11 +463,22 @@ FEATURE_FLAGS = {
 # VALIDATION RULES
 # ============================================================================
 
+_FORBIDDEN_FILENAME_CHARS = frozenset('<>:"/\\|?*')
+_FORBIDDEN_FILENAME_NAMES = frozenset({'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'})
+
+# Forbidden characters anywhere, or a Windows reserved device name with or without an extension
+_FORBIDDEN_FILENAME_RE = re.compile(
+    "[" + re.escape(''.join(sorted(_FORBIDDEN_FILENAME_CHARS))) + "]"
+    "|^(?:" + "|".join(sorted(_FORBIDDEN_FILENAME_NAMES)) + r")(?:\.|$)",
+    re.IGNORECASE
+)
+
 VALIDATION_RULES = {
     'filename': {
         'max_length': 255,
-        'forbidden_chars': ['<', '>', ':', '"', '/', '\\', '|', '?', '*'],
-        'forbidden_names': ['CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9']
+        'forbidden_chars': _FORBIDDEN_FILENAME_CHARS,
+        'forbidden_names': _FORBIDDEN_FILENAME_NAMES,
+        'compiled': _FORBIDDEN_FILENAME_RE
     },
     'content': {
         'min_chars': 10,
@@ -353,6 +497,23 @@ VALIDATION_RULES = {
     }
 }
 
+# Deletes every forbidden filename character in one str.translate pass
+_FORBIDDEN_CHARS_TRANS = str.maketrans('', '', ''.join(_FORBIDDEN_FILENAME_CHARS))
+
+def has_forbidden_chars(filename: str) -> bool:
+    """Return True if filename contains any forbidden filename character."""
+    return len(filename.translate(_FORBIDDEN_CHARS_TRANS)) != len(filename)
+
+def is_forbidden_filename(name: str) -> bool:
+    """Return True if name has a forbidden character or is a reserved device name."""
+    return _FORBIDDEN_FILENAME_RE.search(name) is not None
+
+# All forbidden content patterns fused into one alternation, compiled once
+FORBIDDEN_CONTENT_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in VALIDATION_RULES['content']['forbidden_patterns']),
+    re.IGNORECASE | re.DOTALL
+)
+
 # ============================================================================
 # RATE LIMITING
 # ============================================================================
@@ -374,6 +535,41 @@ RATE_LIMITS = {
     }
 }
 
+# ============================================================================
+# IMMUTABLE VIEWS
+# ============================================================================
+
+def _freeze(table):
+    """Wrap a top-level table read-only: dicts as views with interned keys, lists as tuples.
+    
+    Nested dicts stay plain so a dict() copy of a table pickles and serializes like before.
+    """
+    if isinstance(table, list):
+        return tuple(table)
+    return MappingProxyType({
+        sys.intern(key) if isinstance(key, str) else key: tuple(value) if isinstance(value, list) else value
+        for key, value in table.items()
+    })
+
+def _mappingproxy(mapping):
+    """Rebuild a frozen table when unpickling."""
+    return MappingProxyType(mapping)
+
+# mappingproxy has no pickle support of its own; rebuild the frozen tables from a
+# dict copy so config can still be sent to worker processes
+copyreg.pickle(MappingProxyType, lambda proxy: (_mappingproxy, (dict(proxy),)))
+
+# These tables are read-only for the life of the process
+FILE_EXTENSIONS = ALLOWED_FILE_EXTENSIONS = _freeze(FILE_EXTENSIONS)
+SUPPORTED_MIME_TYPES = frozenset(SUPPORTED_MIME_TYPES)
+CHUNKING_STRATEGIES = _freeze(CHUNKING_STRATEGIES)
+LOG_LEVELS = _freeze(LOG_LEVELS)
+SECURITY_CLASSIFICATIONS = _freeze(SECURITY_CLASSIFICATIONS)
+CLASSIFICATION_COLORS_BY_NAME = _freeze(CLASSIFICATION_COLORS_BY_NAME)
+FEATURE_FLAGS = _freeze(FEATURE_FLAGS)
+VALIDATION_RULES = _freeze(VALIDATION_RULES)
+RATE_LIMITS = _freeze(RATE_LIMITS)
+
 # ============================================================================
 # CONFIGURATION VALIDATION
 # ============================================================================
@@ -383,40 +579,52 @@ def validate_configuration():
     errors = []
     warnings = []
     
-    # Validate chunk sizes
-    if DEFAULT_CHUNK_OVERLAP >= DEFAULT_CHUNK_SIZE:
-        errors.append("Chunk overlap cannot be greater than or equal to chunk size")
+    # Constant-only checks: one fused predicate short-circuits the happy path,
+    # and the whole block is compiled out under python -O
+    if __debug__ and (
+        DEFAULT_CHUNK_OVERLAP >= DEFAULT_CHUNK_SIZE
+        or DEFAULT_CHUNK_SIZE > MAX_CHUNK_SIZE
+        or PROCESSING_TIMEOUT_SECONDS < 30
+        or DATABASE_TIMEOUT_SECONDS < 5
+        or MAX_FILE_SIZE_BYTES > 1024 * 1024 * 1024
+        or SECURE_DELETE_PASSES < 1
+        or SECURE_DIR_PERMISSIONS & 0o077
+    ):
+        # Validate chunk sizes
+        if DEFAULT_CHUNK_OVERLAP >= DEFAULT_CHUNK_SIZE:
+            errors.append("Chunk overlap cannot be greater than or equal to chunk size")
+        
+        if DEFAULT_CHUNK_SIZE > MAX_CHUNK_SIZE:
+            errors.append("Default chunk size cannot exceed maximum chunk size")
+        
+        # Validate timeouts
+        if PROCESSING_TIMEOUT_SECONDS < 30:
+            warnings.append("Processing timeout is very low, may cause premature timeouts")
+        
+        if DATABASE_TIMEOUT_SECONDS < 5:
+            warnings.append("Database timeout is very low, may cause connection issues")
+        
+        # Validate file size limits
+        if MAX_FILE_SIZE_BYTES > 1024 * 1024 * 1024:  # 1GB
+            warnings.append("Maximum file size is very large, may impact performance")
+        
+        if SECURE_DELETE_PASSES < 1:
+            errors.append("Secure delete passes must be at least 1")
+        
+        # Validate directory permissions
+        if SECURE_DIR_PERMISSIONS & 0o077:  # World or group writable
+            warnings.append("Directory permissions may be too permissive")
     
-    if DEFAULT_CHUNK_SIZE > MAX_CHUNK_SIZE:
-        errors.append("Default chunk size cannot exceed maximum chunk size")
-    
-    # Validate timeouts
-    if PROCESSING_TIMEOUT_SECONDS < 30:
-        warnings.append("Processing timeout is very low, may cause premature timeouts")
-    
-    if DATABASE_TIMEOUT_SECONDS < 5:
-        warnings.append("Database timeout is very low, may cause connection issues")
-    
-    # Validate file size limits
-    if MAX_FILE_SIZE_BYTES > 1024 * 1024 * 1024:  # 1GB
-        warnings.append("Maximum file size is very large, may impact performance")
-    
-    # Validate security settings
+    # Validate security settings (environment-dependent, always checked)
     if not MALWARE_SCAN_ENABLED and os.getenv('ENVIRONMENT', '').lower() == 'production':
         warnings.append("Malware scanning is disabled in production environment")
     
-    if SECURE_DELETE_PASSES < 1:
-        errors.append("Secure delete passes must be at least 1")
-    
-    # Validate directory permissions
-    if SECURE_DIR_PERMISSIONS & 0o077:  # World or group writable
-        warnings.append("Directory permissions may be too permissive")
-    
     if errors:
         raise ValueError(f"Configuration validation failed: {'; '.join(errors)}")
     
+    _CONFIG_WARNINGS[:] = warnings
     if warnings:
-        print(f"Configuration warnings: {'; '.join(warnings)}")
+        logger.warning(f"Configuration warnings: {'; '.join(warnings)}")
     
     return True
 
@@ -424,19 +632,47 @@ def validate_configuration():
 # EXPORT INTERFACE
 # ============================================================================
 
-def get_config():
-    """Get complete configuration with environment overrides applied."""
-    # Start with base configuration
-    config = {
-        name: value for name, value in globals().items()
-        if not name.startswith('_') and name.isupper()
-    }
-    
-    # Apply environment-specific overrides
-    env_config = get_env_config()
-    config.update(env_config)
+_LAZY_PATHS = frozenset({
+    'DEFAULT_UPLOAD_DIR', 'DEFAULT_TEMP_DIR', 'DEFAULT_LOG_DIR',
+    'DEFAULT_BACKUP_DIR', 'DEFAULT_QUARANTINE_DIR', 'DEFAULT_DATABASE_PATH'
+})
+
+def _lazy_constant(name):
+    """Build a lazily loaded constant and cache it as a module global."""
+    if name == 'CONTENT_KEYWORDS':
+        value = _content_keywords()
+    elif name == '_KEYWORD_AC':
+        value = _keyword_matcher()[0]
+    elif name == '_KEYWORD_BITSET':
+        value = _keyword_matcher()[1]
+    elif name in _LAZY_PATHS:
+        value = Path(globals()[name + '_STR'])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __getattr__(name):
+    """Resolve lazily loaded module attributes on first access (PEP 562)."""
+    return _lazy_constant(name)
+
+class _Config(SimpleNamespace):
+    """Configuration namespace that falls back to lazily loaded constants."""
     
-    return type('Config', (), config)()
+    def __getattr__(self, name):
+        return _lazy_constant(name)
+
+@lru_cache(maxsize=1)
+def get_config():
+    """Get complete configuration with environment overrides applied (shared, treat as read-only)."""
+    return _Config(**{**_BASE_CONFIG, **get_env_config()})
+
+# Apply validation on import; spawned worker processes can skip it with MIDAS_SKIP_VALIDATION=1
+if os.getenv('MIDAS_SKIP_VALIDATION') != '1':
+    validate_configuration()
 
-# Apply validation on import
-validate_configuration()
+# Uppercase constants are fixed at import, so snapshot them once for get_config()
+_BASE_CONFIG = {
+    name: value for name, value in globals().items()
+    if not name.startswith('_') and name.isupper()
+}
@@ -10,24 +10,252 @@ from plotly.subplots import make_subplots
 from typing import Dict, List, Any, Optional, Union, Callable
 import numpy as np
 from datetime import datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import hashlib
 import json
 import logging
+import operator
+import threading
+import time
+import weakref
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+FIGURE_CACHE_SIZE = 128
+DATA_CACHE_SIZE = 64
+
+# Seconds a fetched data source stays fresh; unlisted types (e.g. 'function') are not cached
+DATA_SOURCE_TTL = {
+    'static': float('inf'),
+    'sql': 30.0,
+    'api': 15.0
+}
+LINE_MAX_POINTS = 5000  # Line traces longer than this are downsampled with LTTB
+
+# Plotly's orjson engine also handles numpy arrays and datetimes natively
+_PLOTLY_JSON_ENGINE = 'orjson' if ORJSON_AVAILABLE else 'json'
+
+# Vectorized comparison operators supported by chart filters
+_COMPARISON_OPS = {
+    '=': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le
+}
+
+def _is_real(value: Any) -> bool:
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool)
+
+def _isin_mask(series: pd.Series, values) -> np.ndarray:
+    """Membership mask; categorical columns look their integer codes up in a boolean table"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        # The extra last slot is hit by code -1, i.e. missing values
+        lut = np.zeros(len(categories) + 1, dtype=bool)
+        lut[:-1] = categories.isin(values)
+        lut[-1] = bool(pd.isna(list(values)).any())
+        return lut[series.cat.codes.to_numpy()]
+    return series.isin(values).to_numpy(dtype=bool)
+
+# Metric reductions over float64 column values; the nan* variants skip missing
+# values the same way the pandas Series reductions did. 'count' counts rows and
+# any other aggregation takes the raw last (metric) or first (comparison) value
+_METRIC_AGGREGATIONS = {
+    'sum': np.nansum,
+    'mean': np.nanmean,
+    'max': np.nanmax,
+    'min': np.nanmin
+}
+
+_COMPARE_AGGREGATIONS = {
+    'sum': np.nansum,
+    'mean': np.nanmean
+}
+
+def _numeric_axis(values: np.ndarray) -> np.ndarray:
+    """Map x values to float64 for LTTB; non-numeric axes use row position"""
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype('datetime64[ns]').view(np.int64).astype(np.float64)
+    if np.issubdtype(values.dtype, np.number):
+        return values.astype(np.float64)
+    return np.arange(len(values), dtype=np.float64)
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Pick n_out row indices with Largest-Triangle-Three-Buckets, keeping first and last"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    # n_out - 2 buckets over the interior points, plus per-bucket means for the look-ahead
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[:n - 1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(y[:n - 1], edges[:-1]) / counts
+    
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    selected = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 1 < len(counts):
+            next_x, next_y = mean_x[bucket + 1], mean_y[bucket + 1]
+        else:
+            next_x, next_y = x[-1], y[-1]
+        
+        ax, ay = x[selected], y[selected]
+        areas = np.abs((ax - next_x) * (y[start:end] - ay) - (ax - x[start:end]) * (next_y - ay))
+        selected = start + int(np.argmax(areas))
+        indices[bucket + 1] = selected
+    
+    return indices
+
+def _mean_grid(data: pd.DataFrame, x_column: str, y_column: str, z_column: str):
+    """Mean of z per (y, x) cell, matching pivot_table(aggfunc='mean') via factorize + bincount"""
+    y_codes, y_labels = pd.factorize(data[y_column], sort=True)
+    x_codes, x_labels = pd.factorize(data[x_column], sort=True)
+    z = data[z_column].to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    # Missing keys (code -1) and missing values are skipped, as in pivot_table
+    valid = (y_codes >= 0) & (x_codes >= 0) & ~np.isnan(z)
+    ny, nx = len(y_labels), len(x_labels)
+    flat = y_codes[valid] * nx + x_codes[valid]
+    counts = np.bincount(flat, minlength=ny * nx).reshape(ny, nx)
+    sums = np.bincount(flat, weights=z[valid], minlength=ny * nx).reshape(ny, nx)
+    
+    with np.errstate(invalid='ignore'):
+        grid = sums / counts  # empty cells become NaN
+    
+    # pivot_table drops rows and columns with no values at all
+    rows, cols = counts.any(axis=1), counts.any(axis=0)
+    return x_labels[cols], y_labels[rows], grid[rows][:, cols]
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _range_mask_kernel(columns, lows, highs, out):
+        """Fused multi-column range test; each row stops at its first failing filter"""
+        n_filters = len(columns)
+        for i in prange(out.shape[0]):
+            keep = True
+            for f in range(n_filters):
+                value = columns[f][i]
+                if not (value >= lows[f] and value <= highs[f]):
+                    keep = False
+                    break
+            out[i] = keep
+
+def _range_mask(columns: List[np.ndarray], lows: List[float], highs: List[float]) -> np.ndarray:
+    """Rows whose every column lies within its [low, high] bounds; NaN never matches"""
+    if NUMBA_AVAILABLE:
+        out = np.empty(len(columns[0]), dtype=np.bool_)
+        # A tuple lets the kernel read each column's own buffer; numba compiles one
+        # specialization per filter count. Contiguous columns are passed as they are.
+        _range_mask_kernel(tuple(np.ascontiguousarray(column) for column in columns),
+                           np.asarray(lows, dtype=np.float64), np.asarray(highs, dtype=np.float64), out)
+        return out
+    
+    mask = np.ones(len(columns[0]), dtype=bool)
+    for column, low, high in zip(columns, lows, highs):
+        mask &= (column >= low) & (column <= high)
+    return mask
+
 class ChartDataConnector:
     """Connects charts to data sources"""
     
     def __init__(self):
         self.data_sources = {}
         self.connections = {}
+        # Created on first use and reused across charts
+        self._http = None
+        self._sql = None
+        # (fetched_at, frame) per source config, plus in-flight fetches for coalescing
+        self._data_cache: OrderedDict = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._data_lock = threading.Lock()
+    
+    def _get_http_session(self):
+        """Shared HTTP session so API sources reuse pooled keep-alive connections"""
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            self._http = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+            self._http.mount('http://', adapter)
+            self._http.mount('https://', adapter)
+        return self._http
+    
+    def _get_sql_search(self):
+        """Shared SQL search instance; its models, connections and query cache are costly to rebuild"""
+        if self._sql is None:
+            from integrated_sql_rag_search import IntegratedSQLRAGSearch
+            self._sql = IntegratedSQLRAGSearch()
+        return self._sql
     
     def register_data_source(self, name: str, data_getter: Callable):
         """Register a data source function"""
         self.data_sources[name] = data_getter
     
     def get_data(self, source_config: Dict[str, Any]) -> pd.DataFrame:
-        """Get data based on source configuration"""
+        """Get data based on source configuration, reusing recent results (shared frames, do not mutate)"""
+        ttl = DATA_SOURCE_TTL.get(source_config.get('type', 'static'), 0)
+        if ttl <= 0:
+            return self._fetch_data(source_config)
+        
+        try:
+            key = json.dumps(source_config, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return self._fetch_data(source_config)
+        
+        with self._data_lock:
+            cached = self._data_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                self._data_cache.move_to_end(key)
+                return cached[1]
+            
+            # Concurrent requests for the same source wait on the first fetch
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            data = self._fetch_data(source_config)
+        except BaseException as e:
+            with self._data_lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+        
+        with self._data_lock:
+            self._data_cache[key] = (time.monotonic(), data)
+            self._data_cache.move_to_end(key)
+            if len(self._data_cache) > DATA_CACHE_SIZE:
+                self._data_cache.popitem(last=False)
+            self._inflight.pop(key, None)
+        future.set_result(data)
+        return data
+    
+    def _fetch_data(self, source_config: Dict[str, Any]) -> pd.DataFrame:
+        """Fetch data from the configured source"""
         source_type = source_config.get('type', 'static')
         
         if source_type == 'static':
@@ -48,30 +276,25 @@ class ChartDataConnector:
         
         elif source_type == 'sql':
             # SQL query data
-            from integrated_sql_rag_search import IntegratedSQLRAGSearch
-            search = IntegratedSQLRAGSearch()
-            
             query = source_config.get('query')
             database = source_config.get('database')
             
             if query and database:
                 try:
-                    return search.execute_sql(query, database)
+                    return self._get_sql_search().execute_sql(query, database)
                 except Exception as e:
                     logger.error(f"SQL execution failed: {e}")
                     return pd.DataFrame()
         
         elif source_type == 'api':
             # API endpoint data
-            import requests
-            
             url = source_config.get('url')
             method = source_config.get('method', 'GET')
             headers = source_config.get('headers', {})
             params = source_config.get('params', {})
             
             try:
-                response = requests.request(method, url, headers=headers, params=params)
+                response = self._get_http_session().request(method, url, headers=headers, params=params)
                 response.raise_for_status()
                 data = response.json()
                 return pd.DataFrame(data)
@@ -95,16 +318,50 @@ class ChartRenderer:
             'grid': '#E0E0E0'
         }
         self.data_connector = ChartDataConnector()
+        # [figure, serialized JSON or None] entries keyed by config, theme and
+        # data fingerprint (LRU order)
+        self._fig_cache: OrderedDict = OrderedDict()
+        self._fig_cache_lock = threading.Lock()
     
     def render_chart(self, chart_config: Dict[str, Any], 
                     data: Optional[pd.DataFrame] = None) -> go.Figure:
-        """Render chart based on configuration"""
+        """Render chart based on configuration; unchanged inputs copy the cached figure"""
+        # Callers mutate the figures they get, so never hand out the cached instance
+        return go.Figure(self._render_cached(chart_config, data)[0])
+    
+    def render_many(self, chart_configs: List[Dict[str, Any]]) -> List[go.Figure]:
+        """Render several charts concurrently, fetching their data in parallel; results keep input order"""
+        if not chart_configs:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(chart_configs))) as executor:
+            return list(executor.map(self.render_chart, chart_configs))
+    
+    def render_chart_json(self, chart_config: Dict[str, Any],
+                          data: Optional[pd.DataFrame] = None) -> bytes:
+        """Render chart and return its Plotly JSON as UTF-8 bytes, serialized once per cached figure"""
+        entry = self._render_cached(chart_config, data)
+        if entry[1] is None:
+            entry[1] = entry[0].to_json(engine=_PLOTLY_JSON_ENGINE).encode('utf-8')
+        return entry[1]
+    
+    def _render_cached(self, chart_config: Dict[str, Any],
+                       data: Optional[pd.DataFrame]) -> List[Any]:
+        """Return the [figure, JSON] cache entry for a chart, rendering it on a miss"""
         chart_type = chart_config.get('type', 'line')
         
         # Get data if not provided
         if data is None:
             data = self.data_connector.get_data(chart_config.get('data_source', {}))
         
+        cache_key = self._figure_cache_key(chart_config, data)
+        if cache_key is not None:
+            with self._fig_cache_lock:
+                entry = self._fig_cache.get(cache_key)
+                if entry is not None:
+                    self._fig_cache.move_to_end(cache_key)
+                    return entry
+        
         # Apply filters
         data = self._apply_filters(data, chart_config.get('filters', []))
         
@@ -118,102 +375,118 @@ class ChartRenderer:
         # Apply theme
         self._apply_theme(fig, chart_config)
         
-        return fig
+        entry = [fig, None]
+        if cache_key is not None:
+            with self._fig_cache_lock:
+                self._fig_cache[cache_key] = entry
+                if len(self._fig_cache) > FIGURE_CACHE_SIZE:
+                    self._fig_cache.popitem(last=False)
+        
+        return entry
+    
+    def _figure_cache_key(self, chart_config: Dict[str, Any], data: pd.DataFrame) -> Optional[str]:
+        """Build a cache key from the chart config, theme and a fingerprint of the data"""
+        try:
+            config_key = json.dumps([chart_config, self.theme], sort_keys=True, default=str)
+            row_hashes = pd.util.hash_pandas_object(data, index=True).to_numpy()
+        except TypeError:
+            # Unhashable cells (lists, dicts) - render without caching
+            return None
+        
+        digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16)
+        digest.update(repr((data.shape, tuple(data.columns))).encode())
+        return f"{digest.hexdigest()}:{config_key}"
     
     def _apply_filters(self, data: pd.DataFrame, filters: List[Dict[str, Any]]) -> pd.DataFrame:
         """Apply filters to data"""
-        if data.empty or not filters:
+        n = len(data)
+        if not n or not filters:
             return data
         
-        filtered_data = data.copy()
+        # AND every predicate into one mask and slice the frame once at the end
+        mask = np.ones(n, dtype=bool)
         
         for filter_config in filters:
             column = filter_config.get('column')
-            operator = filter_config.get('operator', '=')
+            op_name = filter_config.get('operator', '=')
             value = filter_config.get('value')
             
-            if column not in filtered_data.columns:
+            if column not in data.columns:
                 continue
             
-            if operator == '=':
-                filtered_data = filtered_data[filtered_data[column] == value]
-            elif operator == '!=':
-                filtered_data = filtered_data[filtered_data[column] != value]
-            elif operator == '>':
-                filtered_data = filtered_data[filtered_data[column] > value]
-            elif operator == '<':
-                filtered_data = filtered_data[filtered_data[column] < value]
-            elif operator == '>=':
-                filtered_data = filtered_data[filtered_data[column] >= value]
-            elif operator == '<=':
-                filtered_data = filtered_data[filtered_data[column] <= value]
-            elif operator == 'in':
-                filtered_data = filtered_data[filtered_data[column].isin(value)]
-            elif operator == 'contains':
-                filtered_data = filtered_data[filtered_data[column].str.contains(value, na=False)]
-        
-        return filtered_data
+            series = data[column]
+            compare = _COMPARISON_OPS.get(op_name)
+            if compare is not None:
+                matches = compare(series, value)
+            elif op_name == 'in':
+                mask &= _isin_mask(series, value)
+                continue
+            elif op_name == 'contains':
+                # Literal substring match unless the filter opts into regex
+                matches = series.str.contains(value, na=False, regex=bool(filter_config.get('regex', False)))
+            else:
+                continue
+            
+            mask &= matches.to_numpy(dtype=bool, na_value=False)
+        
+        # Boolean indexing always copies; skip it when every row passes
+        return data if mask.all() else data[mask]
     
     def _apply_theme(self, fig: go.Figure, chart_config: Dict[str, Any]):
         """Apply theme to figure"""
+        opts = chart_config.get('options') or {}
+        axis = dict(
+            gridcolor=self.theme['grid'],
+            showgrid=opts.get('show_grid', True)
+        )
+        
+        # One layout update (axes included) instead of separate layout/axis passes
         fig.update_layout(
             paper_bgcolor=self.theme['background'],
             plot_bgcolor=self.theme['background'],
             font_color=self.theme['text'],
             title_font_color=self.theme['text'],
             title=chart_config.get('title', ''),
-            showlegend=chart_config.get('options', {}).get('show_legend', True),
-            margin=dict(l=40, r=40, t=60, b=40)
-        )
-        
-        # Update axes
-        fig.update_xaxes(
-            gridcolor=self.theme['grid'],
-            showgrid=chart_config.get('options', {}).get('show_grid', True)
-        )
-        fig.update_yaxes(
-            gridcolor=self.theme['grid'],
-            showgrid=chart_config.get('options', {}).get('show_grid', True)
+            showlegend=opts.get('show_legend', True),
+            margin=dict(l=40, r=40, t=60, b=40),
+            xaxis=axis,
+            yaxis=axis
         )
     
     def render_metric(self, data: pd.DataFrame, config: Dict[str, Any]) -> go.Figure:
         """Render metric/KPI card"""
-        value_column = config.get('options', {}).get('value_column')
-        aggregation = config.get('options', {}).get('aggregation', 'sum')
+        opts = config.get('options') or {}
+        n = 0 if data is None else len(data)
+        value_column = opts.get('value_column')
+        aggregation = opts.get('aggregation', 'sum')
         
-        if data.empty or not value_column or value_column not in data.columns:
+        if not n or not value_column or value_column not in data.columns:
             value = 0
             delta = 0
         else:
-            if aggregation == 'sum':
-                value = data[value_column].sum()
-            elif aggregation == 'mean':
-                value = data[value_column].mean()
-            elif aggregation == 'count':
-                value = len(data)
-            elif aggregation == 'max':
-                value = data[value_column].max()
-            elif aggregation == 'min':
-                value = data[value_column].min()
+            reduce = _METRIC_AGGREGATIONS.get(aggregation)
+            if aggregation == 'count':
+                value = n
+            elif reduce is not None:
+                value = reduce(data[value_column].to_numpy(dtype=np.float64, na_value=np.nan))
             else:
-                value = data[value_column].iloc[-1] if len(data) > 0 else 0
+                value = data[value_column].iat[-1]
             
             # Calculate delta if comparison column exists
-            compare_column = config.get('options', {}).get('compare_column')
+            compare_column = opts.get('compare_column')
             if compare_column and compare_column in data.columns:
-                if aggregation == 'sum':
-                    compare_value = data[compare_column].sum()
-                elif aggregation == 'mean':
-                    compare_value = data[compare_column].mean()
+                reduce = _COMPARE_AGGREGATIONS.get(aggregation)
+                if reduce is not None:
+                    compare_value = reduce(data[compare_column].to_numpy(dtype=np.float64, na_value=np.nan))
                 else:
-                    compare_value = data[compare_column].iloc[0] if len(data) > 0 else 0
+                    compare_value = data[compare_column].iat[0]
                 
                 delta = value - compare_value
             else:
                 delta = 0
         
         # Format value
-        format_type = config.get('options', {}).get('format', 'number')
+        format_type = opts.get('format', 'number')
         if format_type == 'currency':
             value_text = f"${value:,.2f}"
             delta_text = f"${delta:+,.2f}"
@@ -224,9 +497,7 @@ class ChartRenderer:
             value_text = f"{value:,.0f}"
             delta_text = f"{delta:+,.0f}"
         
-        fig = go.Figure()
-        
-        fig.add_trace(go.Indicator(
+        indicator = go.Indicator(
             mode="number+delta",
             value=value,
             delta={
@@ -237,89 +508,101 @@ class ChartRenderer:
             number={'valueformat': '.1%' if format_type == 'percentage' else '.0f'},
             title={'text': config.get('title', 'Metric')},
             domain={'x': [0, 1], 'y': [0, 1]}
-        ))
-        
-        fig.update_layout(height=200)
+        )
         
-        return fig
+        return go.Figure(data=[indicator], layout=dict(height=200))
     
     def render_line(self, data: pd.DataFrame, config: Dict[str, Any]) -> go.Figure:
         """Render line chart"""
-        x_column = config.get('options', {}).get('x_column')
-        y_columns = config.get('options', {}).get('y_columns', [])
+        opts = config.get('options') or {}
+        n = 0 if data is None else len(data)
+        x_column = opts.get('x_column')
+        y_columns = opts.get('y_columns', [])
         
-        if data.empty or not x_column or not y_columns:
+        if not n or not x_column or not y_columns:
             return self.render_empty(config)
         
-        fig = go.Figure()
+        max_points = opts.get('max_points', LINE_MAX_POINTS)
+        x_values = data[x_column].to_numpy()
+        downsample = n > max_points
+        if downsample:
+            x_numeric = _numeric_axis(x_values)
         
+        traces = []
         for y_column in y_columns:
             if y_column in data.columns:
-                fig.add_trace(go.Scatter(
-                    x=data[x_column],
-                    y=data[y_column],
+                x_trace = x_values
+                y_trace = data[y_column].to_numpy()
+                if downsample:
+                    keep = _lttb_indices(x_numeric, y_trace.astype(np.float64), max_points)
+                    x_trace, y_trace = x_trace[keep], y_trace[keep]
+                
+                traces.append(go.Scatter(
+                    x=x_trace,
+                    y=y_trace,
                     mode='lines+markers',
                     name=y_column,
                     line=dict(width=2),
                     marker=dict(size=6)
                 ))
         
-        fig.update_layout(
+        layout = dict(
             xaxis_title=x_column,
             yaxis_title=', '.join(y_columns),
             hovermode='x unified'
         )
         
-        return fig
+        return go.Figure(data=traces, layout=layout)
     
     def render_bar(self, data: pd.DataFrame, config: Dict[str, Any]) -> go.Figure:
         """Render bar chart"""
-        x_column = config.get('options', {}).get('x_column')
-        y_columns = config.get('options', {}).get('y_columns', [])
-        orientation = config.get('options', {}).get('orientation', 'vertical')
+        opts = config.get('options') or {}
+        n = 0 if data is None else len(data)
+        x_column = opts.get('x_column')
+        y_columns = opts.get('y_columns', [])
+        orientation = opts.get('orientation', 'vertical')
         
-        if data.empty or not x_column or not y_columns:
+        if not n or not x_column or not y_columns:
             return self.render_empty(config)
         
-        fig = go.Figure()
-        
+        traces = []
         for y_column in y_columns:
             if y_column in data.columns:
                 if orientation == 'horizontal':
-                    fig.add_trace(go.Bar(
+                    traces.append(go.Bar(
                         y=data[x_column],
                         x=data[y_column],
                         name=y_column,
                         orientation='h'
                     ))
                 else:
-                    fig.add_trace(go.Bar(
+                    traces.append(go.Bar(
                         x=data[x_column],
                         y=data[y_column],
                         name=y_column
                     ))
         
-        barmode = config.get('options', {}).get('barmode', 'group')
-        fig.update_layout(barmode=barmode)
-        
-        return fig
+        return go.Figure(data=traces, layout=dict(barmode=opts.get('barmode', 'group')))
     
     def render_scatter(self, data: pd.DataFrame, config: Dict[str, Any]) -> go.Figure:
         """Render scatter plot"""
-        x_column = config.get('options', {}).get('x_column')
-        y_column = config.get('options', {}).get('y_column')
-        size_column = config.get('options', {}).get('size_column')
-        color_column = config.get('options', {}).get('color_column')
-        
-        if data.empty or not x_column or not y_column:
+        opts = config.get('options') or {}
+        n = 0 if data is None else len(data)
+        x_column = opts.get('x_column')
+        y_column = opts.get('y_column')
+        size_column = opts.get('size_column')
+        color_column = opts.get('color_column')
+        
+        if not n or not x_column or not y_column:
             return self.render_empty(config)
         
         marker_config = {'size': 8}
         
         if size_column and size_column in data.columns:
-            marker_config['size'] = data[size_column]
+            sizes = data[size_column].to_numpy(dtype=np.float64, na_value=np.nan)
+            marker_config['size'] = sizes
             marker_config['sizemode'] = 'area'
-            marker_config['sizeref'] = 2. * max(data[size_column]) / (40. ** 2)
+            marker_config['sizeref'] = 2. * float(np.nanmax(sizes)) / (40. ** 2)
             marker_config['sizemin'] = 4
         
         if color_column and color_column in data.columns:
@@ -332,106 +615,113 @@ class ChartRenderer:
                 title=config.get('title', '')
             )
         else:
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
+            fig = go.Figure(data=[go.Scatter(
                 x=data[x_column],
                 y=data[y_column],
                 mode='markers',
                 marker=marker_config,
                 name='Data'
-            ))
+            )])
         
         return fig
     
     def render_pie(self, data: pd.DataFrame, config: Dict[str, Any]) -> go.Figure:
         """Render pie chart"""
-        labels_column = config.get('options', {}).get('labels_column')
-        values_column = config.get('options', {}).get('values_column')
+        opts = config.get('options') or {}
+        n = 0 if data is None else len(data)
+        labels_column = opts.get('labels_column')
+        values_column = opts.get('values_column')
         
-        if data.empty or not labels_column or not values_column:
+        if not n or not labels_column or not values_column:
             return self.render_empty(config)
         
-        fig = go.Figure()
-        
-        fig.add_trace(go.Pie(
+        return go.Figure(data=[go.Pie(
             labels=data[labels_column],
             values=data[values_column],
-            hole=0.3 if config.get('options', {}).get('donut', False) else 0
-        ))
-        
-        return fig
+            hole=0.3 if opts.get('donut', False) else 0
+        )])
     
     def render_heatmap(self, data: pd.DataFrame, config: Dict[str, Any]) -> go.Figure:
         """Render heatmap"""
-        x_column = config.get('options', {}).get('x_column')
-        y_column = config.get('options', {}).get('y_column')
-        z_column = config.get('options', {}).get('z_column')
+        opts = config.get('options') or {}
+        n = 0 if data is None else len(data)
+        x_column = opts.get('x_column')
+        y_column = opts.get('y_column')
+        z_column = opts.get('z_column')
         
-        if data.empty or not all([x_column, y_column, z_column]):
+        if not n or not all([x_column, y_column, z_column]):
             return self.render_empty(config)
         
-        # Pivot data for heatmap
-        pivot_data = data.pivot_table(
-            index=y_column,
-            columns=x_column,
-            values=z_column,
-            aggfunc='mean'
-        )
-        
-        fig = go.Figure()
+        aggfunc = opts.get('aggfunc', 'mean')
+        if aggfunc == 'mean':
+            x_labels, y_labels, grid = _mean_grid(data, x_column, y_column, z_column)
+        else:
+            # Other aggregations go through pivot_table; categorical axes let the
+            # groupby reuse integer codes, and sort=False skips the final key sort
+            axes = {
+                column: data[column].astype('category')
+                for column in (x_column, y_column)
+                if pd.api.types.is_object_dtype(data[column]) or pd.api.types.is_string_dtype(data[column])
+            }
+            pivot_data = data.assign(**axes).pivot_table(
+                index=y_column,
+                columns=x_column,
+                values=z_column,
+                aggfunc=aggfunc,
+                observed=True,
+                sort=False
+            )
+            x_labels, y_labels, grid = pivot_data.columns, pivot_data.index, pivot_data.values
         
-        fig.add_trace(go.Heatmap(
-            x=pivot_data.columns,
-            y=pivot_data.index,
-            z=pivot_data.values,
+        return go.Figure(data=[go.Heatmap(
+            x=x_labels,
+            y=y_labels,
+            z=grid,
             colorscale='Blues'
-        ))
-        
-        return fig
+        )])
     
     def render_table(self, data: pd.DataFrame, config: Dict[str, Any]) -> go.Figure:
         """Render data table"""
-        columns = config.get('options', {}).get('columns', list(data.columns))
-        max_rows = config.get('options', {}).get('max_rows', 100)
+        opts = config.get('options') or {}
+        n = 0 if data is None else len(data)
+        columns = opts.get('columns', list(data.columns))
+        max_rows = opts.get('max_rows', 100)
         
-        if data.empty:
+        if not n:
             return self.render_empty(config)
         
-        # Limit columns and rows
-        display_data = data[columns].head(max_rows)
-        
-        fig = go.Figure()
+        # Limit rows only when needed, then hand Plotly one ndarray per column
+        display_data = data if n <= max_rows else data.iloc[:max_rows]
+        cell_values = [display_data[col].to_numpy() for col in columns]
         
-        fig.add_trace(go.Table(
+        return go.Figure(data=[go.Table(
             header=dict(
-                values=list(display_data.columns),
+                values=list(columns),
                 fill_color=self.theme['primary'],
                 font_color='white',
                 align='left'
             ),
             cells=dict(
-                values=[display_data[col] for col in display_data.columns],
+                values=cell_values,
                 fill_color='white',
                 align='left'
             )
-        ))
-        
-        return fig
+        )])
     
     def render_gauge(self, data: pd.DataFrame, config: Dict[str, Any]) -> go.Figure:
         """Render gauge chart"""
-        value_column = config.get('options', {}).get('value_column')
-        min_value = config.get('options', {}).get('min_value', 0)
-        max_value = config.get('options', {}).get('max_value', 100)
+        opts = config.get('options') or {}
+        n = 0 if data is None else len(data)
+        value_column = opts.get('value_column')
+        min_value = opts.get('min_value', 0)
+        max_value = opts.get('max_value', 100)
         
-        if data.empty or not value_column or value_column not in data.columns:
+        if not n or not value_column or value_column not in data.columns:
             value = 0
         else:
-            value = data[value_column].iloc[-1] if len(data) > 0 else 0
+            value = data[value_column].iat[-1]
         
-        fig = go.Figure()
-        
-        fig.add_trace(go.Indicator(
+        return go.Figure(data=[go.Indicator(
             mode="gauge+number",
             value=value,
             title={'text': config.get('title', 'Gauge')},
@@ -454,42 +744,43 @@ class ChartRenderer:
                     'value': (max_value - min_value) * 0.9 + min_value
                 }
             }
-        ))
-        
-        return fig
+        )])
     
     def render_empty(self, config: Dict[str, Any]) -> go.Figure:
         """Render empty chart placeholder"""
-        fig = go.Figure()
-        
-        fig.add_annotation(
-            text="No data available",
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-            font=dict(size=20, color="gray")
-        )
-        
-        fig.update_layout(
+        layout = dict(
+            annotations=[dict(
+                text="No data available",
+                xref="paper",
+                yref="paper",
+                x=0.5,
+                y=0.5,
+                showarrow=False,
+                font=dict(size=20, color="gray")
+            )],
             xaxis={'visible': False},
             yaxis={'visible': False},
             title=config.get('title', 'Chart')
         )
         
-        return fig
+        return go.Figure(layout=layout)
     
     def render_default(self, data: pd.DataFrame, config: Dict[str, Any]) -> go.Figure:
         """Default renderer for unknown chart types"""
         return self.render_empty(config)
 
 class InteractiveFilter:
-    """Manages interactive filters for dashboards"""
+    """Manages interactive filters for dashboards
+    
+    Parsed dates and option lists are cached per frame, so frames passed in
+    must not be modified in place; pass a new frame after changing the data.
+    """
     
     def __init__(self):
         self.filters = {}
         self.filter_values = {}
+        # id(frame) -> (weak reference, parsed datetime columns, option lists)
+        self._frame_caches: Dict[int, tuple] = {}
     
     def register_filter(self, filter_id: str, filter_config: Dict[str, Any]):
         """Register a filter"""
@@ -518,7 +809,9 @@ class InteractiveFilter:
     
     def apply_filters_to_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """Apply all active filters to data"""
-        filtered_data = data.copy()
+        mask = np.ones(len(data), dtype=bool)
+        # Numeric range filters are batched and evaluated in one fused pass
+        range_columns, range_lows, range_highs = [], [], []
         
         for filter_id, filter_config in self.filters.items():
             value = self.filter_values.get(filter_id)
@@ -528,60 +821,116 @@ class InteractiveFilter:
             column = filter_config.get('column')
             filter_type = filter_config.get('type')
             
-            if column not in filtered_data.columns:
+            if column not in data.columns:
                 continue
             
+            series = data[column]
+            
             if filter_type == 'select' and value:
-                filtered_data = filtered_data[filtered_data[column] == value]
+                matches = series == value
             
             elif filter_type == 'multiselect' and value:
-                filtered_data = filtered_data[filtered_data[column].isin(value)]
+                mask &= _isin_mask(series, value)
+                continue
             
             elif filter_type == 'range' and len(value) == 2:
-                filtered_data = filtered_data[
-                    (filtered_data[column] >= value[0]) & 
-                    (filtered_data[column] <= value[1])
-                ]
+                if pd.api.types.is_numeric_dtype(series) and _is_real(value[0]) and _is_real(value[1]):
+                    range_columns.append(series.to_numpy(dtype=np.float64, na_value=np.nan))
+                    range_lows.append(value[0])
+                    range_highs.append(value[1])
+                    continue
+                matches = (series >= value[0]) & (series <= value[1])
             
             elif filter_type == 'date_range' and len(value) == 2:
-                # Convert column to datetime if needed
-                if not pd.api.types.is_datetime64_any_dtype(filtered_data[column]):
-                    filtered_data[column] = pd.to_datetime(filtered_data[column])
-                
-                filtered_data = filtered_data[
-                    (filtered_data[column] >= value[0]) & 
-                    (filtered_data[column] <= value[1])
-                ]
+                if pd.api.types.is_datetime64_any_dtype(series):
+                    matches = (series >= value[0]) & (series <= value[1])
+                else:
+                    dates = self._datetime_values(data, column)
+                    mask &= (dates >= pd.Timestamp(value[0]).to_datetime64()) & \
+                            (dates <= pd.Timestamp(value[1]).to_datetime64())
+                    continue
+            
+            else:
+                continue
+            
+            mask &= matches.to_numpy(dtype=bool, na_value=False)
+        
+        if range_columns:
+            mask &= _range_mask(range_columns, range_lows, range_highs)
         
-        return filtered_data
+        # Boolean indexing always copies; skip it when every row passes
+        return data if mask.all() else data[mask]
+    
+    def _datetime_values(self, data: pd.DataFrame, column: str) -> np.ndarray:
+        """Parse a column to datetime64 once per data source and reuse it across refreshes"""
+        dt_cache = self._frame_cache(data)[1]
+        dates = dt_cache.get(column)
+        if dates is None:
+            dates = pd.to_datetime(data[column]).to_numpy(dtype='datetime64[ns]')
+            dt_cache[column] = dates
+        return dates
+    
+    def _frame_cache(self, data: pd.DataFrame) -> tuple:
+        """Column caches for one frame, dropped once the frame is garbage collected"""
+        # DataFrames are unhashable, so entries are keyed by id() and checked by identity
+        key = id(data)
+        entry = self._frame_caches.get(key)
+        if entry is None or entry[0]() is not data:
+            caches = self._frame_caches
+            
+            def drop(ref, key=key):
+                if caches.get(key, (None,))[0] is ref:
+                    del caches[key]
+            
+            entry = (weakref.ref(data, drop), {}, {})
+            caches[key] = entry
+        return entry
     
     def get_filter_options(self, data: pd.DataFrame, column: str) -> List[Any]:
         """Get available options for a filter column"""
-        if column in data.columns:
-            return sorted(data[column].dropna().unique().tolist())
-        return []
+        if column not in data.columns:
+            return []
+        
+        options_cache = self._frame_cache(data)[2]
+        options = options_cache.get(column)
+        if options is None:
+            series = data[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                # Unique integer codes give the categories in use without hashing labels
+                codes = series.cat.codes.to_numpy()
+                options = sorted(series.cat.categories[np.unique(codes[codes >= 0])].tolist())
+            else:
+                # np.unique returns the distinct values already sorted; the Index
+                # turns datetime64 back into Timestamps, as Series.unique() does
+                options = pd.Index(np.unique(series.dropna().to_numpy())).tolist()
+            options_cache[column] = options
+        return options
 
 # Example data generation functions
-def generate_sample_timeseries(days: int = 30) -> pd.DataFrame:
-    """Generate sample time series data"""
+_RNG = np.random.default_rng()
+
+def generate_sample_timeseries(days: int = 30, seed: Optional[int] = None) -> pd.DataFrame:
+    """Generate sample time series data (pass seed for reproducible output)"""
+    rng = _RNG if seed is None else np.random.default_rng(seed)
     dates = pd.date_range(end=datetime.now(), periods=days, freq='D')
     data = {
         'date': dates,
-        'value': np.random.randn(days).cumsum() + 100,
-        'category': np.random.choice(['A', 'B', 'C'], days),
-        'sales': np.random.randint(50, 200, days),
-        'profit': np.random.randint(10, 50, days)
+        'value': rng.standard_normal(days).cumsum() + 100,
+        'category': rng.choice(['A', 'B', 'C'], days),
+        'sales': rng.integers(50, 200, days),
+        'profit': rng.integers(10, 50, days)
     }
     return pd.DataFrame(data)
 
-def generate_sample_categorical() -> pd.DataFrame:
-    """Generate sample categorical data"""
+def generate_sample_categorical(seed: Optional[int] = None) -> pd.DataFrame:
+    """Generate sample categorical data (pass seed for reproducible output)"""
+    rng = _RNG if seed is None else np.random.default_rng(seed)
     categories = ['Electronics', 'Clothing', 'Food', 'Books', 'Sports']
     data = {
         'category': categories,
-        'sales': np.random.randint(1000, 5000, len(categories)),
-        'profit': np.random.randint(100, 1000, len(categories)),
-        'items': np.random.randint(50, 200, len(categories))
+        'sales': rng.integers(1000, 5000, len(categories)),
+        'profit': rng.integers(100, 1000, len(categories)),
+        'items': rng.integers(50, 200, len(categories))
     }
     return pd.DataFrame(data)
 
@@ -3,16 +3,23 @@ MIDAS Advanced Dashboard System
 Manages dashboard layouts, configurations, and persistence on Windows
 """
 
+import itertools
 import json
 import os
 import sqlite3
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, fields
 import uuid
 import logging
+from operator import itemgetter
+
+import numpy as np
 
 # Windows-specific imports
 import win32api
@@ -20,8 +27,145 @@ import win32con
 import ctypes
 from ctypes import wintypes
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# The logged-on user does not change during the process lifetime
+_CURRENT_USER = win32api.GetUserName()
+
+# Bump when the built-in themes or templates change so they are rewritten
+DEFAULTS_VERSION = 1
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize compact JSON for the config columns"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+def _json_dumps_pretty(obj: Any) -> bytes:
+    """Serialize indented JSON for files on disk"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def _json_loads(data) -> Any:
+    """Parse JSON from str or bytes"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def _pack_snapshot(config_json: str) -> Tuple[str, Optional[bytes]]:
+    """Split a version snapshot into its (config, config_compressed) columns"""
+    if ZSTD_AVAILABLE:
+        return '', zstandard.ZstdCompressor(level=3).compress(config_json.encode('utf-8'))
+    return config_json, None
+
+def _unpack_snapshot(config: str, config_compressed: Optional[bytes]):
+    """Get the JSON of a version snapshot from either column"""
+    if config_compressed is not None:
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard is required to read compressed dashboard snapshots")
+        return zstandard.ZstdDecompressor().decompress(config_compressed)
+    return config
+
+# SQL used on the hot paths, defined once so every call reuses the same
+# statement text from the connection's statement cache
+_SQL_SELECT_VERSION = "SELECT version FROM dashboards WHERE id = ?"
+_SQL_SAVE_VERSION = """
+    INSERT INTO dashboard_versions
+    (dashboard_id, version, config, config_compressed, created_at, author, change_description)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE_DASH = """
+    UPDATE dashboards
+    SET name = ?, description = ?, config = ?, theme = ?,
+        updated_at = ?, version = ?
+    WHERE id = ?
+"""
+_SQL_INSERT_DASH = """
+    INSERT INTO dashboards
+    (id, name, description, config, theme, author, created_at, updated_at, version)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_TOUCH_DASH = """
+    UPDATE dashboards
+    SET config = ?, updated_at = ?, version = version + 1
+    WHERE id = ? AND version = ?
+"""
+_SQL_SET_CONFIG = "UPDATE dashboards SET config = ? WHERE id = ?"
+_SQL_LOAD_DASH = "SELECT config, version FROM dashboards WHERE id = ?"
+_SQL_LIST_DASH = """
+    SELECT id, name, description, theme, author, created_at, updated_at, version
+    FROM dashboards
+    WHERE is_template = 0
+    ORDER BY updated_at DESC
+"""
+_SQL_GET_VERSIONS = """
+    SELECT version, created_at, author, change_description
+    FROM dashboard_versions
+    WHERE dashboard_id = ?
+    ORDER BY version DESC
+"""
+_SQL_SAVE_CHART_DELTA = """
+    INSERT INTO dashboard_versions
+    (dashboard_id, version, config, created_at, author, change_description, chart_op)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_HAS_VERSION = "SELECT 1 FROM dashboard_versions WHERE dashboard_id = ? AND version = ?"
+_SQL_RESTORE_SELECT = """
+    SELECT version, config, config_compressed, chart_op FROM dashboard_versions
+    WHERE dashboard_id = ? AND version <= ?
+    ORDER BY version DESC
+"""
+_SQL_RESTORE_UPDATE = """
+    UPDATE dashboards
+    SET updated_at = ?, version = version + 1
+    WHERE id = ?
+"""
+_SQL_INSERT_SHARE = """
+    INSERT INTO shared_dashboards
+    (dashboard_id, shared_path, shared_by, shared_at, expires_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_LOAD_CHARTS = """
+    SELECT chart_id, type, title, position_json, data_source_json,
+           options_json, filters_json
+    FROM charts
+    WHERE dashboard_id = ?
+    ORDER BY sort_order
+"""
+_SQL_INSERT_CHART = """
+    INSERT INTO charts
+    (dashboard_id, chart_id, sort_order, type, title,
+     position_json, data_source_json, options_json, filters_json)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_APPEND_CHART = """
+    INSERT INTO charts
+    (dashboard_id, chart_id, sort_order, type, title,
+     position_json, data_source_json, options_json, filters_json)
+    VALUES (?, ?, (SELECT COALESCE(MAX(sort_order), -1) + 1
+                   FROM charts WHERE dashboard_id = ?),
+            ?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE_CHART = """
+    UPDATE charts
+    SET type = ?, title = ?, position_json = ?, data_source_json = ?,
+        options_json = ?, filters_json = ?
+    WHERE dashboard_id = ? AND chart_id = ?
+"""
+_SQL_DELETE_CHART = "DELETE FROM charts WHERE dashboard_id = ? AND chart_id = ?"
+_SQL_DELETE_CHARTS = "DELETE FROM charts WHERE dashboard_id = ?"
+
 @dataclass
 class ChartConfig:
     """Configuration for a single chart"""
@@ -49,6 +193,137 @@ class DashboardConfig:
     version: int
     author: str
 
+_CHART_FIELDS = tuple(f.name for f in fields(ChartConfig))
+_DASHBOARD_FIELDS = tuple(f.name for f in fields(DashboardConfig))
+_chart_values = itemgetter(*_CHART_FIELDS)
+_dashboard_values = itemgetter(*_DASHBOARD_FIELDS)
+_CHARTS_INDEX = _DASHBOARD_FIELDS.index('charts')
+
+def _shallow_asdict(config: DashboardConfig) -> Dict[str, Any]:
+    """Map a dashboard to plain dicts without asdict's deep copy"""
+    data = {name: getattr(config, name) for name in _DASHBOARD_FIELDS}
+    data['charts'] = [
+        {name: getattr(chart, name) for name in _CHART_FIELDS}
+        for chart in config.charts
+    ]
+    return data
+
+def _dashboard_from_dict(data: Dict[str, Any],
+                         charts: Optional[List[ChartConfig]] = None) -> DashboardConfig:
+    """Build a dashboard and its charts with positional constructors"""
+    if charts is None:
+        charts = [ChartConfig(*_chart_values(chart)) for chart in data['charts']]
+    else:
+        data['charts'] = charts
+    values = list(_dashboard_values(data))
+    values[_CHARTS_INDEX] = charts
+    return DashboardConfig(*values)
+
+def _dashboard_row_json(config: DashboardConfig) -> str:
+    """Serialize the dashboard fields stored alongside the charts table"""
+    return _json_dumps({
+        name: getattr(config, name) for name in _DASHBOARD_FIELDS if name != 'charts'
+    })
+
+def _chart_row(dashboard_id: str, chart: ChartConfig, sort_order: int) -> tuple:
+    """Flatten a chart into a charts table row"""
+    return (dashboard_id, chart.id, sort_order, chart.type, chart.title,
+            _json_dumps(chart.position), _json_dumps(chart.data_source),
+            _json_dumps(chart.options), _json_dumps(chart.filters))
+
+def _apply_chart_delta(data: Dict[str, Any], op: str, delta: Dict[str, Any]):
+    """Replay one recorded chart edit onto a snapshot dict"""
+    data['updated_at'] = delta['updated_at']
+    if op == "add":
+        data['charts'].append(delta['chart'])
+    elif op == "remove":
+        data['charts'] = [c for c in data['charts'] if c['id'] != delta['chart_id']]
+    else:
+        data['charts'] = [delta['chart'] if c['id'] == delta['chart_id'] else c for c in data['charts']]
+
+def _chart_from_row(row) -> ChartConfig:
+    """Rebuild a chart from a charts table row"""
+    chart_id, chart_type, title, position, data_source, options, filters = row
+    return ChartConfig(chart_id, chart_type, title, _json_loads(data_source),
+                       _json_loads(position), _json_loads(options), _json_loads(filters))
+
+class MONITORINFOEX(ctypes.Structure):
+    """Win32 MONITORINFOEXW structure"""
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("rcMonitor", wintypes.RECT),
+        ("rcWork", wintypes.RECT),
+        ("dwFlags", wintypes.DWORD),
+        ("szDevice", wintypes.WCHAR * 32)
+    ]
+
+MonitorEnumProc = ctypes.WINFUNCTYPE(
+    wintypes.BOOL,
+    wintypes.HMONITOR,
+    wintypes.HDC,
+    ctypes.POINTER(wintypes.RECT),
+    wintypes.LPARAM
+)
+
+# Resolve the Win32 entry points once instead of per monitor, with
+# declared prototypes so ctypes skips generic argument conversion
+_GetMonitorInfoW = ctypes.windll.user32.GetMonitorInfoW
+_GetMonitorInfoW.argtypes = [wintypes.HMONITOR, ctypes.POINTER(MONITORINFOEX)]
+_GetMonitorInfoW.restype = wintypes.BOOL
+
+_EnumDisplayMonitors = ctypes.windll.user32.EnumDisplayMonitors
+_EnumDisplayMonitors.argtypes = [
+    wintypes.HDC, ctypes.POINTER(wintypes.RECT), MonitorEnumProc, wintypes.LPARAM
+]
+_EnumDisplayMonitors.restype = wintypes.BOOL
+
+try:
+    _GetDpiForMonitor = ctypes.windll.shcore.GetDpiForMonitor
+    _GetDpiForMonitor.argtypes = [
+        wintypes.HMONITOR, ctypes.c_int,
+        ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint)
+    ]
+    _GetDpiForMonitor.restype = ctypes.c_long  # HRESULT
+except (OSError, AttributeError):
+    # shcore.dll is Windows 8.1+
+    _GetDpiForMonitor = None
+
+def _monitor_enum_proc_impl(hMonitor, hdcMonitor, lprcMonitor, dwData):
+    """Callback for monitor enumeration; dwData points at the result list"""
+    monitors = ctypes.cast(dwData, ctypes.POINTER(ctypes.py_object)).contents.value
+    info = MONITORINFOEX()
+    info.cbSize = ctypes.sizeof(info)
+    if _GetMonitorInfoW(hMonitor, ctypes.byref(info)):
+        monitor_data = {
+            'name': info.szDevice,
+            'primary': bool(info.dwFlags & 1),  # MONITORINFOF_PRIMARY
+            'x': info.rcMonitor.left,
+            'y': info.rcMonitor.top,
+            'width': info.rcMonitor.right - info.rcMonitor.left,
+            'height': info.rcMonitor.bottom - info.rcMonitor.top,
+            'work_x': info.rcWork.left,
+            'work_y': info.rcWork.top,
+            'work_width': info.rcWork.right - info.rcWork.left,
+            'work_height': info.rcWork.bottom - info.rcWork.top
+        }
+        
+        # Get DPI
+        dpi_x = ctypes.c_uint(96)
+        dpi_y = ctypes.c_uint(96)
+        if _GetDpiForMonitor is not None:
+            _GetDpiForMonitor(
+                hMonitor, 0, ctypes.byref(dpi_x), ctypes.byref(dpi_y)
+            )
+        monitor_data['dpi_x'] = dpi_x.value
+        monitor_data['dpi_y'] = dpi_y.value
+        monitor_data['scale_factor'] = dpi_x.value / 96.0
+        
+        monitors.append(monitor_data)
+    return True
+
+# One persistent C thunk instead of a new one per enumeration
+_MONITOR_ENUM_PROC = MonitorEnumProc(_monitor_enum_proc_impl)
+
 class WindowsDisplayManager:
     """Manages Windows display settings and DPI awareness"""
     
@@ -73,59 +348,9 @@ class WindowsDisplayManager:
         """Get information about all monitors"""
         monitors = []
         
-        def monitor_enum_proc(hMonitor, hdcMonitor, lprcMonitor, dwData):
-            """Callback for monitor enumeration"""
-            # Define MONITORINFOEX structure
-            class MONITORINFOEX(ctypes.Structure):
-                _fields_ = [
-                    ("cbSize", wintypes.DWORD),
-                    ("rcMonitor", wintypes.RECT),
-                    ("rcWork", wintypes.RECT),
-                    ("dwFlags", wintypes.DWORD),
-                    ("szDevice", wintypes.WCHAR * 32)
-                ]
-            
-            info = MONITORINFOEX()
-            info.cbSize = ctypes.sizeof(info)
-            if ctypes.windll.user32.GetMonitorInfoW(hMonitor, ctypes.byref(info)):
-                monitor_data = {
-                    'name': info.szDevice,
-                    'primary': bool(info.dwFlags & 1),  # MONITORINFOF_PRIMARY
-                    'x': info.rcMonitor.left,
-                    'y': info.rcMonitor.top,
-                    'width': info.rcMonitor.right - info.rcMonitor.left,
-                    'height': info.rcMonitor.bottom - info.rcMonitor.top,
-                    'work_x': info.rcWork.left,
-                    'work_y': info.rcWork.top,
-                    'work_width': info.rcWork.right - info.rcWork.left,
-                    'work_height': info.rcWork.bottom - info.rcWork.top
-                }
-                
-                # Get DPI
-                dpi_x = ctypes.c_uint()
-                dpi_y = ctypes.c_uint()
-                ctypes.windll.shcore.GetDpiForMonitor(
-                    hMonitor, 0, ctypes.byref(dpi_x), ctypes.byref(dpi_y)
-                )
-                monitor_data['dpi_x'] = dpi_x.value
-                monitor_data['dpi_y'] = dpi_y.value
-                monitor_data['scale_factor'] = dpi_x.value / 96.0
-                
-                monitors.append(monitor_data)
-            return True
-        
-        # Enumerate monitors
-        MonitorEnumProc = ctypes.WINFUNCTYPE(
-            ctypes.c_bool,
-            ctypes.c_ulong,
-            ctypes.c_ulong,
-            ctypes.POINTER(wintypes.RECT),
-            ctypes.c_ulong
-        )
-        
-        ctypes.windll.user32.EnumDisplayMonitors(
-            None, None, MonitorEnumProc(monitor_enum_proc), 0
-        )
+        # Enumerate monitors; the list is handed to the callback through dwData
+        monitors_ref = ctypes.py_object(monitors)
+        _EnumDisplayMonitors(None, None, _MONITOR_ENUM_PROC, ctypes.addressof(monitors_ref))
         
         return monitors
     
@@ -167,6 +392,21 @@ class DashboardStorage:
         self.themes_dir = self.app_data_dir / 'themes'
         self.themes_dir.mkdir(exist_ok=True)
         
+        # Parsed theme/template files keyed by id, as (mtime_ns, data)
+        self._theme_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._template_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        # Directory listings, as (dir mtime_ns, entries)
+        self._theme_list: Optional[Tuple[int, List[Dict[str, Any]]]] = None
+        self._template_list: Optional[Tuple[int, List[Dict[str, Any]]]] = None
+        
+        # Single long-lived connection shared by all storage calls
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None,
+            cached_statements=256
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        
         # Initialize database
         self._init_database()
         
@@ -175,8 +415,11 @@ class DashboardStorage:
     
     def _init_database(self):
         """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
+        
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
         
         # Dashboards table
         cursor.execute("""
@@ -201,9 +444,11 @@ class DashboardStorage:
                 dashboard_id TEXT NOT NULL,
                 version INTEGER NOT NULL,
                 config TEXT NOT NULL,
+                config_compressed BLOB,
                 created_at TEXT,
                 author TEXT,
                 change_description TEXT,
+                chart_op TEXT,
                 FOREIGN KEY (dashboard_id) REFERENCES dashboards(id)
             )
         """)
@@ -222,11 +467,107 @@ class DashboardStorage:
             )
         """)
         
-        conn.commit()
-        conn.close()
+        # Indexes for dashboard listings, version history and share lookups
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_dash_updated
+            ON dashboards(is_template, updated_at DESC)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_ver_dash
+            ON dashboard_versions(dashboard_id, version DESC)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_shared_dash
+            ON shared_dashboards(dashboard_id)
+        """)
+        
+        # Charts table, one row per chart so edits touch a single row
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS charts (
+                dashboard_id TEXT NOT NULL,
+                chart_id TEXT NOT NULL,
+                sort_order INTEGER NOT NULL,
+                type TEXT,
+                title TEXT,
+                position_json TEXT,
+                data_source_json TEXT,
+                options_json TEXT,
+                filters_json TEXT,
+                PRIMARY KEY (dashboard_id, chart_id),
+                FOREIGN KEY (dashboard_id) REFERENCES dashboards(id)
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_charts_dash
+            ON charts(dashboard_id, sort_order)
+        """)
+        
+        # Move charts embedded in older config blobs into the charts table
+        if cursor.execute("PRAGMA user_version").fetchone()[0] < 1:
+            with self._transaction() as tx:
+                for dashboard_id, config_json in tx.execute(
+                    "SELECT id, config FROM dashboards"
+                ).fetchall():
+                    self._write_snapshot(tx, dashboard_id, _json_loads(config_json))
+                tx.execute("PRAGMA user_version = 1")
+        
+        # Version snapshots are zstd-compressed into config_compressed when available
+        if cursor.execute("PRAGMA user_version").fetchone()[0] < 2:
+            with self._transaction() as tx:
+                columns = {row[1] for row in tx.execute("PRAGMA table_info(dashboard_versions)")}
+                if 'config_compressed' not in columns:
+                    tx.execute("ALTER TABLE dashboard_versions ADD COLUMN config_compressed BLOB")
+                if ZSTD_AVAILABLE:
+                    tx.executemany(
+                        "UPDATE dashboard_versions SET config = ?, config_compressed = ? WHERE id = ?",
+                        [(*_pack_snapshot(config_json), row_id) for row_id, config_json in tx.execute(
+                            "SELECT id, config FROM dashboard_versions WHERE config_compressed IS NULL"
+                        ).fetchall()]
+                    )
+                tx.execute("PRAGMA user_version = 2")
+        
+        # Incremental chart edits are recorded as deltas marked by chart_op
+        if cursor.execute("PRAGMA user_version").fetchone()[0] < 3:
+            with self._transaction() as tx:
+                columns = {row[1] for row in tx.execute("PRAGMA table_info(dashboard_versions)")}
+                if 'chart_op' not in columns:
+                    tx.execute("ALTER TABLE dashboard_versions ADD COLUMN chart_op TEXT")
+                tx.execute("PRAGMA user_version = 3")
+    
+    @staticmethod
+    def _replace_charts(cursor, dashboard_id: str, charts: List[ChartConfig]):
+        """Rewrite every chart row of a dashboard"""
+        cursor.execute(_SQL_DELETE_CHARTS, (dashboard_id,))
+        cursor.executemany(_SQL_INSERT_CHART, [_chart_row(dashboard_id, chart, i) for i, chart in enumerate(charts)])
+    
+    def _write_snapshot(self, cursor, dashboard_id: str, data: Dict[str, Any]):
+        """Store a full config snapshot as a dashboard row plus chart rows"""
+        charts = [ChartConfig(*_chart_values(chart)) for chart in data.pop('charts', [])]
+        cursor.execute(_SQL_SET_CONFIG, (_json_dumps(data), dashboard_id))
+        self._replace_charts(cursor, dashboard_id, charts)
+    
+    @contextmanager
+    def _transaction(self):
+        """Run a block of writes as one IMMEDIATE transaction"""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
     
     def _init_defaults(self):
         """Initialize default templates and themes"""
+        sentinel = self.app_data_dir / '.defaults_initialized'
+        try:
+            if sentinel.read_text().strip() == str(DEFAULTS_VERSION):
+                return
+        except OSError:
+            pass
+        
         # Default themes
         default_themes = {
             'light': {
@@ -267,8 +608,7 @@ class DashboardStorage:
         for theme_id, theme_data in default_themes.items():
             theme_path = self.themes_dir / f"{theme_id}.json"
             if not theme_path.exists():
-                with open(theme_path, 'w') as f:
-                    json.dump(theme_data, f, indent=2)
+                theme_path.write_bytes(_json_dumps_pretty(theme_data))
         
         # Default templates
         default_templates = {
@@ -347,53 +687,111 @@ class DashboardStorage:
         }
         
         for template_id, template_data in default_templates.items():
+            template_path = self.templates_dir / f"{template_id}.json"
+            content = _json_dumps_pretty(template_data)
+            try:
+                if template_path.read_bytes() == content:
+                    continue
+            except OSError:
+                pass
             self.save_template(template_id, template_data)
+        
+        sentinel.write_text(str(DEFAULTS_VERSION))
     
     def save_dashboard(self, config: DashboardConfig) -> bool:
         """Save dashboard configuration"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            # Convert config to JSON; charts are stored in their own table
+            config_json = _dashboard_row_json(config)
+            now_iso = datetime.now().isoformat()
             
-            # Convert config to JSON
-            config_json = json.dumps(asdict(config))
+            with self._transaction() as cursor:
+                # Check if exists
+                cursor.execute(_SQL_SELECT_VERSION, (config.id,))
+                existing = cursor.fetchone()
+                
+                if existing:
+                    # Update existing
+                    old_version = existing[0]
+                    new_version = old_version + 1
+                    
+                    # Save version history as a full snapshot
+                    cursor.execute(_SQL_SAVE_VERSION, (
+                        config.id, old_version,
+                        *_pack_snapshot(_json_dumps(_shallow_asdict(config))),
+                        now_iso, config.author, "Dashboard updated"
+                    ))
+                    
+                    # Update dashboard
+                    cursor.execute(_SQL_UPDATE_DASH, (
+                        config.name, config.description, config_json, config.theme,
+                        now_iso, new_version, config.id
+                    ))
+                else:
+                    # Insert new
+                    cursor.execute(_SQL_INSERT_DASH, (
+                        config.id, config.name, config.description, config_json,
+                        config.theme, config.author, config.created_at, config.updated_at, 1
+                    ))
+                
+                self._replace_charts(cursor, config.id, config.charts)
             
-            # Check if exists
-            cursor.execute("SELECT version FROM dashboards WHERE id = ?", (config.id,))
-            existing = cursor.fetchone()
+            return True
             
-            if existing:
-                # Update existing
-                old_version = existing[0]
-                new_version = old_version + 1
+        except Exception as e:
+            logger.error(f"Failed to save dashboard: {e}")
+            return False
+    
+    def save_dashboard_incremental(self, config: DashboardConfig, changed_chart_id: str,
+                                   op: str, expected_version: int) -> bool:
+        """Persist one chart edit made to a dashboard loaded at expected_version.
+        
+        Fails without writing when the stored version has moved on.
+        """
+        try:
+            chart = None
+            if op != "remove":
+                chart = next((c for c in config.charts if c.id == changed_chart_id), None)
+                if chart is None:
+                    return False
+            now_iso = datetime.now().isoformat()
+            
+            with self._transaction() as cursor:
+                # A matching version proves every other stored field equals config's
+                cursor.execute(_SQL_TOUCH_DASH, (
+                    _dashboard_row_json(config), config.updated_at, config.id, expected_version
+                ))
+                if cursor.rowcount == 0:
+                    return False
                 
-                # Save version history
-                cursor.execute("""
-                    INSERT INTO dashboard_versions 
-                    (dashboard_id, version, config, created_at, author, change_description)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (config.id, old_version, config_json, datetime.now().isoformat(),
-                     config.author, "Dashboard updated"))
+                if op == "remove":
+                    cursor.execute(_SQL_DELETE_CHART, (config.id, changed_chart_id))
+                elif op == "add":
+                    cursor.execute(_SQL_APPEND_CHART, (config.id, chart.id, config.id) + _chart_row(config.id, chart, 0)[3:])
+                else:
+                    cursor.execute(_SQL_UPDATE_CHART, _chart_row(config.id, chart, 0)[3:] + (config.id, chart.id))
+                if cursor.rowcount == 0:
+                    raise ValueError(f"Chart {changed_chart_id} not found")
                 
-                # Update dashboard
-                cursor.execute("""
-                    UPDATE dashboards 
-                    SET name = ?, description = ?, config = ?, theme = ?,
-                        updated_at = ?, version = ?
-                    WHERE id = ?
-                """, (config.name, config.description, config_json, config.theme,
-                     datetime.now().isoformat(), new_version, config.id))
-            else:
-                # Insert new
-                cursor.execute("""
-                    INSERT INTO dashboards 
-                    (id, name, description, config, theme, author, created_at, updated_at, version)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (config.id, config.name, config.description, config_json,
-                     config.theme, config.author, config.created_at, config.updated_at, 1))
+                # History keeps only the chart delta when the previous version has a
+                # row to replay it onto; after a create or restore it takes a snapshot
+                if cursor.execute(_SQL_HAS_VERSION, (config.id, expected_version - 1)).fetchone():
+                    delta = {
+                        'updated_at': config.updated_at,
+                        'chart_id': changed_chart_id,
+                        'chart': {name: getattr(chart, name) for name in _CHART_FIELDS} if chart else None
+                    }
+                    cursor.execute(_SQL_SAVE_CHART_DELTA, (
+                        config.id, expected_version, _json_dumps(delta),
+                        now_iso, config.author, "Dashboard updated", op
+                    ))
+                else:
+                    cursor.execute(_SQL_SAVE_VERSION, (
+                        config.id, expected_version, *_pack_snapshot(_json_dumps(_shallow_asdict(config))),
+                        now_iso, config.author, "Dashboard updated"
+                    ))
             
-            conn.commit()
-            conn.close()
+            logger.debug(f"Saved {op} of chart {changed_chart_id} on dashboard {config.id}")
             return True
             
         except Exception as e:
@@ -402,22 +800,19 @@ class DashboardStorage:
     
     def load_dashboard(self, dashboard_id: str) -> Optional[DashboardConfig]:
         """Load dashboard configuration"""
+        loaded = self.load_dashboard_versioned(dashboard_id)
+        return loaded[0] if loaded else None
+    
+    def load_dashboard_versioned(self, dashboard_id: str) -> Optional[Tuple[DashboardConfig, int]]:
+        """Load a dashboard together with its stored version number"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT config FROM dashboards WHERE id = ?", (dashboard_id,))
-            result = cursor.fetchone()
-            
-            conn.close()
+            with self._lock:
+                result = self._conn.execute(_SQL_LOAD_DASH, (dashboard_id,)).fetchone()
+                chart_rows = self._conn.execute(_SQL_LOAD_CHARTS, (dashboard_id,)).fetchall()
             
             if result:
-                config_data = json.loads(result[0])
-                # Convert chart configs
-                config_data['charts'] = [
-                    ChartConfig(**chart) for chart in config_data['charts']
-                ]
-                return DashboardConfig(**config_data)
+                charts = [_chart_from_row(row) for row in chart_rows]
+                return _dashboard_from_dict(_json_loads(result[0]), charts), result[1]
             
             return None
             
@@ -425,130 +820,157 @@ class DashboardStorage:
             logger.error(f"Failed to load dashboard: {e}")
             return None
     
+    def get_dashboard_version(self, dashboard_id: str) -> Optional[int]:
+        """Get the stored version number of a dashboard"""
+        with self._lock:
+            result = self._conn.execute(_SQL_SELECT_VERSION, (dashboard_id,)).fetchone()
+        return result[0] if result else None
+    
     def list_dashboards(self) -> List[Dict[str, Any]]:
         """List all dashboards"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._lock:
+                rows = self._conn.execute(_SQL_LIST_DASH).fetchall()
             
-            cursor.execute("""
-                SELECT id, name, description, theme, author, created_at, updated_at, version
-                FROM dashboards
-                WHERE is_template = 0
-                ORDER BY updated_at DESC
-            """)
-            
-            dashboards = []
-            for row in cursor.fetchall():
-                dashboards.append({
-                    'id': row[0],
-                    'name': row[1],
-                    'description': row[2],
-                    'theme': row[3],
-                    'author': row[4],
-                    'created_at': row[5],
-                    'updated_at': row[6],
-                    'version': row[7]
-                })
-            
-            conn.close()
-            return dashboards
+            return [dict(row) for row in rows]
             
         except Exception as e:
             logger.error(f"Failed to list dashboards: {e}")
             return []
     
+    @staticmethod
+    def _read_json_cached(path: Path, cache: Dict[str, Tuple[int, Dict[str, Any]]]
+                          ) -> Optional[Dict[str, Any]]:
+        """Parse a JSON file, reusing the cached result while its mtime is unchanged"""
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            cache.pop(path.stem, None)
+            return None
+        cached = cache.get(path.stem)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        data = _json_loads(path.read_bytes())
+        cache[path.stem] = (mtime, data)
+        return data
+    
     def save_template(self, template_id: str, template_data: Dict[str, Any]) -> bool:
         """Save dashboard template"""
         template_path = self.templates_dir / f"{template_id}.json"
         try:
-            with open(template_path, 'w') as f:
-                json.dump(template_data, f, indent=2)
+            template_path.write_bytes(_json_dumps_pretty(template_data))
+            # Overwriting an existing file does not touch the directory mtime
+            self._template_list = None
             return True
         except Exception as e:
             logger.error(f"Failed to save template: {e}")
             return False
     
     def load_template(self, template_id: str) -> Optional[Dict[str, Any]]:
-        """Load dashboard template"""
+        """Load dashboard template (cached; treat the result as read-only)"""
         template_path = self.templates_dir / f"{template_id}.json"
-        if template_path.exists():
-            try:
-                with open(template_path, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Failed to load template: {e}")
+        try:
+            return self._read_json_cached(template_path, self._template_cache)
+        except Exception as e:
+            logger.error(f"Failed to load template: {e}")
         return None
     
     def list_templates(self) -> List[Dict[str, Any]]:
         """List available templates"""
-        templates = []
-        for template_file in self.templates_dir.glob('*.json'):
-            try:
-                with open(template_file, 'r') as f:
-                    template_data = json.load(f)
+        dir_mtime = self.templates_dir.stat().st_mtime_ns
+        if self._template_list is None or self._template_list[0] != dir_mtime:
+            templates = []
+            for template_file in self.templates_dir.glob('*.json'):
+                try:
+                    template_data = self._read_json_cached(template_file, self._template_cache)
                     templates.append({
                         'id': template_file.stem,
                         'name': template_data.get('name', template_file.stem),
                         'description': template_data.get('description', '')
                     })
-            except:
-                pass
-        return templates
+                except:
+                    pass
+            self._template_list = (dir_mtime, templates)
+        return [dict(t) for t in self._template_list[1]]
     
     def load_theme(self, theme_id: str) -> Optional[Dict[str, Any]]:
         """Load theme configuration"""
         theme_path = self.themes_dir / f"{theme_id}.json"
-        if theme_path.exists():
-            try:
-                with open(theme_path, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Failed to load theme: {e}")
+        try:
+            theme = self._read_json_cached(theme_path, self._theme_cache)
+            return dict(theme) if theme is not None else None
+        except Exception as e:
+            logger.error(f"Failed to load theme: {e}")
         return None
     
     def list_themes(self) -> List[Dict[str, Any]]:
         """List available themes"""
-        themes = []
-        for theme_file in self.themes_dir.glob('*.json'):
-            try:
-                with open(theme_file, 'r') as f:
-                    theme_data = json.load(f)
+        dir_mtime = self.themes_dir.stat().st_mtime_ns
+        if self._theme_list is None or self._theme_list[0] != dir_mtime:
+            themes = []
+            for theme_file in self.themes_dir.glob('*.json'):
+                try:
+                    theme_data = self._read_json_cached(theme_file, self._theme_cache)
                     themes.append({
                         'id': theme_file.stem,
                         'name': theme_data.get('name', theme_file.stem)
                     })
-            except:
-                pass
-        return themes
+                except:
+                    pass
+            self._theme_list = (dir_mtime, themes)
+        return [dict(t) for t in self._theme_list[1]]
     
     def export_dashboard(self, dashboard_id: str, export_path: str) -> bool:
         """Export dashboard to file"""
         config = self.load_dashboard(dashboard_id)
         if config:
             try:
-                with open(export_path, 'w') as f:
-                    json.dump(asdict(config), f, indent=2)
+                with open(export_path, 'wb') as f:
+                    f.write(_json_dumps_pretty(_shallow_asdict(config)))
                 return True
             except Exception as e:
                 logger.error(f"Failed to export dashboard: {e}")
         return False
     
+    def export_dashboard_raw(self, dashboard_id: str, export_path: str) -> bool:
+        """Export dashboard as compact JSON spliced from the stored columns"""
+        try:
+            with self._lock:
+                result = self._conn.execute(_SQL_LOAD_DASH, (dashboard_id,)).fetchone()
+                chart_rows = self._conn.execute(_SQL_LOAD_CHARTS, (dashboard_id,)).fetchall()
+            if not result:
+                return False
+            
+            # Chart JSON columns are copied verbatim; only the scalars are encoded
+            charts = ','.join(
+                '{"id":%s,"type":%s,"title":%s,"position":%s,"data_source":%s,'
+                '"options":%s,"filters":%s}' % (
+                    _json_dumps(chart_id), _json_dumps(chart_type), _json_dumps(title),
+                    position, data_source, options, filters
+                )
+                for chart_id, chart_type, title, position, data_source, options, filters
+                in chart_rows
+            )
+            with open(export_path, 'w', encoding='utf-8') as f:
+                f.write(f'{result[0][:-1]},"charts":[{charts}]}}')
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to export dashboard: {e}")
+            return False
+    
     def import_dashboard(self, import_path: str) -> Optional[str]:
         """Import dashboard from file"""
         try:
-            with open(import_path, 'r') as f:
-                config_data = json.load(f)
+            with open(import_path, 'rb') as f:
+                config_data = _json_loads(f.read())
             
             # Generate new ID to avoid conflicts
             config_data['id'] = str(uuid.uuid4())
             config_data['imported_at'] = datetime.now().isoformat()
             
             # Convert to DashboardConfig
-            config_data['charts'] = [
-                ChartConfig(**chart) for chart in config_data['charts']
-            ]
-            config = DashboardConfig(**config_data)
+            config = _dashboard_from_dict(config_data)
             
             if self.save_dashboard(config):
                 return config.id
@@ -558,31 +980,65 @@ class DashboardStorage:
         
         return None
     
+    @staticmethod
+    def _prepare_import(import_path: str) -> Optional[Tuple[str, tuple, List[tuple]]]:
+        """Decode an exported dashboard and build its rows under a fresh id"""
+        try:
+            with open(import_path, 'rb') as f:
+                config_data = _json_loads(f.read())
+            config_data['id'] = str(uuid.uuid4())
+            config = _dashboard_from_dict(config_data)
+            
+            dashboard_row = (config.id, config.name, config.description,
+                             _dashboard_row_json(config), config.theme, config.author,
+                             config.created_at, config.updated_at, 1)
+            chart_rows = [_chart_row(config.id, chart, i) for i, chart in enumerate(config.charts)]
+            return config.id, dashboard_row, chart_rows
+        except Exception as e:
+            logger.error(f"Failed to import dashboard {import_path}: {e}")
+            return None
+    
+    def import_dashboards_bulk(self, paths: List[str]) -> List[Optional[str]]:
+        """Import many dashboard files, inserting them in one transaction"""
+        if not paths:
+            return []
+        
+        # Decoding and row building overlap across files; SQLite writes stay serialized
+        with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+            prepared = list(executor.map(self._prepare_import, paths))
+        
+        imported = [p for p in prepared if p is not None]
+        if not imported:
+            return [None] * len(paths)
+        
+        try:
+            with self._transaction() as cursor:
+                cursor.executemany(_SQL_INSERT_DASH, [p[1] for p in imported])
+                cursor.executemany(_SQL_INSERT_CHART, [row for p in imported for row in p[2]])
+        except Exception as e:
+            logger.error(f"Failed to import dashboards: {e}")
+            return [None] * len(paths)
+        
+        return [p[0] if p is not None else None for p in prepared]
+    
     def share_dashboard(self, dashboard_id: str, share_path: str, 
                        expires_days: Optional[int] = None) -> bool:
         """Share dashboard via network path"""
         try:
             # Export dashboard to share path
-            if not self.export_dashboard(dashboard_id, share_path):
+            if not self.export_dashboard_raw(dashboard_id, share_path):
                 return False
             
             # Record share
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
+            now = datetime.now()
             expires_at = None
             if expires_days:
-                expires_at = (datetime.now() + timedelta(days=expires_days)).isoformat()
+                expires_at = (now + timedelta(days=expires_days)).isoformat()
             
-            cursor.execute("""
-                INSERT INTO shared_dashboards
-                (dashboard_id, shared_path, shared_by, shared_at, expires_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (dashboard_id, share_path, win32api.GetUserName(),
-                 datetime.now().isoformat(), expires_at))
-            
-            conn.commit()
-            conn.close()
+            with self._transaction() as cursor:
+                cursor.execute(_SQL_INSERT_SHARE, (
+                    dashboard_id, share_path, _CURRENT_USER, now.isoformat(), expires_at
+                ))
             
             return True
             
@@ -593,27 +1049,10 @@ class DashboardStorage:
     def get_dashboard_versions(self, dashboard_id: str) -> List[Dict[str, Any]]:
         """Get version history for dashboard"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT version, created_at, author, change_description
-                FROM dashboard_versions
-                WHERE dashboard_id = ?
-                ORDER BY version DESC
-            """, (dashboard_id,))
-            
-            versions = []
-            for row in cursor.fetchall():
-                versions.append({
-                    'version': row[0],
-                    'created_at': row[1],
-                    'author': row[2],
-                    'change_description': row[3]
-                })
+            with self._lock:
+                rows = self._conn.execute(_SQL_GET_VERSIONS, (dashboard_id,)).fetchall()
             
-            conn.close()
-            return versions
+            return [dict(row) for row in rows]
             
         except Exception as e:
             logger.error(f"Failed to get dashboard versions: {e}")
@@ -622,30 +1061,29 @@ class DashboardStorage:
     def restore_dashboard_version(self, dashboard_id: str, version: int) -> bool:
         """Restore dashboard to specific version"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get version config
-            cursor.execute("""
-                SELECT config FROM dashboard_versions
-                WHERE dashboard_id = ? AND version = ?
-            """, (dashboard_id, version))
-            
-            result = cursor.fetchone()
-            if not result:
-                return False
-            
-            config_json = result[0]
-            
-            # Update dashboard
-            cursor.execute("""
-                UPDATE dashboards
-                SET config = ?, updated_at = ?, version = version + 1
-                WHERE id = ?
-            """, (config_json, datetime.now().isoformat(), dashboard_id))
-            
-            conn.commit()
-            conn.close()
+            with self._transaction() as cursor:
+                # Get version config: walk back to the nearest full snapshot,
+                # collecting the chart deltas recorded after it
+                rows = cursor.execute(_SQL_RESTORE_SELECT, (dashboard_id, version))
+                first = rows.fetchone()
+                if not first or first[0] != version:
+                    return False
+                
+                deltas = []
+                for _, config, config_compressed, chart_op in itertools.chain([first], rows):
+                    data = _json_loads(_unpack_snapshot(config, config_compressed))
+                    if chart_op is None:
+                        break
+                    deltas.append((chart_op, data))
+                else:
+                    raise ValueError(f"No snapshot to replay version {version} onto")
+                
+                for chart_op, delta in reversed(deltas):
+                    _apply_chart_delta(data, chart_op, delta)
+                
+                # Update dashboard
+                cursor.execute(_SQL_RESTORE_UPDATE, (datetime.now().isoformat(), dashboard_id))
+                self._write_snapshot(cursor, dashboard_id, data)
             
             return True
             
@@ -660,11 +1098,47 @@ class DashboardManager:
         self.storage = DashboardStorage()
         self.display_manager = WindowsDisplayManager()
         self.current_dashboard = None
+        # Dashboards being edited, kept in memory between chart mutations
+        # together with the stored version they were loaded at
+        self._open: Dict[str, Tuple[DashboardConfig, int]] = {}
+    
+    def _get_open(self, dashboard_id: str) -> Optional[Tuple[DashboardConfig, int]]:
+        """Get an open dashboard and its version, loading it on first use"""
+        entry = self._open.get(dashboard_id)
+        if entry is None:
+            entry = self.storage.load_dashboard_versioned(dashboard_id)
+            if entry is not None:
+                self._open[dashboard_id] = entry
+        return entry
+    
+    def _edit_chart(self, dashboard_id: str, chart_id: str, op: str,
+                    mutate: Callable[[DashboardConfig], bool]) -> bool:
+        """Apply a chart mutation to the open dashboard and persist it.
+        
+        The write is rejected when storage changed since the dashboard was
+        loaded; it is then reloaded and the mutation applied once more.
+        """
+        for _ in range(2):
+            entry = self._get_open(dashboard_id)
+            if entry is None:
+                return False
+            config, version = entry
+            if not mutate(config):
+                return False
+            config.updated_at = datetime.now().isoformat()
+            
+            if self.storage.save_dashboard_incremental(config, chart_id, op, version):
+                self._open[dashboard_id] = (config, version + 1)
+                return True
+            self._open.pop(dashboard_id, None)
+        
+        return False
     
     def create_dashboard(self, name: str, description: str = "", 
                         template_id: Optional[str] = None) -> DashboardConfig:
         """Create new dashboard"""
         dashboard_id = str(uuid.uuid4())
+        now_iso = datetime.now().isoformat()
         
         if template_id:
             template = self.storage.load_template(template_id)
@@ -675,7 +1149,7 @@ class DashboardManager:
                         type=chart['type'],
                         title=chart['title'],
                         data_source={},
-                        position=chart['position'],
+                        position=dict(chart['position']),
                         options={},
                         filters=[]
                     )
@@ -698,22 +1172,19 @@ class DashboardManager:
             theme='light',
             filters=[],
             refresh_interval=None,
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
             version=1,
-            author=win32api.GetUserName()
+            author=_CURRENT_USER
         )
         
-        self.storage.save_dashboard(config)
+        if self.storage.save_dashboard(config):
+            self._open[dashboard_id] = (config, 1)
         return config
     
     def add_chart(self, dashboard_id: str, chart_type: str, 
                   title: str, position: Dict[str, int]) -> Optional[ChartConfig]:
         """Add chart to dashboard"""
-        config = self.storage.load_dashboard(dashboard_id)
-        if not config:
-            return None
-        
         chart = ChartConfig(
             id=str(uuid.uuid4()),
             type=chart_type,
@@ -724,10 +1195,11 @@ class DashboardManager:
             filters=[]
         )
         
-        config.charts.append(chart)
-        config.updated_at = datetime.now().isoformat()
+        def add(config: DashboardConfig) -> bool:
+            config.charts.append(chart)
+            return True
         
-        if self.storage.save_dashboard(config):
+        if self._edit_chart(dashboard_id, chart.id, "add", add):
             return chart
         
         return None
@@ -735,31 +1207,27 @@ class DashboardManager:
     def update_chart(self, dashboard_id: str, chart_id: str, 
                     updates: Dict[str, Any]) -> bool:
         """Update chart configuration"""
-        config = self.storage.load_dashboard(dashboard_id)
-        if not config:
+        def update(config: DashboardConfig) -> bool:
+            for chart in config.charts:
+                if chart.id == chart_id:
+                    for key, value in updates.items():
+                        if hasattr(chart, key):
+                            setattr(chart, key, value)
+                    return True
             return False
         
-        for chart in config.charts:
-            if chart.id == chart_id:
-                for key, value in updates.items():
-                    if hasattr(chart, key):
-                        setattr(chart, key, value)
-                
-                config.updated_at = datetime.now().isoformat()
-                return self.storage.save_dashboard(config)
-        
-        return False
+        return self._edit_chart(dashboard_id, chart_id, "update", update)
     
     def remove_chart(self, dashboard_id: str, chart_id: str) -> bool:
         """Remove chart from dashboard"""
-        config = self.storage.load_dashboard(dashboard_id)
-        if not config:
-            return False
-        
-        config.charts = [c for c in config.charts if c.id != chart_id]
-        config.updated_at = datetime.now().isoformat()
+        def remove(config: DashboardConfig) -> bool:
+            charts = [c for c in config.charts if c.id != chart_id]
+            if len(charts) == len(config.charts):
+                return False
+            config.charts = charts
+            return True
         
-        return self.storage.save_dashboard(config)
+        return self._edit_chart(dashboard_id, chart_id, "remove", remove)
     
     def get_optimal_layout(self, num_charts: int) -> List[Dict[str, int]]:
         """Get optimal layout positions for number of charts"""
@@ -786,17 +1254,13 @@ class DashboardManager:
         else:
             # Grid layout
             cols = 3
-            positions = []
-            for i in range(num_charts):
-                row = (i // cols) * 3
-                col = (i % cols) * 4
-                positions.append({
-                    'row': row,
-                    'col': col,
-                    'width': 4,
-                    'height': 3
-                })
-            return positions
+            i = np.arange(num_charts)
+            rows = ((i // cols) * 3).tolist()
+            col_positions = ((i % cols) * 4).tolist()
+            return [
+                {'row': row, 'col': col, 'width': 4, 'height': 3}
+                for row, col in zip(rows, col_positions)
+            ]
 
 # Utility functions
 def get_user_dashboards_path() -> Path:
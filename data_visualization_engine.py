@@ -9,47 +9,246 @@ import plotly.graph_objects as go
 import plotly.figure_factory as ff
 from plotly.subplots import make_subplots
 import numpy as np
+import atexit
+import hashlib
 import json
+import operator
+import os
 import re
 import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-import chardet
 from datetime import datetime
 import warnings
+from functools import lru_cache
+from itertools import combinations, islice
 warnings.filterwarnings('ignore')
 
+try:
+    import cchardet as chardet  # faust-cchardet, C implementation of the chardet API
+    CCHARDET_AVAILABLE = True
+except ImportError:
+    import chardet
+    CCHARDET_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Add current directory to path
 sys.path.append(str(Path(__file__).parent))
 
 from structured_data_indexer import MultiCollectionQdrantIndexer
 
+# Dataset analyses persist across restarts, keyed by path, size and mtime
+ANALYSIS_CACHE_PATH = Path.home() / '.midas_cache' / 'analyses.json'
+ANALYSIS_CACHE_SIZE = 256
+SCATTER_SUGGESTION_LIMIT = 10  # Most correlated numeric pairs offered as scatter plots
+
+_COMPARISON_OPS = {
+    '=': operator.eq,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le
+}
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, error_model='numpy')
+    def _pearson_matrix(X):
+        """Pearson correlation of the columns of a NaN-free float64 matrix"""
+        n, m = X.shape
+        mu = np.empty(m)
+        sd = np.empty(m)
+        for j in prange(m):
+            col = X[:, j]
+            mu[j] = col.mean()
+            # A constant column's std is rounding noise (e.g. 1e-15 for 0.1s),
+            # not zero, so test the values themselves
+            sd[j] = 0.0 if col.min() == col.max() else col.std()
+        C = np.empty((m, m))
+        for i in prange(m):
+            for j in range(i, m):
+                if sd[i] == 0.0 or sd[j] == 0.0:
+                    c = np.nan  # undefined for constant columns, as in pandas
+                else:
+                    s = 0.0
+                    for k in range(n):
+                        s += (X[k, i] - mu[i]) * (X[k, j] - mu[j])
+                    c = min(max(s / (n * sd[i] * sd[j]), -1.0), 1.0)
+                C[i, j] = c
+                C[j, i] = c
+        return C
+
+def _correlation_matrix(numeric_df: pd.DataFrame) -> pd.DataFrame:
+    """Column correlation matrix; complete real-valued data goes through the JIT kernel"""
+    if (NUMBA_AVAILABLE and len(numeric_df) > 1
+            and all(dtype.kind in 'iuf' for dtype in numeric_df.dtypes)):
+        arr = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        # pandas correlates pairwise-complete rows, so only complete finite data skips it
+        if np.isfinite(arr).all():
+            corr = _pearson_matrix(np.ascontiguousarray(arr))
+            return pd.DataFrame(corr, index=numeric_df.columns, columns=numeric_df.columns)
+    return numeric_df.corr()
+
+def _value_counts_frame(series: pd.Series, name: str) -> pd.DataFrame:
+    """Equivalent of series.value_counts().reset_index(), counted over integer codes"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # value_counts keeps unused categories of a categorical with zero counts
+        codes = series.cat.codes.to_numpy()
+        uniques = pd.Categorical.from_codes(np.arange(len(series.cat.categories)), dtype=series.dtype)
+    else:
+        codes, uniques = pd.factorize(series)  # missing values get code -1
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    # Stable sort keeps tied values in first-seen order
+    order = np.argsort(-counts, kind='stable')
+    plot_data = pd.DataFrame({'value': uniques[order], 'count': counts[order]})
+    plot_data.columns = [name, 'count']
+    return plot_data
+
+def _dataset_cache_key(resolved_path: Path) -> str:
+    """Content-equivalent cache key for a data file without hashing its bytes"""
+    stat = resolved_path.stat()
+    return hashlib.sha256(f"{resolved_path}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()
+
+def _json_default(obj: Any) -> Any:
+    """JSON fallback for the numpy scalars and dtypes found in an analysis"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+class _AnalysisCache:
+    """Process-wide LRU of dataset analyses, persisted to disk at exit
+    
+    Entries are held as JSON text, so every get() decodes a private copy and
+    the file on disk is plain data that is never executed when loaded.
+    """
+    
+    def __init__(self, path: Path, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+    
+    def _load(self):
+        """Restore analyses persisted by a previous run; called with the lock held"""
+        self._loaded = True
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            if isinstance(entries, dict):
+                self._entries.update(
+                    (key, json.dumps(analysis)) for key, analysis in list(entries.items())[-self.max_entries:]
+                    if isinstance(analysis, dict)
+                )
+        except Exception:
+            pass
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            encoded = self._entries.get(key)
+            if encoded is None:
+                return None
+            self._entries.move_to_end(key)
+        return json.loads(encoded)
+    
+    def put(self, key: str, analysis: Dict[str, Any]):
+        try:
+            encoded = json.dumps(analysis, default=_json_default)
+        except (TypeError, ValueError):
+            return  # e.g. non-string column labels that JSON keys cannot hold
+        with self._lock:
+            self._entries[key] = encoded
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+    
+    def save(self):
+        """Write the cache atomically if it changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix('.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({key: json.loads(encoded) for key, encoded in self._entries.items()}, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except Exception as e:
+                print(f"Warning: Could not save analysis cache: {e}")
+
+# Shared by every engine so sessions neither pin themselves via atexit nor
+# overwrite each other's analyses on disk
+_analysis_cache = _AnalysisCache(ANALYSIS_CACHE_PATH, ANALYSIS_CACHE_SIZE)
+atexit.register(_analysis_cache.save)
+
+@lru_cache(maxsize=512)
+def _detect_encoding_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """Detect a file's encoding; mtime and size key the cache to the file's contents"""
+    file_path = Path(path_str)
+    try:
+        # Sample the first 10KB, or 4KB for small files
+        sample_size = 4096 if size < 65536 else 10000
+        with open(file_path, 'rb') as f:
+            raw_data = f.read(sample_size)
+        
+        # A BOM identifies the encoding outright
+        if raw_data.startswith(b'\xef\xbb\xbf'):
+            return 'utf-8-sig'
+        if raw_data.startswith((b'\xff\xfe', b'\xfe\xff')):
+            return 'utf-16'
+        # Pure ASCII decodes identically as UTF-8
+        if raw_data.isascii():
+            return 'utf-8'
+        
+        result = chardet.detect(raw_data)
+        encoding = result.get('encoding', 'utf-8')
+        confidence = result.get('confidence') or 0.0
+        
+        # Fallback to common Windows encodings if confidence is low
+        if confidence < 0.7:
+            for fallback in ['utf-8', 'cp1252', 'iso-8859-1']:
+                try:
+                    with open(file_path, 'r', encoding=fallback) as test_file:
+                        test_file.read(1000)
+                    return fallback
+                except UnicodeDecodeError:
+                    continue
+        
+        return encoding or 'utf-8'
+    except Exception:
+        return 'utf-8'
+
 class WindowsDataLoader:
     """Handles Windows-specific data loading with encoding detection"""
     
     @staticmethod
     def detect_encoding(file_path: Path) -> str:
         """Detect file encoding using chardet for Windows compatibility"""
+        file_path = Path(file_path)
         try:
-            with open(file_path, 'rb') as f:
-                raw_data = f.read(10000)  # Sample first 10KB
-                result = chardet.detect(raw_data)
-                encoding = result.get('encoding', 'utf-8')
-                confidence = result.get('confidence', 0.0)
-                
-                # Fallback to common Windows encodings if confidence is low
-                if confidence < 0.7:
-                    for fallback in ['utf-8', 'cp1252', 'iso-8859-1']:
-                        try:
-                            with open(file_path, 'r', encoding=fallback) as test_file:
-                                test_file.read(1000)
-                            return fallback
-                        except UnicodeDecodeError:
-                            continue
-                
-                return encoding or 'utf-8'
-        except Exception:
+            stat = file_path.stat()
+        except OSError:
             return 'utf-8'
+        return _detect_encoding_cached(str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
     
     @staticmethod
     def load_csv_with_windows_handling(file_path: Path) -> pd.DataFrame:
@@ -100,6 +299,11 @@ class WindowsDataLoader:
 class VisualizationIntentParser:
     """Parses natural language requests to understand visualization intent"""
     
+    _DOUBLE_QUOTED_RE = re.compile(r'"([^"]*)"')
+    _SINGLE_QUOTED_RE = re.compile(r"'([^']*)'")
+    _CAPITALIZED_RE = re.compile(r'\b[A-Z][a-zA-Z_]+\b')
+    _WHERE_RE = re.compile(r'where\s+(\w+)\s*(=|>|<|>=|<=)\s*([^\s]+)')
+    
     def __init__(self):
         # Chart type keywords mapping
         self.chart_keywords = {
@@ -125,22 +329,57 @@ class VisualizationIntentParser:
         
         # Grouping keywords
         self.grouping_keywords = ['by', 'group by', 'per', 'for each', 'broken down by']
+        self._grouping_res = [
+            (keyword, re.compile(re.escape(keyword) + r'\s+(\w+)'))
+            for keyword in self.grouping_keywords
+        ]
+        
+        self._build_keyword_matcher()
+    
+    def _build_keyword_matcher(self):
+        """Build one matcher that finds every keyword phrase in a single pass"""
+        keywords = {kw for kws in self.chart_keywords.values() for kw in kws}
+        keywords.update(kw for kws in self.aggregation_keywords.values() for kw in kws)
+        keywords.update(self.grouping_keywords)
+        keywords = sorted(keywords, key=len, reverse=True)
+        
+        if AHOCORASICK_AVAILABLE:
+            self._matcher = ahocorasick.Automaton()
+            for keyword in keywords:
+                self._matcher.add_word(keyword, keyword)
+            self._matcher.make_automaton()
+        else:
+            # A lookahead alternation reports the longest keyword at each position;
+            # any other keyword found there is a substring of it
+            alternation = '|'.join(map(re.escape, keywords))
+            self._matcher = re.compile(f'(?=({alternation}))')
+            self._contained = {kw: [other for other in keywords if other in kw] for kw in keywords}
+    
+    def _scan(self, request: str) -> set:
+        """Return every keyword phrase that occurs in the lowercased request"""
+        if AHOCORASICK_AVAILABLE:
+            return {keyword for _, keyword in self._matcher.iter(request)}
+        found = set()
+        for match in self._matcher.finditer(request):
+            found.update(self._contained[match.group(1)])
+        return found
     
     def parse_visualization_request(self, request: str) -> Dict[str, Any]:
         """Parse natural language visualization request"""
         request_lower = request.lower()
+        found = self._scan(request_lower)
         
         # Detect chart type
-        chart_type = self._detect_chart_type(request_lower)
+        chart_type = self._detect_chart_type(found)
         
         # Detect aggregation
-        aggregation = self._detect_aggregation(request_lower)
+        aggregation = self._detect_aggregation(found)
         
         # Extract column names (simplified - looks for capitalized words or quoted strings)
         columns = self._extract_potential_columns(request)
         
         # Detect grouping
-        grouping = self._detect_grouping(request_lower)
+        grouping = self._detect_grouping(request_lower, found)
         
         # Extract filters
         filters = self._extract_filters(request_lower)
@@ -154,53 +393,46 @@ class VisualizationIntentParser:
             'original_request': request
         }
     
-    def _detect_chart_type(self, request: str) -> str:
-        """Detect the intended chart type from request"""
+    def _detect_chart_type(self, found: set) -> str:
+        """Detect the intended chart type from the matched keywords"""
         scores = {}
         
         for chart_type, keywords in self.chart_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in request)
+            score = sum(1 for keyword in keywords if keyword in found)
             if score > 0:
                 scores[chart_type] = score
         
         if scores:
             return max(scores.items(), key=lambda x: x[1])[0]
         
-        # Default chart type based on common patterns
-        if any(word in request for word in ['over time', 'trend', 'timeline']):
-            return 'line'
-        elif any(word in request for word in ['vs', 'versus', 'relationship']):
-            return 'scatter'
-        elif any(word in request for word in ['count', 'frequency', 'how many']):
-            return 'bar'
-        else:
-            return 'bar'  # Default
+        # The line/scatter pattern words are chart keywords themselves, so
+        # with no scores the remaining default is a bar chart
+        return 'bar'
     
-    def _detect_aggregation(self, request: str) -> str:
-        """Detect aggregation function"""
+    def _detect_aggregation(self, found: set) -> str:
+        """Detect aggregation function from the matched keywords"""
         for agg_func, keywords in self.aggregation_keywords.items():
-            if any(keyword in request for keyword in keywords):
+            if any(keyword in found for keyword in keywords):
                 return agg_func
         return 'count'  # Default
     
     def _extract_potential_columns(self, request: str) -> List[str]:
         """Extract potential column names from request"""
         # Look for quoted strings
-        quoted_matches = re.findall(r'"([^"]*)"', request)
-        quoted_matches.extend(re.findall(r"'([^']*)'", request))
+        quoted_matches = self._DOUBLE_QUOTED_RE.findall(request)
+        quoted_matches.extend(self._SINGLE_QUOTED_RE.findall(request))
         
         # Look for capitalized words (potential column names)
-        capitalized_matches = re.findall(r'\b[A-Z][a-zA-Z_]+\b', request)
+        capitalized_matches = self._CAPITALIZED_RE.findall(request)
         
         return quoted_matches + capitalized_matches
     
-    def _detect_grouping(self, request: str) -> Optional[str]:
+    def _detect_grouping(self, request: str, found: set) -> Optional[str]:
         """Detect if grouping is requested"""
-        for keyword in self.grouping_keywords:
-            if keyword in request:
+        for keyword, pattern in self._grouping_res:
+            if keyword in found:
                 # Try to find what comes after the grouping keyword
-                pattern = keyword + r'\s+(\w+)'
-                match = re.search(pattern, request)
+                match = pattern.search(request)
                 if match:
                     return match.group(1)
         return None
@@ -210,8 +442,7 @@ class VisualizationIntentParser:
         filters = {}
         
         # Look for "where" clauses
-        where_pattern = r'where\s+(\w+)\s*(=|>|<|>=|<=)\s*([^\s]+)'
-        matches = re.findall(where_pattern, request)
+        matches = self._WHERE_RE.findall(request)
         
         for column, operator, value in matches:
             filters[column] = {'operator': operator, 'value': value}
@@ -239,23 +470,27 @@ class DataStructureAnalyzer:
         }
         
         # Analyze column types
-        for col in df.columns:
-            if pd.api.types.is_numeric_dtype(df[col]):
-                analysis['numeric_columns'].append(col)
-            elif pd.api.types.is_datetime64_any_dtype(df[col]):
-                analysis['datetime_columns'].append(col)
-            else:
-                analysis['categorical_columns'].append(col)
+        # select_dtypes' "number" also matches timedelta while is_numeric_dtype
+        # does not, and bools count as numeric - keep the old per-column rules
+        analysis['numeric_columns'] = df.select_dtypes(
+            include=['number', 'bool', 'boolean'], exclude=['timedelta']
+        ).columns.tolist()
+        analysis['datetime_columns'] = df.select_dtypes(
+            include=['datetime64', 'datetimetz']
+        ).columns.tolist()
+        bucketed = set(analysis['numeric_columns']).union(analysis['datetime_columns'])
+        analysis['categorical_columns'] = [col for col in df.columns if col not in bucketed]
         
         # Data quality analysis
         analysis['data_quality'] = {
             'null_counts': df.isnull().sum().to_dict(),
             'duplicate_rows': df.duplicated().sum(),
-            'memory_usage': df.memory_usage(deep=True).sum()
+            # Shallow size; call deep_memory_usage() when string sizes matter
+            'memory_usage': df.memory_usage(deep=False).sum()
         }
         
         # Suggest appropriate charts
-        analysis['suggested_charts'] = self._suggest_charts(analysis)
+        analysis['suggested_charts'] = self._suggest_charts(analysis, df)
         
         # Use LLM for additional insights if available
         if self.ollama_client:
@@ -264,7 +499,36 @@ class DataStructureAnalyzer:
         
         return analysis
     
-    def _suggest_charts(self, analysis: Dict) -> List[Dict]:
+    @staticmethod
+    def deep_memory_usage(df: pd.DataFrame, sample_size: int = 1000) -> int:
+        """Estimate deep memory usage, sampling object columns instead of sizing every string"""
+        n_rows = len(df)
+        if n_rows <= sample_size:
+            return int(df.memory_usage(deep=True).sum())
+        
+        total = int(df.memory_usage(deep=False).sum())
+        step = n_rows // sample_size
+        for i, dtype in enumerate(df.dtypes):
+            if dtype == object:
+                column = df.iloc[:, i]
+                sample = column.iloc[::step]
+                deep = sample.memory_usage(deep=True, index=False) * n_rows / len(sample)
+                total += int(deep) - column.memory_usage(deep=False, index=False)
+        return total
+    
+    @staticmethod
+    def _top_scatter_pairs(df: Optional[pd.DataFrame], numeric_cols: List[str]) -> List[Tuple[str, str]]:
+        """Numeric column pairs with the strongest absolute correlation"""
+        if df is not None:
+            try:
+                corr = _correlation_matrix(df[numeric_cols]).abs()
+                upper = np.triu(np.ones(corr.shape, dtype=bool), k=1)
+                return corr.where(upper).stack().nlargest(SCATTER_SUGGESTION_LIMIT).index.tolist()
+            except Exception:
+                pass  # e.g. duplicate column names; fall back to the first pairs
+        return list(islice(combinations(numeric_cols, 2), SCATTER_SUGGESTION_LIMIT))
+    
+    def _suggest_charts(self, analysis: Dict, df: Optional[pd.DataFrame] = None) -> List[Dict]:
         """Suggest appropriate chart types based on data structure"""
         suggestions = []
         
@@ -293,16 +557,15 @@ class DataStructureAnalyzer:
                 'priority': 'medium'
             })
             
-            # Scatter plots for pairs of numeric columns
-            for i, col1 in enumerate(numeric_cols):
-                for col2 in numeric_cols[i+1:]:
-                    suggestions.append({
-                        'type': 'scatter',
-                        'x': col1,
-                        'y': col2,
-                        'title': f'{col1} vs {col2}',
-                        'priority': 'medium'
-                    })
+            # Scatter plots for the most correlated pairs, not all k*(k-1)/2 of them
+            for col1, col2 in self._top_scatter_pairs(df, numeric_cols):
+                suggestions.append({
+                    'type': 'scatter',
+                    'x': col1,
+                    'y': col2,
+                    'title': f'{col1} vs {col2}',
+                    'priority': 'medium'
+                })
         
         # Distribution charts
         for col in numeric_cols:
@@ -407,32 +670,27 @@ class PlotlyChartGenerator:
     
     def _apply_filters(self, df: pd.DataFrame, filters: Dict) -> pd.DataFrame:
         """Apply filters to DataFrame"""
-        filtered_df = df.copy()
+        # Combine every filter into one row mask and index the frame once
+        mask = np.ones(len(df), dtype=bool)
         
         for column, filter_config in filters.items():
-            if column in filtered_df.columns:
-                operator = filter_config['operator']
+            if column in df.columns:
+                compare = _COMPARISON_OPS.get(filter_config['operator'])
+                if compare is None:
+                    continue
                 value = filter_config['value']
                 
                 try:
+                    series = df[column]
                     # Convert value to appropriate type
-                    if pd.api.types.is_numeric_dtype(filtered_df[column]):
+                    if pd.api.types.is_numeric_dtype(series):
                         value = float(value)
                     
-                    if operator == '=':
-                        filtered_df = filtered_df[filtered_df[column] == value]
-                    elif operator == '>':
-                        filtered_df = filtered_df[filtered_df[column] > value]
-                    elif operator == '<':
-                        filtered_df = filtered_df[filtered_df[column] < value]
-                    elif operator == '>=':
-                        filtered_df = filtered_df[filtered_df[column] >= value]
-                    elif operator == '<=':
-                        filtered_df = filtered_df[filtered_df[column] <= value]
+                    mask &= compare(series, value).to_numpy(dtype=bool, na_value=False)
                 except Exception:
                     continue  # Skip invalid filters
         
-        return filtered_df
+        return df if mask.all() else df[mask]
     
     def _create_bar_chart(self, df: pd.DataFrame, config: Dict, intent: Dict) -> go.Figure:
         """Create interactive bar chart"""
@@ -442,8 +700,7 @@ class PlotlyChartGenerator:
         # Handle aggregation
         if y_col == 'count' or intent.get('aggregation') == 'count':
             # Count occurrences
-            plot_data = df[x_col].value_counts().reset_index()
-            plot_data.columns = [x_col, 'count']
+            plot_data = _value_counts_frame(df[x_col], x_col)
             y_col = 'count'
         elif intent.get('aggregation') and intent['aggregation'] != 'count':
             # Apply aggregation
@@ -514,8 +771,7 @@ class PlotlyChartGenerator:
         
         # Count occurrences if using same column for names and values
         if values_col == names_col:
-            plot_data = df[names_col].value_counts().reset_index()
-            plot_data.columns = [names_col, 'count']
+            plot_data = _value_counts_frame(df[names_col], names_col)
             values_col = 'count'
         else:
             plot_data = df
@@ -537,7 +793,7 @@ class PlotlyChartGenerator:
             raise ValueError("No numeric columns found for heatmap")
         
         # Calculate correlation matrix
-        corr_matrix = numeric_df.corr()
+        corr_matrix = _correlation_matrix(numeric_df)
         
         fig = px.imshow(
             corr_matrix,
@@ -649,7 +905,19 @@ class DataVisualizationEngine:
         self.intent_parser = VisualizationIntentParser()
         self.structure_analyzer = DataStructureAnalyzer(ollama_client)
         self.chart_generator = PlotlyChartGenerator()
-        self.loaded_datasets = {}  # Cache for loaded data
+        # Loaded datasets keyed by resolved path, as (file cache key, result)
+        self.loaded_datasets: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    
+    def _analyze_cached(self, cache_key: str, df: pd.DataFrame, file_name: str) -> Dict[str, Any]:
+        """Analyze a dataset unless this exact file version was analyzed before"""
+        # LLM insights are only present when an Ollama client is configured
+        mode = 'llm' if self.structure_analyzer.ollama_client else 'basic'
+        cache_key = f"{cache_key}:{mode}"
+        analysis = _analysis_cache.get(cache_key)
+        if analysis is None or analysis.get('file_name') != file_name:
+            analysis = self.structure_analyzer.analyze_dataframe_structure(df, file_name)
+            _analysis_cache.put(cache_key, analysis)
+        return analysis
     
     def process_visualization_request(self, request: str) -> Dict[str, Any]:
         """Process a natural language visualization request"""
@@ -744,18 +1012,20 @@ class DataVisualizationEngine:
         try:
             path = Path(file_path)
             
-            # Check cache first
-            cache_key = str(path.resolve())
-            if cache_key in self.loaded_datasets:
-                return self.loaded_datasets[cache_key]
-            
             if not path.exists():
                 return {'success': False, 'error': f'File not found: {file_path}'}
             
+            # Check cache first; an edited file replaces its stale entry
+            resolved = path.resolve()
+            cache_key = _dataset_cache_key(resolved)
+            cached = self.loaded_datasets.get(str(resolved))
+            if cached is not None and cached[0] == cache_key:
+                return cached[1]
+            
             # Load based on file type
             if path.suffix.lower() == '.csv':
                 df = self.data_loader.load_csv_with_windows_handling(path)
-                analysis = self.structure_analyzer.analyze_dataframe_structure(df, path.name)
+                analysis = self._analyze_cached(cache_key, df, path.name)
             elif path.suffix.lower() in ['.xlsx', '.xls']:
                 sheets = self.data_loader.load_excel_with_windows_handling(path)
                 if not sheets:
@@ -764,7 +1034,7 @@ class DataVisualizationEngine:
                 # Use the first sheet or largest sheet
                 sheet_name = max(sheets.keys(), key=lambda k: sheets[k].shape[0])
                 df = sheets[sheet_name]
-                analysis = self.structure_analyzer.analyze_dataframe_structure(df, f"{path.name}[{sheet_name}]")
+                analysis = self._analyze_cached(cache_key, df, f"{path.name}[{sheet_name}]")
             else:
                 return {'success': False, 'error': f'Unsupported file type: {path.suffix}'}
             
@@ -776,7 +1046,7 @@ class DataVisualizationEngine:
             }
             
             # Cache the result
-            self.loaded_datasets[cache_key] = result
+            self.loaded_datasets[str(resolved)] = (cache_key, result)
             
             return result
             
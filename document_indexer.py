@@ -616,7 +616,8 @@ class QdrantIndexer:
     """Qdrant vector database indexer with Windows optimizations"""
     
     def __init__(self, host: str = "localhost", port: int = 6333, 
-                 collection_name: str = "documents"):
+                 collection_name: str = "documents", prefer_grpc: bool = False,
+                 grpc_port: int = 6334, timeout: Optional[int] = None):
         self.host = host
         self.port = port
         self.collection_name = collection_name
@@ -624,7 +625,8 @@ class QdrantIndexer:
         
         # Initialize Qdrant client
         try:
-            self.client = QdrantClient(host=host, port=port)
+            self.client = QdrantClient(host=host, port=port, prefer_grpc=prefer_grpc,
+                                       grpc_port=grpc_port, timeout=timeout)
             self.logger.info(f"Connected to Qdrant at {host}:{port}")
         except Exception as e:
             self.logger.error(f"Failed to connect to Qdrant: {e}")
@@ -654,6 +656,9 @@ class QdrantIndexer:
                     vectors_config=VectorParams(
                         size=self.vector_size,
                         distance=Distance.COSINE
+                    ),
+                    quantization_config=models.BinaryQuantization(
+                        binary=models.BinaryQuantizationConfig(always_ram=True)
                     )
                 )
                 self.logger.info(f"Created collection: {self.collection_name}")
@@ -796,18 +801,22 @@ class QdrantIndexer:
         return {'successful': successful, 'failed': failed}
     
     def search_similar(self, query_text: str, limit: int = 10, 
-                      score_threshold: float = 0.7) -> List[Dict[str, Any]]:
+                      score_threshold: float = 0.7,
+                      query_vector: Optional[List[float]] = None,
+                      search_params: Optional[models.SearchParams] = None) -> List[Dict[str, Any]]:
         """Search for similar document chunks"""
         try:
-            # Generate query embedding
-            query_embedding = self.model.encode([query_text])[0]
+            # Generate query embedding unless the caller already has one
+            if query_vector is None:
+                query_vector = self.model.encode([query_text])[0].tolist()
             
             # Search in Qdrant
             search_result = self.client.search(
                 collection_name=self.collection_name,
-                query_vector=query_embedding.tolist(),
+                query_vector=query_vector,
                 limit=limit,
-                score_threshold=score_threshold
+                score_threshold=score_threshold,
+                search_params=search_params
             )
             
             results = []
@@ -855,7 +864,10 @@ class DocumentIndexingSystem:
                  qdrant_port: int = 6333,
                  collection_name: str = "documents",
                  chunk_size: int = 800,
-                 chunk_overlap: int = 100):
+                 chunk_overlap: int = 100,
+                 prefer_grpc: bool = False,
+                 grpc_port: int = 6334,
+                 timeout: Optional[int] = None):
         
         self.logger = WindowsLogger(name="document_indexing_system")
         
@@ -865,7 +877,10 @@ class DocumentIndexingSystem:
         self.indexer = QdrantIndexer(
             host=qdrant_host, 
             port=qdrant_port, 
-            collection_name=collection_name
+            collection_name=collection_name,
+            prefer_grpc=prefer_grpc,
+            grpc_port=grpc_port,
+            timeout=timeout
         )
         
         self.logger.info("Document indexing system initialized")
@@ -1035,9 +1050,12 @@ class DocumentIndexingSystem:
         
         return files
     
-    def search(self, query: str, limit: int = 10, score_threshold: float = 0.7) -> List[Dict[str, Any]]:
+    def search(self, query: str, limit: int = 10, score_threshold: float = 0.7,
+               query_vector: Optional[List[float]] = None,
+               search_params: Optional[models.SearchParams] = None) -> List[Dict[str, Any]]:
         """Search indexed documents"""
-        return self.indexer.search_similar(query, limit, score_threshold)
+        return self.indexer.search_similar(query, limit, score_threshold,
+                                           query_vector=query_vector, search_params=search_params)
     
     def get_system_status(self) -> Dict[str, Any]:
         """Get system status and statistics"""
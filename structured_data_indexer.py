@@ -21,6 +21,7 @@ import numpy as np
 from sentence_transformers import SentenceTransformer
 from qdrant_client import QdrantClient
 from qdrant_client.models import VectorParams, Distance, PointStruct, Filter, FieldCondition, MatchValue
+from qdrant_client.http import models
 
 # File monitoring
 try:
@@ -570,14 +571,16 @@ class StructuredDataProcessor:
 class MultiCollectionQdrantIndexer:
     """Qdrant indexer with support for multiple collections by data type"""
     
-    def __init__(self, host: str = "localhost", port: int = 6333):
+    def __init__(self, host: str = "localhost", port: int = 6333, prefer_grpc: bool = False,
+                 grpc_port: int = 6334, timeout: Optional[int] = None):
         self.host = host
         self.port = port
         self.logger = WindowsLogger(name="multi_collection_indexer")
         
         # Initialize Qdrant client
         try:
-            self.client = QdrantClient(host=host, port=port)
+            self.client = QdrantClient(host=host, port=port, prefer_grpc=prefer_grpc,
+                                       grpc_port=grpc_port, timeout=timeout)
             self.logger.info(f"Connected to Qdrant at {host}:{port}")
         except Exception as e:
             self.logger.error(f"Failed to connect to Qdrant: {e}")
@@ -616,6 +619,9 @@ class MultiCollectionQdrantIndexer:
                         vectors_config=VectorParams(
                             size=self.vector_size,
                             distance=Distance.COSINE
+                        ),
+                        quantization_config=models.BinaryQuantization(
+                            binary=models.BinaryQuantizationConfig(always_ram=True)
                         )
                     )
                     self.logger.info(f"Created collection: {collection_name}")
@@ -696,6 +702,34 @@ class MultiCollectionQdrantIndexer:
         }
         return mapping.get(content_type, 'documents')
     
+    def search_collection(self, collection: str, query: str, limit: int = 5,
+                          score_threshold: float = 0.6,
+                          query_vector: Optional[List[float]] = None,
+                          search_params: Optional[models.SearchParams] = None) -> List[Dict[str, Any]]:
+        """Search a single collection, reusing a precomputed query vector when given"""
+        if query_vector is None:
+            query_vector = self.model.encode([query])[0].tolist()
+        
+        search_result = self.client.search(
+            collection_name=collection,
+            query_vector=query_vector,
+            limit=limit,
+            score_threshold=score_threshold,
+            search_params=search_params
+        )
+        
+        return [
+            {
+                'id': hit.id,
+                'score': hit.score,
+                'text': hit.payload.get('text', ''),
+                'content_type': hit.payload.get('content_type', ''),
+                'collection': collection,
+                'metadata': hit.payload
+            }
+            for hit in search_result
+        ]
+    
     def search_across_collections(self, query: str, collections: List[str] = None, 
                                 limit_per_collection: int = 5) -> Dict[str, List[Dict[str, Any]]]:
         """Search across multiple collections"""
@@ -0,0 +1,115 @@
+"""
+Tests for MIDAS constants and configuration helpers
+Checks the frozen/lazy structures against the plain tables they replaced
+"""
+
+import json
+import pickle
+import re
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+
+# Add current directory to path
+sys.path.append(str(Path(__file__).parent))
+
+import constants_config
+
+# CHUNKING_STRATEGIES as plain dicts, before ChunkStrategy
+BASELINE_CHUNKING_STRATEGIES = {
+    'semantic': {'chunk_size': 500, 'overlap': 100, 'sentence_boundary': True},
+    'fixed': {'chunk_size': 1000, 'overlap': 200, 'sentence_boundary': False},
+    'adaptive': {'min_chunk_size': 200, 'max_chunk_size': 800, 'overlap': 150, 'content_aware': True}
+}
+
+
+def test_chunk_strategies_match_baseline_dicts():
+    """Every key of the old dicts reads the same value from ChunkStrategy"""
+    strategies = constants_config.CHUNKING_STRATEGIES
+    assert set(strategies) == set(BASELINE_CHUNKING_STRATEGIES)
+    for name, expected in BASELINE_CHUNKING_STRATEGIES.items():
+        for key, value in expected.items():
+            assert strategies[name][key] == value, (name, key)
+            assert getattr(strategies[name], key) == value, (name, key)
+
+
+def test_content_keywords_load_lazily_and_consistently():
+    """The lazy table is built once and shared by module and config access"""
+    keywords = constants_config.CONTENT_KEYWORDS
+    assert keywords is constants_config.CONTENT_KEYWORDS
+    assert keywords is constants_config.get_config().CONTENT_KEYWORDS
+    assert all(isinstance(words, (list, tuple)) and words for words in keywords.values())
+
+
+def test_chunk_strategies_behave_like_the_old_dicts():
+    """Missing keys raise KeyError and support get() and `in`, as the dicts did"""
+    strategies = constants_config.CHUNKING_STRATEGIES
+    for name, expected in BASELINE_CHUNKING_STRATEGIES.items():
+        strategy = strategies[name]
+        for key in ['chunk_size', 'overlap', 'min_chunk_size', 'max_chunk_size', 'bogus', 0]:
+            assert (key in strategy) == (key in expected), (name, key)
+            assert strategy.get(key, 'missing') == expected.get(key, 'missing'), (name, key)
+            if key not in expected:
+                try:
+                    strategy[key]
+                    raise AssertionError((name, key))
+                except KeyError:
+                    pass
+
+
+def _reference_categories(text: str) -> set:
+    """Categories with a whole-word keyword match, checked one keyword at a time"""
+    lowered = text.lower()
+    return {
+        category for category, words in constants_config.CONTENT_KEYWORDS.items()
+        if any(re.search(rf"\b{re.escape(word.lower())}\b", lowered) for word in words)
+    }
+
+
+def test_match_categories_matches_per_keyword_search():
+    """One-pass matching finds the same categories as searching each keyword"""
+    if not constants_config.FEATURE_FLAGS['ENABLE_AUTO_TAGGING']:
+        return
+    samples = [
+        "Quarterly budget review of the API deployment policy",
+        "Patient diagnosis notes; employee onboarding handbook",
+        "Access control and encryption for the audit database",
+        "The codebase's systematic costs",  # partial words must not match
+        "RESEARCH STUDY: Revenue-analysis",
+        "",
+        "nothing relevant here"
+    ]
+    every_keyword = " ".join(word for words in constants_config.CONTENT_KEYWORDS.values() for word in words)
+    for text in samples + [every_keyword]:
+        assert constants_config.match_categories(text) == _reference_categories(text), text
+
+
+def test_frozen_tables_stay_serializable():
+    """Only the top level is read-only; tables still pickle and nested values are plain"""
+    tables = ['FILE_EXTENSIONS', 'CHUNKING_STRATEGIES', 'LOG_LEVELS', 'SECURITY_CLASSIFICATIONS',
+              'FEATURE_FLAGS', 'VALIDATION_RULES', 'RATE_LIMITS', 'ERROR_CODES']
+    config = constants_config.get_config()
+    for name in tables:
+        table = getattr(constants_config, name)
+        assert pickle.loads(pickle.dumps(table)) == table, name
+        assert pickle.loads(pickle.dumps(getattr(config, name))) == table, name
+        if isinstance(table, Mapping):
+            assert not any(isinstance(value, MappingProxyType) for value in table.values()), name
+
+    assert isinstance(constants_config.VALIDATION_RULES['filename'], dict)
+    assert constants_config.VALIDATION_RULES['filename']['compiled'].search("LPT1.txt")
+    json.dumps(dict(constants_config.RATE_LIMITS))
+    json.dumps(dict(config.FEATURE_FLAGS))
+
+
+def main():
+    """Run the configuration tests"""
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+Tests for MIDAS Dashboard Chart Components
+Compares the optimized rendering paths with the original pandas behaviour
+"""
+
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add current directory to path
+sys.path.append(str(Path(__file__).parent))
+
+from dashboard_charts import ChartRenderer, InteractiveFilter, _lttb_indices
+
+
+def _baseline_metric(data: pd.DataFrame, value_column: str, aggregation: str,
+                     compare_column: str = None):
+    """(value, delta) as the original if/elif implementation computed them"""
+    if aggregation == 'sum':
+        value = data[value_column].sum()
+    elif aggregation == 'mean':
+        value = data[value_column].mean()
+    elif aggregation == 'count':
+        value = len(data)
+    elif aggregation == 'max':
+        value = data[value_column].max()
+    elif aggregation == 'min':
+        value = data[value_column].min()
+    else:
+        value = data[value_column].iloc[-1] if len(data) > 0 else 0
+
+    if compare_column and compare_column in data.columns:
+        if aggregation == 'sum':
+            compare_value = data[compare_column].sum()
+        elif aggregation == 'mean':
+            compare_value = data[compare_column].mean()
+        else:
+            compare_value = data[compare_column].iloc[0] if len(data) > 0 else 0
+        return value, value - compare_value
+    return value, 0
+
+
+def _rendered_metric(data: pd.DataFrame, value_column: str, aggregation: str,
+                     compare_column: str = None):
+    options = {'value_column': value_column, 'aggregation': aggregation}
+    if compare_column:
+        options['compare_column'] = compare_column
+    indicator = ChartRenderer().render_metric(data, {'title': "KPI", 'options': options}).data[0]
+    return indicator.value, indicator.value - indicator.delta.reference
+
+
+def _metric_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        'revenue': [120.5, np.nan, 98.0, 143.25, 110.0],
+        'target': [100.0, 105.0, np.nan, 130.0, 125.0],
+        'orders': pd.array([12, None, 9, 15, 11], dtype='Int64'),
+        'units': np.array([3, 5, 2, 8, 6], dtype=np.int64),
+        'legacy': np.array([10, 20, 30, 40, 50], dtype=object),
+        'amount': [Decimal('1.50'), Decimal('2.25'), Decimal('3.00'), Decimal('4.75'), Decimal('5.10')],
+        'region': ['North', 'South', 'East', 'West', 'North']
+    })
+
+
+def test_metric_matches_baseline_for_numeric_columns():
+    """Every aggregation gives the original value and delta on numeric data"""
+    data = _metric_frame()
+    for column in ['revenue', 'orders', 'units', 'legacy']:
+        for aggregation in ['sum', 'mean', 'count', 'max', 'min', 'last']:
+            for compare_column in [None, 'target']:
+                expected = _baseline_metric(data, column, aggregation, compare_column)
+                actual = _rendered_metric(data, column, aggregation, compare_column)
+                assert np.allclose(np.asarray(actual, dtype=float), np.asarray(expected, dtype=float)), \
+                    (column, aggregation, compare_column, actual, expected)
+
+
+def test_metric_count_and_last_accept_non_numeric_columns():
+    """count never converts the column; last reads the raw value"""
+    data = _metric_frame()
+    assert _rendered_metric(data, 'region', 'count') == (len(data), 0)
+    assert _rendered_metric(data, 'region', 'count', 'target') == (len(data), len(data) - 100.0)
+    assert _rendered_metric(data, 'amount', 'last') == (Decimal('5.10'), 0)
+
+
+def test_rendered_figures_are_independent_copies():
+    """Mutating a rendered figure does not leak into the next render"""
+    renderer = ChartRenderer()
+    data = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+    config = {'type': 'bar', 'title': "Bars", 'options': {'x_column': 'x', 'y_columns': ['y']}}
+
+    first = renderer.render_chart(config, data)
+    first.update_layout(title_text="Changed by caller")
+    first.add_trace(first.data[0])
+
+    second = renderer.render_chart(config, data)
+    assert second is not first
+    assert len(second.data) == 1
+    assert second.layout.title.text != "Changed by caller"
+
+
+def _baseline_chart_filters(data: pd.DataFrame, filters) -> pd.DataFrame:
+    """The original copy-and-slice filter loop of ChartRenderer"""
+    filtered_data = data.copy()
+    for filter_config in filters:
+        column = filter_config.get('column')
+        op_name = filter_config.get('operator', '=')
+        value = filter_config.get('value')
+        if column not in filtered_data.columns:
+            continue
+        series = filtered_data[column]
+        if op_name == '=':
+            filtered_data = filtered_data[series == value]
+        elif op_name == '!=':
+            filtered_data = filtered_data[series != value]
+        elif op_name == '>':
+            filtered_data = filtered_data[series > value]
+        elif op_name == '<':
+            filtered_data = filtered_data[series < value]
+        elif op_name == '>=':
+            filtered_data = filtered_data[series >= value]
+        elif op_name == '<=':
+            filtered_data = filtered_data[series <= value]
+        elif op_name == 'in':
+            filtered_data = filtered_data[series.isin(value)]
+        elif op_name == 'contains':
+            filtered_data = filtered_data[series.str.contains(value, na=False)]
+    return filtered_data
+
+
+def _filter_frame() -> pd.DataFrame:
+    rng = np.random.default_rng(2)
+    n = 400
+    data = pd.DataFrame({
+        'sales': rng.normal(100, 25, n),
+        'units': rng.integers(0, 20, n),
+        'region': rng.choice(['North', 'South', 'East', 'West'], n),
+        'segment': pd.Categorical(rng.choice(['SMB', 'Enterprise', 'Public'], n),
+                                  categories=['Public', 'SMB', 'Enterprise', 'Unused']),
+        'date': pd.date_range('2024-01-01', periods=n, freq='D').strftime('%Y-%m-%d')
+    })
+    data.loc[::17, 'sales'] = np.nan
+    data.loc[::23, 'region'] = None
+    return data
+
+
+def test_chart_filters_match_baseline():
+    """Combined-mask filtering keeps the same rows as the slice-per-filter loop"""
+    data = _filter_frame()
+    filter_sets = [
+        [],
+        [{'column': 'sales', 'operator': '>', 'value': 90}],
+        [{'column': 'sales', 'operator': '>=', 'value': 80}, {'column': 'units', 'operator': '<', 'value': 10}],
+        [{'column': 'region', 'operator': '!=', 'value': 'North'}],
+        [{'column': 'region', 'operator': 'in', 'value': ['East', 'West']}],
+        [{'column': 'segment', 'operator': 'in', 'value': ['SMB', 'Unused']}],
+        [{'column': 'region', 'operator': 'contains', 'value': 'th'}, {'column': 'units', 'operator': '=', 'value': 3}],
+        [{'column': 'missing', 'operator': '=', 'value': 1}, {'column': 'units', 'operator': '<=', 'value': 5}]
+    ]
+    renderer = ChartRenderer()
+    for filters in filter_sets:
+        expected = _baseline_chart_filters(data, filters)
+        pd.testing.assert_frame_equal(renderer._apply_filters(data, filters), expected)
+
+
+def test_interactive_filters_match_baseline():
+    """Interactive filters keep the original rows and option lists"""
+    data = _filter_frame()
+    interactive = InteractiveFilter()
+    interactive.register_filter('region', {'type': 'multiselect', 'column': 'region', 'default': ['North', 'East']})
+    interactive.register_filter('sales', {'type': 'range', 'column': 'sales', 'default': [70, 130]})
+    interactive.register_filter('units', {'type': 'range', 'column': 'units', 'default': [2, 15]})
+    interactive.register_filter('date', {'type': 'date_range', 'column': 'date',
+                                         'default': ['2024-02-01', '2024-09-30']})
+    interactive.register_filter('segment', {'type': 'select', 'column': 'segment', 'default': 'SMB'})
+
+    expected = data[
+        data['region'].isin(['North', 'East'])
+        & (data['sales'] >= 70) & (data['sales'] <= 130)
+        & (data['units'] >= 2) & (data['units'] <= 15)
+        & (pd.to_datetime(data['date']) >= '2024-02-01') & (pd.to_datetime(data['date']) <= '2024-09-30')
+        & (data['segment'] == 'SMB')
+    ]
+    assert interactive.apply_filters_to_data(data).index.equals(expected.index)
+
+    data['day'] = pd.to_datetime(data['date'])
+    for column in ['region', 'units', 'sales', 'segment', 'day']:
+        assert interactive.get_filter_options(data, column) == sorted(data[column].dropna().unique().tolist())
+
+
+def test_filter_caches_are_kept_per_frame():
+    """Switching between frames keeps both caches; a collected frame drops its entry"""
+    first = _filter_frame()
+    second = _filter_frame().iloc[::-1].reset_index(drop=True)
+    interactive = InteractiveFilter()
+    interactive.register_filter('date', {'type': 'date_range', 'column': 'date',
+                                         'default': ['2024-02-01', '2024-03-31']})
+
+    for _ in range(2):
+        for data in (first, second):
+            expected = data[(pd.to_datetime(data['date']) >= '2024-02-01')
+                            & (pd.to_datetime(data['date']) <= '2024-03-31')]
+            assert interactive.apply_filters_to_data(data).index.equals(expected.index)
+            assert interactive.get_filter_options(data, 'region') == sorted(data['region'].dropna().unique())
+    cached_dates = interactive._datetime_values(first, 'date')
+    interactive.apply_filters_to_data(second)
+    assert interactive._datetime_values(first, 'date') is cached_dates
+
+    del first, data
+    assert len(interactive._frame_caches) == 1
+
+
+def _reference_lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> list:
+    """Textbook Largest-Triangle-Three-Buckets, one bucket at a time"""
+    n = len(x)
+    every = (n - 2) / (n_out - 2)
+    selected, indices = 0, [0]
+    for bucket in range(n_out - 2):
+        start = int(np.floor(bucket * every)) + 1
+        end = int(np.floor((bucket + 1) * every)) + 1
+        next_end = min(int(np.floor((bucket + 2) * every)) + 1, n)
+        next_x, next_y = x[end:next_end].mean(), y[end:next_end].mean()
+        areas = np.abs((x[selected] - next_x) * (y[start:end] - y[selected])
+                       - (x[selected] - x[start:end]) * (next_y - y[selected]))
+        selected = start + int(np.argmax(areas))
+        indices.append(selected)
+    indices.append(n - 1)
+    return indices
+
+
+def test_lttb_matches_reference():
+    """Vectorized LTTB picks the same points as the reference algorithm"""
+    rng = np.random.default_rng(9)
+    for n, n_out in [(1000, 100), (10007, 500), (5000, 4999), (64, 3)]:
+        x = np.sort(rng.uniform(0, 1000, n))
+        y = rng.normal(size=n).cumsum()
+        assert _lttb_indices(x, y, n_out).tolist() == _reference_lttb(x, y, n_out), (n, n_out)
+    assert _lttb_indices(np.arange(10.0), np.arange(10.0), 20).tolist() == list(range(10))
+
+
+def main():
+    """Run the dashboard chart tests"""
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Tests for MIDAS Dashboard System persistence
+Checks that incremental chart edits behave like full dashboard saves
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("win32api")
+
+# Add current directory to path
+sys.path.append(str(Path(__file__).parent))
+
+from dashboard_system import DashboardManager, DashboardStorage
+
+POSITION = {'row': 0, 'col': 0, 'width': 4, 'height': 3}
+
+
+def _make_manager() -> DashboardManager:
+    """Dashboard manager backed by a fresh AppData directory"""
+    os.environ['APPDATA'] = tempfile.mkdtemp(prefix="midas_dashboards_")
+    return DashboardManager()
+
+
+def test_incremental_edits_match_full_saves():
+    """Chart edits through the manager store what load + save_dashboard would"""
+    manager = _make_manager()
+    storage = manager.storage
+    dashboard = manager.create_dashboard("Incremental", template_id='overview')
+    baseline = manager.create_dashboard("Baseline", template_id='overview')
+
+    def full_save(mutate):
+        config = storage.load_dashboard(baseline.id)
+        mutate(config)
+        assert storage.save_dashboard(config)
+
+    chart = manager.add_chart(dashboard.id, 'bar', "Sales", dict(POSITION))
+    full_save(lambda c: c.charts.append(replace(chart, position=dict(POSITION))))
+
+    updates = {'title': "Sales by region", 'options': {'stacked': True}}
+    assert manager.update_chart(dashboard.id, chart.id, updates)
+    full_save(lambda c: c.charts.__setitem__(-1, replace(c.charts[-1], **updates)))
+
+    assert manager.remove_chart(dashboard.id, storage.load_dashboard(dashboard.id).charts[0].id)
+    full_save(lambda c: c.charts.pop(0))
+
+    # Template charts get fresh ids per dashboard, so compare everything else
+    state = lambda config: [(c.type, c.title, c.position, c.options) for c in config.charts]
+    assert state(storage.load_dashboard(dashboard.id)) == state(storage.load_dashboard(baseline.id))
+
+    # Every edit bumps the version and leaves a snapshot, as save_dashboard does
+    assert storage.get_dashboard_version(dashboard.id) == storage.get_dashboard_version(baseline.id) == 4
+    assert len(storage.get_dashboard_versions(dashboard.id)) == 3
+
+    # Versions recorded as chart deltas restore to the same state as full snapshots
+    for version in (3, 1, 2):
+        assert storage.restore_dashboard_version(dashboard.id, version)
+        assert storage.restore_dashboard_version(baseline.id, version)
+        assert state(storage.load_dashboard(dashboard.id)) == state(storage.load_dashboard(baseline.id))
+
+
+def test_external_save_is_not_reverted_by_chart_edit():
+    """A save made outside the manager survives the manager's next chart edit"""
+    manager = _make_manager()
+    dashboard = manager.create_dashboard("A")
+    chart = manager.add_chart(dashboard.id, 'line', "Trend", dict(POSITION))
+
+    external = manager.storage.load_dashboard(dashboard.id)
+    external.name = "Renamed"
+    external.theme = 'dark'
+    assert manager.storage.save_dashboard(external)
+
+    assert manager.update_chart(dashboard.id, chart.id, {'title': "Trend 2024"})
+
+    stored = manager.storage.load_dashboard(dashboard.id)
+    assert stored.name == "Renamed"
+    assert stored.theme == 'dark'
+    assert [c.title for c in stored.charts] == ["Trend 2024"]
+
+
+def test_chart_edit_after_restore_uses_restored_charts():
+    """Restoring a version is picked up by the manager's next chart edit"""
+    manager = _make_manager()
+    dashboard = manager.create_dashboard("Restore")
+    chart = manager.add_chart(dashboard.id, 'bar', "First", dict(POSITION))
+    manager.add_chart(dashboard.id, 'pie', "Second", dict(POSITION))
+
+    # Version 1 was snapshotted right after the first chart was added
+    assert manager.storage.restore_dashboard_version(dashboard.id, 1)
+    assert manager.update_chart(dashboard.id, chart.id, {'title': "First (edited)"})
+
+    stored = manager.storage.load_dashboard(dashboard.id)
+    assert [c.title for c in stored.charts] == ["First (edited)"]
+
+
+def test_stale_version_is_rejected():
+    """An incremental save against an outdated version writes nothing"""
+    manager = _make_manager()
+    dashboard = manager.create_dashboard("Stale")
+    chart = manager.add_chart(dashboard.id, 'bar', "Bars", dict(POSITION))
+    version = manager.storage.get_dashboard_version(dashboard.id)
+
+    config = manager.storage.load_dashboard(dashboard.id)
+    config.charts[0].title = "Lost update"
+    assert not manager.storage.save_dashboard_incremental(config, chart.id, "update", version - 1)
+    assert manager.storage.load_dashboard(dashboard.id).charts[0].title == "Bars"
+
+
+def test_legacy_database_is_migrated():
+    """Dashboards saved with charts embedded in the config blob load unchanged"""
+    app_data = tempfile.mkdtemp(prefix="midas_dashboards_")
+    db_dir = Path(app_data) / 'MIDAS' / 'Dashboards'
+    db_dir.mkdir(parents=True)
+
+    # Schema and rows as written before charts had their own table
+    legacy = {
+        'id': 'legacy-1', 'name': "Legacy", 'description': "Old layout",
+        'layout': {'type': 'grid', 'columns': 12}, 'theme': 'dark', 'filters': [],
+        'refresh_interval': 60, 'created_at': '2024-01-01T00:00:00',
+        'updated_at': '2024-01-02T00:00:00', 'version': 2, 'author': 'analyst',
+        'charts': [
+            {'id': 'c1', 'type': 'bar', 'title': "Revenue", 'data_source': {'type': 'static'},
+             'position': dict(POSITION), 'options': {'x_column': 'region'}, 'filters': []},
+            {'id': 'c2', 'type': 'line', 'title': "Trend", 'data_source': {},
+             'position': {'row': 3, 'col': 0, 'width': 12, 'height': 4}, 'options': {}, 'filters': []}
+        ]
+    }
+    older = dict(legacy, charts=legacy['charts'][:1])
+    conn = sqlite3.connect(db_dir / 'dashboards.db')
+    conn.executescript("""
+        CREATE TABLE dashboards (
+            id TEXT PRIMARY KEY, name TEXT NOT NULL, description TEXT, config TEXT NOT NULL,
+            theme TEXT, author TEXT, created_at TEXT, updated_at TEXT,
+            version INTEGER DEFAULT 1, is_template BOOLEAN DEFAULT 0
+        );
+        CREATE TABLE dashboard_versions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, dashboard_id TEXT NOT NULL,
+            version INTEGER NOT NULL, config TEXT NOT NULL, created_at TEXT,
+            author TEXT, change_description TEXT
+        );
+    """)
+    conn.execute("INSERT INTO dashboards (id, name, description, config, theme, author, created_at, updated_at, version)"
+                 " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                 ('legacy-1', "Legacy", "Old layout", json.dumps(legacy), 'dark', 'analyst',
+                  legacy['created_at'], legacy['updated_at'], 2))
+    conn.execute("INSERT INTO dashboard_versions (dashboard_id, version, config, created_at, author, change_description)"
+                 " VALUES (?, ?, ?, ?, ?, ?)",
+                 ('legacy-1', 1, json.dumps(older), legacy['created_at'], 'analyst', "Dashboard updated"))
+    conn.commit()
+    conn.close()
+
+    os.environ['APPDATA'] = app_data
+    storage = DashboardStorage()
+    loaded = storage.load_dashboard('legacy-1')
+    assert {name: getattr(loaded, name) for name in legacy if name != 'charts'} == \
+        {name: value for name, value in legacy.items() if name != 'charts'}
+    assert [chart.__dict__ for chart in loaded.charts] == legacy['charts']
+
+    # Old uncompressed snapshots still restore after the migration
+    assert storage.restore_dashboard_version('legacy-1', 1)
+    assert [chart.id for chart in storage.load_dashboard('legacy-1').charts] == ['c1']
+
+    # Opening the migrated database again is a no-op
+    assert [chart.id for chart in DashboardStorage().load_dashboard('legacy-1').charts] == ['c1']
+
+
+def main():
+    """Run the dashboard system tests"""
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
+
+
+if __name__ == "__main__":
+    main()
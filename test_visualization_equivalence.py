@@ -0,0 +1,126 @@
+"""
+Equivalence tests for MIDAS Data Visualization Engine fast paths
+Checks the optimized helpers against the pandas operations they replace
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add current directory to path
+sys.path.append(str(Path(__file__).parent))
+
+from data_visualization_engine import (
+    DataStructureAnalyzer, _AnalysisCache, _correlation_matrix, _value_counts_frame
+)
+
+
+def _assert_same_corr(df: pd.DataFrame):
+    expected = df.corr()
+    actual = _correlation_matrix(df)
+    assert list(actual.index) == list(expected.index)
+    assert list(actual.columns) == list(expected.columns)
+    assert np.allclose(actual.to_numpy(), expected.to_numpy(), atol=1e-12, equal_nan=True), (actual, expected)
+
+
+def test_correlation_matches_pandas():
+    """Complete numeric data gives the same matrix as DataFrame.corr()"""
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame(rng.normal(size=(500, 6)), columns=list('abcdef'))
+    df['g'] = df['a'] * 3 + 1
+    df['h'] = -df['b']
+    df['count'] = rng.integers(0, 50, 500)
+    _assert_same_corr(df)
+
+
+def test_correlation_constant_columns_are_nan():
+    """Constant columns correlate to NaN even when their mean is not exact"""
+    rng = np.random.default_rng(11)
+    df = pd.DataFrame({
+        'x': rng.normal(size=300),
+        'tenth': np.full(300, 0.1),
+        'third': np.full(300, 1 / 3),
+        'zero': np.zeros(300),
+        'seven': np.full(300, 7, dtype=np.int64),
+        'y': rng.normal(size=300)
+    })
+    _assert_same_corr(df)
+    assert _correlation_matrix(df)[['tenth', 'third', 'zero', 'seven']].isna().all().all()
+
+
+def test_correlation_incomplete_data_matches_pandas():
+    """Missing and infinite values keep pandas' pairwise handling"""
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame(rng.normal(size=(200, 4)), columns=list('wxyz'))
+    df.iloc[5, 0] = np.nan
+    df.iloc[9, 2] = np.inf
+    df['n'] = pd.array(rng.integers(0, 9, 200), dtype='Int64')
+    df.loc[3, 'n'] = pd.NA
+    _assert_same_corr(df)
+    _assert_same_corr(df.iloc[:1])
+
+
+def _baseline_counts(series: pd.Series, name: str) -> pd.DataFrame:
+    """Counts the way the bar and pie charts originally built them"""
+    plot_data = series.value_counts().reset_index()
+    plot_data.columns = [name, 'count']
+    return plot_data
+
+
+def test_value_counts_match_pandas():
+    """Counts, labels and dtypes match value_counts().reset_index()"""
+    rng = np.random.default_rng(5)
+    cases = [
+        pd.Series(rng.choice(['North', 'South', 'East', 'West'], 400, p=[0.4, 0.3, 0.2, 0.1])),
+        pd.Series(['b', 'a', None, 'a', 'b', np.nan, 'a']),
+        pd.Series(rng.choice([1.5, np.nan, 2.5, 4.0], 100, p=[0.5, 0.1, 0.3, 0.1])),
+        pd.Series(pd.Categorical(['x', 'y', 'x', None], categories=['z', 'y', 'x'])),
+        pd.Series([True, False, True, True]),
+        pd.Series(pd.to_datetime(['2024-01-01', '2024-02-01', '2024-01-01'])),
+        pd.Series([], dtype=object)
+    ]
+    for series in cases:
+        expected = _baseline_counts(series, 'label')
+        actual = _value_counts_frame(series, 'label')
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_value_counts_ties_keep_first_seen_order():
+    """Tied counts are ordered by first appearance"""
+    series = pd.Series(['c', 'a', 'b', 'a', 'c', 'b'])
+    assert _value_counts_frame(series, 'label')['label'].tolist() == ['c', 'a', 'b']
+
+
+def test_analysis_cache_persists_plain_json_copies():
+    """Cached analyses survive a restart as JSON and callers get their own copy"""
+    data = pd.DataFrame({'units': np.arange(5), 'price': np.linspace(1, 2, 5), 'region': list('ababc')})
+    analysis = DataStructureAnalyzer().analyze_dataframe_structure(data, "sales.csv")
+    path = Path(tempfile.mkdtemp(prefix="midas_cache_")) / 'analyses.json'
+
+    cache = _AnalysisCache(path, 4)
+    cache.put('key', analysis)
+    first = cache.get('key')
+    first['numeric_columns'].append('mutated')
+    assert cache.get('key')['numeric_columns'] == analysis['numeric_columns']
+    cache.save()
+
+    restored = _AnalysisCache(path, 4).get('key')
+    assert restored == cache.get('key')
+    assert restored['shape'] == list(data.shape)
+    assert restored['data_quality']['duplicate_rows'] == 0
+    assert restored['suggested_charts'] == analysis['suggested_charts']
+
+
+def main():
+    """Run the visualization equivalence tests"""
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
+
+
+if __name__ == "__main__":
+    main()